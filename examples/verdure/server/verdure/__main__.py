@@ -16,16 +16,7 @@ import logging
 import os
 
 import click
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import AgentCapabilities, AgentCard, AgentSkill
-from a2ui_ext import a2uiExtension
-from agent import LandscapeAgent
-from agent_executor import LandscapeAgentExecutor
 from dotenv import load_dotenv
-from starlette.middleware.cors import CORSMiddleware
-from starlette.staticfiles import StaticFiles
 
 load_dotenv()
 
@@ -40,8 +31,14 @@ class MissingAPIKeyError(Exception):
 @click.command()
 @click.option("--host", default="localhost")
 @click.option("--port", default=10002, help="The port to bind to.")
-@click.option("--base-url", help="The public base URL for the agent card. Use when running on an Android emulator so you can override the default host with 10.0.2.2, for instance.")
-def main(host: str, port: int, base_url: str | None):
+@click.option("--base-url", envvar="A2UI_BASE_URL", help="The public base URL for the agent card. Use when running on an Android emulator so you can override the default host with 10.0.2.2, for instance.")
+@click.option(
+    "--workers",
+    default=1,
+    envvar="A2UI_WORKERS",
+    help="The number of server processes. More than one requires A2UI_SQLITE_PATH, so that they share conversations.",
+)
+def main(host: str, port: int, base_url: str | None, workers: int):
     """Runs the Verdure landscape design agent server."""
     try:
         # Check for API key only if Vertex AI is not configured
@@ -50,65 +47,33 @@ def main(host: str, port: int, base_url: str | None):
                 raise MissingAPIKeyError(
                     "GEMINI_API_KEY environment variable not set and GOOGLE_GENAI_USE_VERTEXAI is not TRUE."
                 )
-
-        hello_ext = a2uiExtension()
-        capabilities = AgentCapabilities(
-            streaming=True,
-            extensions=[
-                hello_ext.agent_extension(),
-            ],
-        )
-        skill = AgentSkill(
-            id="design_landscape",
-            name="Landscape Design Tool",
-            description="Helps users design a landscape by guiding them through preferences and options.",
-            tags=["landscape", "design", "garden"],
-            examples=["Design my backyard", "Start a new landscape project"],
-        )
+        if workers > 1 and not os.getenv("A2UI_SQLITE_PATH"):
+            # Each request of a conversation may go to a different worker.
+            raise ValueError(
+                f"--workers={workers} requires A2UI_SQLITE_PATH to be set."
+            )
 
         if base_url is None:
             base_url = f"http://{host}:{port}"
+        # Read by create_app, in this process and in the workers it starts.
+        os.environ["A2UI_BASE_URL"] = base_url
 
-        agent_card = AgentCard(
-            name="A2UIScape Design",
-            description="This agent helps you envision your dream landscape.",
-            url=base_url,  # <-- Use base_url here
-            version="1.0.0",
-            default_input_modes=LandscapeAgent.SUPPORTED_CONTENT_TYPES,
-            default_output_modes=LandscapeAgent.SUPPORTED_CONTENT_TYPES,
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        agent_executor = LandscapeAgentExecutor(base_url=base_url)
-
-        agent_executor = hello_ext.wrap_executor(agent_executor)
-
-        request_handler = DefaultRequestHandler(
-            agent_executor=agent_executor,
-            task_store=InMemoryTaskStore(),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
         import uvicorn
-
-        app = server.build()
-
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["http://localhost:5173"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-
-        import pathlib
-        current_dir = pathlib.Path(__file__).parent.resolve()
-        images_dir = current_dir / "images"
-        app.mount("/images", StaticFiles(directory=images_dir), name="images")
-
-        uvicorn.run(app, host=host, port=port)
+        from app import create_app
+
+        # Built here first, so that configuration errors are reported below
+        # instead of in each worker once uvicorn started.
+        app = create_app()
+        if workers == 1:
+            uvicorn.run(app, host=host, port=port)
+        else:
+            uvicorn.run(
+                "app:create_app",
+                factory=True,
+                host=host,
+                port=port,
+                workers=workers,
+            )
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
         exit(1)
@@ -0,0 +1,248 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file parses the A2UI part of an LLM response, repairing the formatting
+# mistakes LLMs commonly make instead of spending a retry on them:
+# - a missing `---a2ui_JSON---` delimiter before the JSON list
+# - missing, unclosed or duplicated code fences around the JSON
+# - doubled braces copied from the `{{ }}` escaping of the UI templates
+# - text after the JSON
+# - trailing commas
+# - a list truncated in the middle of a message
+# - a single message instead of a list
+# Repairs only touch the JSON syntax. The repaired messages must still pass schema
+# validation.
+
+import dataclasses
+import json
+import logging
+import re
+from typing import Any
+
+from a2ui_stream import A2UI_DELIMITER
+
+logger = logging.getLogger(__name__)
+
+_OPENING_FENCES = re.compile(r"^(\s*```[a-zA-Z]*)+")
+_CLOSING_FENCES = re.compile(r"(```\s*)+$")
+# The start of a JSON list of A2UI messages, when the delimiter is missing.
+_JSON_START = re.compile(r"```[a-zA-Z]*\s*[\[{]|\[\s*\{")
+
+
+@dataclasses.dataclass
+class RepairedResponse:
+    """The parsed A2UI part of an LLM response."""
+
+    # The conversational text before the JSON.
+    text: str
+    messages: list[Any]
+    # A description of each repair that was applied, empty if none was needed.
+    repairs: list[str]
+
+    @property
+    def content(self) -> str:
+        """The response in the format the LLM is asked to use."""
+        return f"{self.text}\n{A2UI_DELIMITER}\n{json.dumps(self.messages)}"
+
+
+@dataclasses.dataclass
+class _Scan:
+    # The index after the top-level JSON value, or None if it is not closed.
+    end: int | None = None
+    # The indexes after each complete element of a top-level list.
+    element_ends: list[int] = dataclasses.field(default_factory=list)
+    # The indexes of commas directly followed by `]` or `}`.
+    trailing_commas: list[int] = dataclasses.field(default_factory=list)
+    # Whether `{{` occurs outside of a string, which is never valid JSON.
+    doubled_braces: bool = False
+
+
+def _scan(text: str) -> _Scan:
+    """Scans the top-level JSON value at the start of `text`."""
+    scan = _Scan()
+    depth = 0
+    in_string = False
+    escape = False
+    last_comma = None
+    for pos, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char.isspace():
+            continue
+
+        if char in "]}" and last_comma is not None:
+            scan.trailing_commas.append(last_comma)
+        last_comma = pos if char == "," else None
+
+        if char == '"':
+            in_string = True
+        elif char in "[{":
+            if text.startswith("{{", pos):
+                scan.doubled_braces = True
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 1:
+                scan.element_ends.append(pos + 1)
+            elif depth == 0:
+                scan.end = pos + 1
+                return scan
+    return scan
+
+
+def _undouble_braces(text: str) -> str:
+    """Collapses each pair of doubled braces outside of JSON strings."""
+    out = []
+    in_string = False
+    escape = False
+    pos = 0
+    while pos < len(text):
+        char = text[pos]
+        out.append(char)
+        pos += 1
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{}" and pos < len(text) and text[pos] == char:
+            # Skip the second brace of the pair.
+            pos += 1
+    return "".join(out)
+
+
+def _split_response(content: str, repairs: list[str]) -> tuple[str, str]:
+    if A2UI_DELIMITER in content:
+        text, json_part = content.split(A2UI_DELIMITER, 1)
+        if A2UI_DELIMITER in json_part:
+            json_part = json_part.replace(A2UI_DELIMITER, "")
+            repairs.append("removed a repeated delimiter")
+        return text, json_part
+
+    match = _JSON_START.search(content)
+    if match is None:
+        raise ValueError(f"Delimiter '{A2UI_DELIMITER}' not found.")
+    repairs.append("added the missing delimiter")
+    return content[: match.start()], content[match.start() :]
+
+
+def _strip_code_fences(json_part: str, repairs: list[str]) -> str:
+    json_part = json_part.strip()
+    opening = _OPENING_FENCES.match(json_part)
+    opening_count = opening.group(0).count("```") if opening else 0
+    if opening:
+        json_part = json_part[opening.end() :].strip()
+
+    # A closing fence directly after the JSON. Fences followed by text are removed
+    # with the text.
+    closing = _CLOSING_FENCES.search(json_part)
+    closing_count = closing.group(0).count("```") if closing else 0
+    if closing:
+        json_part = json_part[: closing.start()].strip()
+
+    if opening_count > 1 or closing_count > 1:
+        repairs.append("removed duplicated code fences")
+    elif closing_count and not opening_count:
+        repairs.append("removed a stray closing code fence")
+    elif opening_count and not closing_count and _scan(json_part).end == len(json_part):
+        repairs.append("removed an unclosed code fence")
+    return json_part
+
+
+def repair_a2ui_response(content: str) -> RepairedResponse:
+    """
+    Parses the A2UI messages of an LLM response, repairing its JSON if needed.
+
+    Args:
+        content: The full LLM response: text, the delimiter, and a JSON list of
+            A2UI messages.
+
+    Returns:
+        The text and the parsed messages, with the repairs that were applied.
+
+    Raises:
+        ValueError: If there is no JSON part, or it cannot be repaired.
+        json.JSONDecodeError: If the repaired JSON still does not parse.
+    """
+    repairs = []
+    text, json_part = _split_response(content, repairs)
+    messages = repair_a2ui_json(json_part, repairs)
+    return RepairedResponse(text=text, messages=messages, repairs=repairs)
+
+
+def repair_a2ui_json(json_part: str, repairs: list[str] | None = None) -> list[Any]:
+    """
+    Parses a JSON list of A2UI messages, repairing it if needed.
+
+    Args:
+        json_part: The JSON, possibly in a code fence.
+        repairs: If given, a description of each repair is appended to it.
+
+    Returns:
+        The parsed messages.
+
+    Raises:
+        ValueError: If the JSON is empty or cannot be repaired.
+        json.JSONDecodeError: If the repaired JSON still does not parse.
+    """
+    repairs = [] if repairs is None else repairs
+    json_part = _strip_code_fences(json_part, repairs)
+    if not json_part:
+        raise ValueError("JSON part is empty.")
+    if json_part[0] not in "[{":
+        raise ValueError(f"JSON part does not start with a list: {json_part[:50]!r}")
+
+    scan = _scan(json_part)
+    if scan.doubled_braces:
+        # Every brace of a template copied with its escaping is doubled. Braces
+        # in string values, e.g. in text, are kept as they are.
+        json_part = _undouble_braces(json_part)
+        repairs.append("undoubled braces from the template escaping")
+        scan = _scan(json_part)
+
+    if scan.end is None:
+        if json_part[0] != "[" or not scan.element_ends:
+            raise ValueError("JSON part is truncated.")
+        json_part = json_part[: scan.element_ends[-1]] + "]"
+        repairs.append(
+            f"closed the truncated list after {len(scan.element_ends)} messages"
+        )
+        scan = _scan(json_part)
+    elif json_part[scan.end :].strip():
+        json_part = json_part[: scan.end]
+        repairs.append("removed text after the JSON")
+
+    if scan.trailing_commas:
+        for pos in reversed(scan.trailing_commas):
+            json_part = json_part[:pos] + json_part[pos + 1 :]
+        repairs.append(f"removed {len(scan.trailing_commas)} trailing comma(s)")
+
+    messages = json.loads(json_part)
+    if isinstance(messages, dict):
+        messages = [messages]
+        repairs.append("wrapped a single message in a list")
+
+    if repairs:
+        logger.info(f"--- a2ui_repair: Repaired the JSON: {'; '.join(repairs)} ---")
+    return messages
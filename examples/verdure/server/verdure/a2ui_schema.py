@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import hashlib
 import json
 
 # This file serves as the single source of truth for the A2UI Schema.
-# It is imported by agent.py (for validation) and prompt_builder.py (for prompting).
+# It is imported by a2ui_validator.py (for validation) and prompt_builder.py (for prompting).
 # The schema is dynamically built from the three constituent JSON schemas below.
 
 _SERVER_TO_CLIENT_JSON = r"""
@@ -1528,6 +1530,207 @@ def _build_unified_schema():
 
     _rewrite_refs(server_schema)
 
-    return json.dumps(server_schema, indent=2)
+    return server_schema
 
-A2UI_SCHEMA = _build_unified_schema()
+# The parsed unified schema, shared by every consumer that needs the object form
+# (e.g. the validator in a2ui_validator.py) so it is only built once per process.
+A2UI_SCHEMA_OBJECT = _build_unified_schema()
+
+A2UI_SCHEMA = json.dumps(A2UI_SCHEMA_OBJECT, indent=2)
+
+
+def schema_sha256(schema: dict) -> str:
+    """Returns a stable content hash of a schema object."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+A2UI_SCHEMA_SHA256 = schema_sha256(A2UI_SCHEMA_OBJECT)
+
+
+# --- Catalog subsets ---
+
+# Top-level keys of the unified schema that hold definitions rather than constraints.
+_DEFINITION_KEYS = ("$defs", "components", "functions", "theme")
+
+
+def _iter_refs(node):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_refs(item)
+
+
+def subset_schema(schema: dict, component_names) -> dict:
+    """
+    Builds a closed sub-schema that only allows the given catalog components.
+
+    `anyComponent` is narrowed to the given components, and only the `$defs` and
+    components that are still reachable from the message schema are kept.
+
+    Args:
+        schema: The unified schema, e.g. A2UI_SCHEMA_OBJECT. It is not modified.
+        component_names: The catalog components to keep, e.g. {"Text", "Column"}.
+
+    Returns:
+        A new schema object.
+
+    Raises:
+        ValueError: If a component is not in the catalog.
+    """
+    unknown = set(component_names) - set(schema["components"])
+    if unknown:
+        raise ValueError(
+            f"Unknown catalog components {sorted(unknown)}. "
+            f"Expected any of {sorted(schema['components'])}."
+        )
+
+    schema = copy.deepcopy(schema)
+    any_component = schema["$defs"]["anyComponent"]
+    any_component["oneOf"] = [
+        branch
+        for branch in any_component["oneOf"]
+        if branch["$ref"].rsplit("/", 1)[-1] in component_names
+    ]
+
+    # Follow $refs from the message schema to find what is still reachable.
+    root = {k: v for k, v in schema.items() if k not in _DEFINITION_KEYS}
+    reachable = set()
+    pending = list(_iter_refs(root))
+    while pending:
+        ref = pending.pop()
+        if ref in reachable:
+            continue
+        reachable.add(ref)
+        _, section, name = ref.split("/", 2)
+        pending.extend(_iter_refs(schema[section][name]))
+
+    subset = dict(root)
+    for section in ("$defs", "components"):
+        subset[section] = {
+            name: body
+            for name, body in schema[section].items()
+            if f"#/{section}/{name}" in reachable
+        }
+    return subset
+
+
+# --- Prompt rendering ---
+# The validators always use the full schema above. The helpers below only change
+# how the schema is *rendered* into the prompt, to spend fewer tokens on it.
+
+# Keywords whose value is a map of names to schemas, e.g. "properties". A
+# "description" key directly inside one of these maps is a property name, not an
+# annotation, so it must be kept.
+_SCHEMA_MAP_KEYWORDS = ("properties", "$defs", "components", "theme")
+_SCHEMA_KEYWORDS = (
+    "items",
+    "additionalProperties",
+    "unevaluatedProperties",
+    "not",
+    "if",
+    "then",
+    "else",
+    "parameters",
+)
+_SCHEMA_LIST_KEYWORDS = ("allOf", "anyOf", "oneOf", "functions")
+
+
+def _iter_subschemas(node, container=None, key=None):
+    """Yields (subschema, container, key) for every subschema below `node`."""
+    if not isinstance(node, dict):
+        return
+    yield node, container, key
+    for keyword in _SCHEMA_MAP_KEYWORDS:
+        if isinstance(node.get(keyword), dict):
+            for name, child in node[keyword].items():
+                yield from _iter_subschemas(child, node[keyword], name)
+    for keyword in _SCHEMA_KEYWORDS:
+        yield from _iter_subschemas(node.get(keyword), node, keyword)
+    for keyword in _SCHEMA_LIST_KEYWORDS:
+        if isinstance(node.get(keyword), list):
+            for index, child in enumerate(node[keyword]):
+                yield from _iter_subschemas(child, node[keyword], index)
+
+
+def _strip_descriptions(schema):
+    """Removes every "description" annotation, in place."""
+    for node, _, _ in list(_iter_subschemas(schema)):
+        node.pop("description", None)
+
+
+def _canonical(node) -> str:
+    return json.dumps(node, sort_keys=True, separators=(",", ":"))
+
+
+def _dedupe_subschemas(schema):
+    """
+    Replaces repeated subschemas with a `$ref` to a single shared definition, in
+    place. Subschemas identical to an existing `$defs` entry point at that entry;
+    other repeats are hoisted into new `SharedN` entries. A subschema is only
+    shared when that makes the rendered schema smaller.
+    """
+    defs = schema.setdefault("$defs", {})
+    shared_count = 0
+    while True:
+        occurrences = {}
+        for node, container, key in _iter_subschemas(schema):
+            if container is None or "$ref" in node and len(node) == 1:
+                continue
+            occurrences.setdefault(_canonical(node), []).append((container, key))
+
+        def_names = {_canonical(body): name for name, body in defs.items()}
+        best = None
+        for canonical, places in occurrences.items():
+            existing = def_names.get(canonical)
+            inline = [(c, k) for c, k in places if c is not defs]
+            name = existing or f"Shared{shared_count + 1}"
+            ref_size = len(_canonical({"$ref": f"#/$defs/{name}"}))
+            saving = len(inline) * (len(canonical) - ref_size)
+            if existing is None:
+                if len(inline) < 2:
+                    continue
+                saving -= len(canonical) + len(name) + 4
+            if inline and saving > 0 and (best is None or saving > best[0]):
+                best = (saving, canonical, name, existing, inline)
+
+        if best is None:
+            return
+        _, canonical, name, existing, inline = best
+        if existing is None:
+            defs[name] = json.loads(canonical)
+            shared_count += 1
+        for container, key in inline:
+            container[key] = {"$ref": f"#/$defs/{name}"}
+
+
+def render_schema(
+    schema: dict = A2UI_SCHEMA_OBJECT,
+    compact: bool = False,
+    strip_descriptions: bool = False,
+) -> str:
+    """
+    Renders a schema as text for the prompt.
+
+    Args:
+        schema: The schema to render. It is not modified.
+        compact: Minify the JSON and share repeated subschemas through `$defs`.
+        strip_descriptions: Drop every "description" annotation.
+
+    Returns:
+        The schema as a JSON string. With the defaults this is A2UI_SCHEMA.
+    """
+    if not compact and not strip_descriptions:
+        return json.dumps(schema, indent=2)
+    schema = copy.deepcopy(schema)
+    if strip_descriptions:
+        _strip_descriptions(schema)
+    if not compact:
+        return json.dumps(schema, indent=2)
+    _dedupe_subschemas(schema)
+    return json.dumps(schema, separators=(",", ":"))
@@ -0,0 +1,170 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file parses an LLM response incrementally, as its tokens stream in.
+# The response is conversational text, the A2UI_DELIMITER, then a JSON list of A2UI
+# messages. Each message is returned as soon as its closing brace arrives, so it can
+# be sent to the client while the rest of the list is still being generated.
+# Text-only responses are streamed through the same parser, as text only.
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Separates the conversational text from the A2UI JSON in an LLM response.
+A2UI_DELIMITER = "---a2ui_JSON---"
+
+
+def get_response_text(response: str) -> str:
+    """
+    Returns the conversational text of a complete UI response: the text before
+    the delimiter, or before the first code fence if the delimiter is missing.
+    """
+    index = response.find(A2UI_DELIMITER)
+    if index == -1:
+        index = response.find("```")
+    return response if index == -1 else response[:index]
+
+
+class A2uiStreamParser:
+    """
+    Incrementally extracts the A2UI messages of a streamed LLM response.
+
+    Feed it the response text chunk by chunk. The JSON part is scanned once, keeping
+    track of the nesting depth and of string literals, and every top-level element
+    of the list is parsed when it is complete.
+    """
+
+    def __init__(self, ui: bool = True):
+        """
+        Args:
+            ui: Whether the response is a UI response. Otherwise it is all text,
+                and no messages are returned.
+        """
+        self._ui = ui
+        self._buffer = ""
+        # Index in _buffer of the JSON part, once the delimiter has been seen.
+        self._json_start: int | None = None
+        # Scanner state over the JSON part.
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._element_start: int | None = None
+        # Set once no more messages will be returned: at the end of the list, or
+        # when the JSON part cannot be parsed incrementally. The full response is
+        # still parsed and validated once complete.
+        self.stopped = False
+        self.message_count = 0
+
+    @property
+    def json_started(self) -> bool:
+        """Whether the delimiter, and so the JSON part, has been received."""
+        return self._json_start is not None
+
+    @property
+    def text(self) -> str:
+        """
+        The conversational text received so far. In a UI response, the end of
+        the text is held back while it could be the start of the delimiter or of
+        the JSON, so it is a prefix of the `get_response_text` of the complete
+        response.
+        """
+        if not self._ui:
+            return self._buffer
+        if self._json_start is not None:
+            return self._buffer[: self._json_start - len(A2UI_DELIMITER)]
+        text = self._buffer
+        # Hold back what could be the start of the delimiter.
+        for length in range(len(A2UI_DELIMITER) - 1, 0, -1):
+            if text.endswith(A2UI_DELIMITER[:length]):
+                text = text[:-length]
+                break
+        # A code fence in the text means the JSON started without the delimiter.
+        fence = text.find("```")
+        if fence != -1:
+            return text[:fence]
+        return text.rstrip("`")
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """
+        Adds a chunk of the response.
+
+        Returns:
+            The A2UI messages completed by this chunk.
+        """
+        self._buffer += chunk
+        if not self._ui:
+            return []
+        if self._json_start is None:
+            index = self._buffer.find(A2UI_DELIMITER)
+            if index == -1:
+                return []
+            self._json_start = index + len(A2UI_DELIMITER)
+            self._pos = self._json_start
+        if self.stopped:
+            return []
+
+        messages = []
+        buffer = self._buffer
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if self._depth == 1 and char == "{":
+                    self._element_start = pos
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 1 and char == "}":
+                    message = self._parse_element(buffer[self._element_start : pos + 1])
+                    if message is None:
+                        return messages
+                    messages.append(message)
+                elif self._depth <= 0:
+                    # The end of the list. Anything after it is not streamed.
+                    self.stopped = True
+                    return messages
+            elif self._depth == 0 and not (char.isspace() or char in "`json"):
+                # Only a code fence may come before the list.
+                self.stop(f"unexpected {char!r} before the A2UI list")
+                return messages
+        self._pos = len(buffer)
+        return messages
+
+    def _parse_element(self, element: str) -> dict[str, Any] | None:
+        try:
+            message = json.loads(element)
+        except json.JSONDecodeError as e:
+            self.stop(f"message {self.message_count} is not valid JSON: {e}")
+            return None
+        self.message_count += 1
+        return message
+
+    def stop(self, reason: str) -> None:
+        """Stops returning messages, e.g. after one failed validation."""
+        logger.info(f"--- A2uiStreamParser: Stopped streaming, {reason} ---")
+        self.stopped = True
@@ -0,0 +1,364 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file owns the process-wide A2UI validators.
+# The validators are built once at import time from A2UI_SCHEMA and shared by every
+# LandscapeAgent, so validating a response only costs the walk over the instance.
+#
+# Three validation modes are available:
+# - "jsonschema": validates the response against the unified schema as-is. Every
+#   message is tried against each branch of the top-level `oneOf`, and every
+#   component against each branch of `anyComponent`.
+# - "discriminated": routes each message on its top-level key (e.g. `createSurface`)
+#   and each component on its `component` field (e.g. `Text`), and validates it
+#   against the single matching sub-schema. Errors point at the failing message or
+#   component instead of listing every `oneOf` branch that did not match.
+# - "compiled": runs a2ui_validator_compiled.py, plain Python generated from the
+#   schema by a2ui_validator_codegen.py. It accepts exactly what "jsonschema"
+#   accepts (see `python a2ui_validator_codegen.py --check`) and is much faster.
+#
+# Each mode can also be restricted to a subset of the catalog components (see
+# `subset_schema`). The "jsonschema" and "discriminated" validators are then built
+# from the smaller schema, so they have fewer `anyComponent` branches to try. The
+# compiled validator is generated from the full schema, so it rejects components
+# outside the subset with an extra check instead.
+
+import copy
+import functools
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import a2ui_validator_compiled
+import jsonschema
+from a2ui_schema import A2UI_SCHEMA_OBJECT, A2UI_SCHEMA_SHA256, subset_schema
+from referencing import Registry, Resource
+
+logger = logging.getLogger(__name__)
+
+
+def _build_registry(schema: dict[str, Any]) -> Registry:
+    """
+    Builds a crawled registry so every `$ref` in the schema is indexed up front.
+
+    Args:
+        schema: The unified A2UI schema for a single message.
+
+    Returns:
+        A registry containing the schema under its `$id`.
+    """
+    resource = Resource.from_contents(schema)
+    return Registry().with_resource(schema["$id"], resource).crawl()
+
+
+def _build_validator(schema: dict[str, Any]) -> jsonschema.protocols.Validator:
+    """
+    Builds the validator for a full LLM response.
+
+    The schema is checked once here instead of on every `jsonschema.validate`
+    call. The prompt instructs the LLM to return a *list* of messages, so the
+    validator checks an *array* of the single message schema.
+
+    Args:
+        schema: The unified A2UI schema for a single message.
+
+    Returns:
+        A validator instance that can be reused across requests.
+    """
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    response_schema = {
+        "$schema": schema["$schema"],
+        "type": "array",
+        "items": {"$ref": schema["$id"]},
+    }
+    return validator_cls(response_schema, registry=_build_registry(schema))
+
+
+def validate_a2ui_messages(instance: Any) -> None:
+    """
+    Validates a parsed LLM response (a list of A2UI messages).
+
+    Raises:
+        jsonschema.exceptions.ValidationError: With the same best-match error
+            `jsonschema.validate` would have reported.
+    """
+    error = jsonschema.exceptions.best_match(A2UI_VALIDATOR.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+class DiscriminatedValidator:
+    """Validates A2UI messages by dispatching on their discriminator fields."""
+
+    def __init__(self, schema: dict[str, Any]):
+        self._validator_cls = jsonschema.validators.validator_for(schema)
+        self._registry = _build_registry(schema)
+        self._schema_id = schema["$id"]
+
+        # Message type, e.g. "createSurface" -> validator for CreateSurfaceMessage.
+        # Components are validated separately, so the message validators only
+        # check that each entry of `components` is an object.
+        self.message_validators = {}
+        for branch in schema["oneOf"]:
+            def_name = branch["$ref"].rsplit("/", 1)[-1]
+            message_schema = copy.deepcopy(schema["$defs"][def_name])
+            message_type = next(
+                key for key in message_schema["required"] if key != "version"
+            )
+            _replace_ref(message_schema, "#/$defs/anyComponent", {"type": "object"})
+            message_schema["$schema"] = schema["$schema"]
+            self.message_validators[message_type] = self._validator_cls(
+                message_schema, registry=self._registry
+            )
+
+        # Component name, e.g. "Text" -> validator for #/components/Text.
+        any_component = schema["$defs"]["anyComponent"]
+        self.component_property = any_component["discriminator"]["propertyName"]
+        self.component_validators = {}
+        for branch in any_component["oneOf"]:
+            component_name = branch["$ref"].rsplit("/", 1)[-1]
+            self.component_validators[component_name] = self._sub_validator(
+                branch["$ref"]
+            )
+
+    def _sub_validator(self, ref: str) -> jsonschema.protocols.Validator:
+        return self._validator_cls(
+            {"$ref": f"{self._schema_id}{ref}"}, registry=self._registry
+        )
+
+    def iter_errors(self, instance: Any):
+        """Yields the validation errors of a full LLM response."""
+        if not isinstance(instance, list):
+            yield jsonschema.exceptions.ValidationError(
+                f"{instance!r} is not of type 'array'", instance=instance
+            )
+            return
+        for index, message in enumerate(instance):
+            for error in self.iter_message_errors(message):
+                error.path.appendleft(index)
+                yield error
+
+    def iter_message_errors(self, message: Any):
+        """Yields the validation errors of a single A2UI message."""
+        if not isinstance(message, dict):
+            yield jsonschema.exceptions.ValidationError(
+                f"{message!r} is not of type 'object'", instance=message
+            )
+            return
+
+        message_types = [key for key in message if key in self.message_validators]
+        if len(message_types) != 1:
+            yield jsonschema.exceptions.ValidationError(
+                f"A2UI message must have exactly one of "
+                f"{sorted(self.message_validators)}, found {sorted(message_types)}",
+                instance=message,
+            )
+            return
+
+        message_type = message_types[0]
+        yield from self.message_validators[message_type].iter_errors(message)
+
+        body = message[message_type]
+        components = body.get("components") if isinstance(body, dict) else None
+        if not isinstance(components, list):
+            return
+        for index, component in enumerate(components):
+            for error in self.iter_component_errors(component):
+                error.path.extendleft(reversed([message_type, "components", index]))
+                yield error
+
+    def iter_component_errors(self, component: Any):
+        """Yields the validation errors of a single catalog component."""
+        if not isinstance(component, dict):
+            # Already reported by the message validator.
+            return
+        component_name = component.get(self.component_property)
+        validator = self.component_validators.get(component_name)
+        if validator is None:
+            yield jsonschema.exceptions.ValidationError(
+                f"{component_name!r} is not a component in the catalog. "
+                f"Expected one of {sorted(self.component_validators)}",
+                path=[self.component_property],
+                instance=component,
+            )
+            return
+        yield from validator.iter_errors(component)
+
+
+def _replace_ref(obj: Any, ref: str, replacement: dict[str, Any]) -> None:
+    """Replaces, in place, every `{"$ref": ref}` below `obj` with `replacement`."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, dict) and value.get("$ref") == ref:
+                obj[key] = dict(replacement)
+            else:
+                _replace_ref(value, ref, replacement)
+    elif isinstance(obj, list):
+        for item in obj:
+            _replace_ref(item, ref, replacement)
+
+
+def _by_precision(error: jsonschema.exceptions.ValidationError) -> tuple:
+    # A component with an invalid property also fails `unevaluatedProperties`
+    # for every property, so prefer the deepest error that names the property.
+    return (error.validator != "unevaluatedProperties", len(error.path))
+
+
+def validate_a2ui_messages_discriminated(instance: Any) -> None:
+    """
+    Validates a parsed LLM response using discriminator-based dispatch.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: For the most precise error found,
+            with the path to the failing message, component or property.
+    """
+    error = jsonschema.exceptions.best_match(
+        A2UI_DISCRIMINATED_VALIDATOR.iter_errors(instance), key=_by_precision
+    )
+    if error is not None:
+        raise error
+
+
+VALIDATION_MODES: dict[str, Callable[[Any], None]] = {
+    "jsonschema": validate_a2ui_messages,
+    "discriminated": validate_a2ui_messages_discriminated,
+    "compiled": a2ui_validator_compiled.validate_a2ui_messages,
+}
+
+
+def _raise_best_match(errors, key=jsonschema.exceptions.relevance) -> None:
+    error = jsonschema.exceptions.best_match(errors, key=key)
+    if error is not None:
+        raise error
+
+
+def _check_components_allowed(instance: Any, components: frozenset[str]) -> None:
+    """
+    Rejects catalog components outside `components` in an already valid response.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: For the first such component.
+    """
+    for message_index, message in enumerate(instance):
+        body = message.get("updateComponents")
+        if body is None:
+            continue
+        for index, component in enumerate(body["components"]):
+            if component["component"] not in components:
+                raise jsonschema.exceptions.ValidationError(
+                    f"{component['component']!r} is not a component in the catalog. "
+                    f"Expected one of {sorted(components)}",
+                    path=[
+                        message_index,
+                        "updateComponents",
+                        "components",
+                        index,
+                        "component",
+                    ],
+                    instance=component,
+                )
+
+
+@functools.cache
+def _get_subset_validator(
+    mode: str, components: frozenset[str]
+) -> Callable[[Any], None]:
+    """Builds, once per mode and subset, a validator for a subset of the catalog."""
+    logger.info(
+        f"--- Building '{mode}' A2UI validator for components {sorted(components)} ---"
+    )
+    if mode == "jsonschema":
+        validator = _build_validator(subset_schema(A2UI_SCHEMA_OBJECT, components))
+        return lambda instance: _raise_best_match(validator.iter_errors(instance))
+    if mode == "discriminated":
+        validator = DiscriminatedValidator(subset_schema(A2UI_SCHEMA_OBJECT, components))
+        return lambda instance: _raise_best_match(
+            validator.iter_errors(instance), key=_by_precision
+        )
+
+    # Check that the components exist before accepting them at runtime.
+    subset_schema(A2UI_SCHEMA_OBJECT, components)
+    validate = VALIDATION_MODES[mode]
+
+    def validate_subset(instance: Any) -> None:
+        validate(instance)
+        _check_components_allowed(instance, components)
+
+    return validate_subset
+
+
+def find_invalid_messages(
+    validate: Callable[[Any], None], messages: list[Any]
+) -> dict[int, tuple[str, jsonschema.exceptions.ValidationError]]:
+    """
+    Validates each message of a response on its own.
+
+    Args:
+        validate: A validation function (see `get_a2ui_validator`).
+        messages: The parsed A2UI messages.
+
+    Returns:
+        For each invalid message, by index: the JSON path of its error in the
+        response, e.g. `$[3].updateComponents.components[2].text`, and the error.
+    """
+    errors = {}
+    for index, message in enumerate(messages):
+        try:
+            validate([message])
+        except jsonschema.exceptions.ValidationError as e:
+            # The path starts at the message's index in the single-message list.
+            path = [index, *list(e.absolute_path)[1:]]
+            json_path = "$" + "".join(
+                f"[{key}]" if isinstance(key, int) else f".{key}" for key in path
+            )
+            errors[index] = (json_path, e)
+    return errors
+
+
+def get_a2ui_validator(
+    mode: str, components: frozenset[str] | None = None
+) -> Callable[[Any], None]:
+    """
+    Returns the validation function for a validation mode.
+
+    Args:
+        mode: One of the keys of VALIDATION_MODES.
+        components: If set, only these catalog components are accepted.
+
+    Raises:
+        ValueError: If the mode or a component is unknown, or if the compiled
+            validator was generated from a different schema than the one in
+            a2ui_schema.py.
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"Unknown A2UI validation mode '{mode}'. "
+            f"Expected one of {sorted(VALIDATION_MODES)}."
+        )
+    is_stale = a2ui_validator_compiled.SCHEMA_SHA256 != A2UI_SCHEMA_SHA256
+    if mode == "compiled" and is_stale:
+        raise ValueError(
+            "a2ui_validator_compiled.py is out of date with a2ui_schema.py. "
+            "Regenerate it with: python a2ui_validator_codegen.py"
+        )
+    if components is not None:
+        return _get_subset_validator(mode, frozenset(components))
+    return VALIDATION_MODES[mode]
+
+
+A2UI_VALIDATOR = _build_validator(A2UI_SCHEMA_OBJECT)
+A2UI_DISCRIMINATED_VALIDATOR = DiscriminatedValidator(A2UI_SCHEMA_OBJECT)
+logger.info("A2UI validators built for modes: %s", ", ".join(VALIDATION_MODES))
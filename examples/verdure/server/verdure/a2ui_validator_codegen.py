@@ -0,0 +1,743 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Build step that compiles the unified A2UI schema into a plain-Python validation
+# module (a2ui_validator_compiled.py).
+#
+# Each schema node becomes one function made of straight-line type and field
+# checks, so validating a response does not go through a generic JSON Schema
+# interpreter. Only the keywords used by the A2UI schema are supported; the
+# compiler fails loudly on anything else instead of silently skipping it.
+#
+# Usage:
+#   python a2ui_validator_codegen.py          # regenerate a2ui_validator_compiled.py
+#   python a2ui_validator_codegen.py --check  # check it is up to date and that it
+#                                             # agrees with the jsonschema validator
+
+import copy
+import json
+import keyword
+import os
+import re
+import sys
+from typing import Any
+
+import click
+from a2ui_schema import A2UI_SCHEMA_OBJECT, schema_sha256
+
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "a2ui_validator_compiled.py")
+
+# Keywords that carry no validation semantics for this schema. `format` is only
+# an annotation because the jsonschema path does not enable a format checker.
+_ANNOTATION_KEYWORDS = {
+    "$schema",
+    "$id",
+    "title",
+    "description",
+    "default",
+    "format",
+    "discriminator",
+}
+
+_SUPPORTED_KEYWORDS = {
+    "$ref",
+    "type",
+    "const",
+    "enum",
+    "required",
+    "properties",
+    "additionalProperties",
+    "unevaluatedProperties",
+    "items",
+    "minItems",
+    "allOf",
+    "anyOf",
+    "oneOf",
+    "if",
+    "then",
+    "else",
+}
+
+# Nodes made only of these keywords are checked inline by their parent.
+_SCALAR_KEYWORDS = {"type", "const", "enum"} | _ANNOTATION_KEYWORDS
+
+# Schema locations that are not reachable from a message and are not compiled.
+_CATALOG_METADATA = {"components", "functions", "theme", "catalogId"}
+
+_TYPE_CHECKS = {
+    "object": "isinstance(value, dict)",
+    "array": "isinstance(value, list)",
+    "string": "isinstance(value, str)",
+    "boolean": "isinstance(value, bool)",
+    "number": "(isinstance(value, (int, float)) and not isinstance(value, bool))",
+    "integer": (
+        "((isinstance(value, int) and not isinstance(value, bool))"
+        " or (isinstance(value, float) and value.is_integer()))"
+    ),
+    "null": "value is None",
+}
+
+_HEADER = '''\
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# GENERATED FILE - DO NOT EDIT.
+# Compiled from the unified schema in a2ui_schema.py by a2ui_validator_codegen.py.
+# Regenerate with: python a2ui_validator_codegen.py
+#
+# Every check function returns None when the value is valid, or a tuple of
+# (error message, path to the failing value) otherwise.
+
+import jsonschema
+
+SCHEMA_SHA256 = {sha256!r}
+
+
+def _equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _one_of_error(value, errors):
+    # Report the error of the branch that got furthest into the value, if a single
+    # branch did; otherwise the value does not resemble any branch in particular.
+    deepest = max(errors, key=lambda error: len(error[1]))
+    if sum(len(error[1]) == len(deepest[1]) for error in errors) == 1:
+        return deepest
+    return f"{{value!r}} is not valid under any of the given schemas", []
+
+
+def _always_valid(value):
+    return None
+
+
+def _never_valid(value):
+    return f"False schema does not allow {{value!r}}", []
+
+
+def _evaluated_none(value):
+    return frozenset()
+'''
+
+_FOOTER = '''
+
+def validate_a2ui_messages(instance):
+    """
+    Validates a parsed LLM response (a list of A2UI messages).
+
+    Raises:
+        jsonschema.exceptions.ValidationError: For the first error found, with
+            the path to the failing value.
+    """
+    error = _response(instance)
+    if error is not None:
+        message, path = error
+        raise jsonschema.exceptions.ValidationError(message, path=path)
+'''
+
+
+def _types(schema: dict[str, Any]) -> list[str] | None:
+    types = schema.get("type")
+    return [types] if isinstance(types, str) else types
+
+
+class _Compiler:
+    """Compiles a JSON Schema (2020-12 subset) into Python check functions."""
+
+    def __init__(self, root: dict[str, Any]):
+        self._root = root
+        self._functions: dict[int, str] = {}
+        self._evaluated_functions: dict[tuple[int, bool], str] = {}
+        self._used_names: set[str] = set()
+        self._pending: list[tuple[str, Any, str]] = []
+        self._pending_evaluated: list[tuple[str, Any, str, bool]] = []
+        self._constants: list[str] = []
+        self._constant_names: dict[str, str] = {}
+        # Dispatch tables reference check functions, so they go after the code.
+        self._dispatch_tables: list[str] = []
+        self._code: list[str] = []
+
+    # --- Naming and references ---
+
+    def _unique_name(self, pointer: str, prefix: str = "") -> str:
+        base = re.sub(r"\W+", "_", pointer.lstrip("#/")).strip("_") or "root"
+        name = f"_{prefix}{base}"
+        if keyword.iskeyword(name):
+            name += "_"
+        candidate, counter = name, 2
+        while candidate in self._used_names:
+            candidate = f"{name}_{counter}"
+            counter += 1
+        self._used_names.add(candidate)
+        return candidate
+
+    def _resolve(self, ref: str) -> tuple[Any, str]:
+        if not ref.startswith("#"):
+            raise NotImplementedError(f"Only local $refs are supported, got '{ref}'.")
+        node = self._root
+        for part in ref[2:].split("/") if ref != "#" else []:
+            part = part.replace("~1", "/").replace("~0", "~")
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        return node, ref
+
+    def _constant(self, prefix: str, value: str) -> str:
+        if value not in self._constant_names:
+            name = f"_{prefix}_{len(self._constants)}"
+            self._constant_names[value] = name
+            self._constants.append(f"{name} = {value}")
+        return self._constant_names[value]
+
+    def function_for(self, schema: Any, pointer: str, name: str | None = None) -> str:
+        """Returns the name of the check function for a schema node."""
+        if name is None:
+            schema, pointer = self._target(schema, pointer)
+        if schema is True or (
+            isinstance(schema, dict) and set(schema) <= _ANNOTATION_KEYWORDS
+        ):
+            return "_always_valid"
+        if schema is False:
+            return "_never_valid"
+        if id(schema) not in self._functions:
+            self._functions[id(schema)] = name or self._unique_name(pointer)
+            self._pending.append((self._functions[id(schema)], schema, pointer))
+        return self._functions[id(schema)]
+
+    def evaluated_function_for(
+        self, schema: Any, pointer: str, own: bool = False
+    ) -> str:
+        """
+        Returns the name of the function listing the properties a node evaluates.
+
+        `own` is set for the node carrying `unevaluatedProperties` itself, whose
+        own keyword must not count as evaluating every property.
+        """
+        if not isinstance(schema, dict):
+            return "_evaluated_none"
+        key = (id(schema), own)
+        if key not in self._evaluated_functions:
+            prefix = "own_evaluated_" if own else "evaluated_"
+            name = self._unique_name(pointer, prefix=prefix)
+            self._evaluated_functions[key] = name
+            self._pending_evaluated.append((name, schema, pointer, own))
+        return self._evaluated_functions[key]
+
+    # --- Code generation ---
+
+    def compile(self, response_schema: dict[str, Any]) -> str:
+        self.function_for(response_schema, "#response", name="_response")
+        while self._pending or self._pending_evaluated:
+            if self._pending:
+                self._emit_check(*self._pending.pop(0))
+            else:
+                self._emit_evaluated(*self._pending_evaluated.pop(0))
+        return "\n".join(
+            [*self._constants, "", "", *self._code, *self._dispatch_tables]
+        )
+
+    def _emit_check(self, name: str, schema: dict[str, Any], pointer: str) -> None:
+        unknown = set(schema) - _SUPPORTED_KEYWORDS - _ANNOTATION_KEYWORDS
+        if pointer == "#":
+            unknown -= _CATALOG_METADATA | {"$defs"}
+        if unknown:
+            raise NotImplementedError(
+                f"Unsupported keywords {sorted(unknown)} at {pointer}."
+            )
+
+        body: list[str] = []
+        if "$ref" in schema:
+            body += self._check(*self._resolve(schema["$ref"]))
+
+        types = _types(schema)
+        body += self._scalar_checks(schema, "value", "[]")
+
+        object_body = self._object_checks(schema, pointer)
+        if object_body:
+            body += self._guarded(types, "object", "isinstance(value, dict)", object_body)
+
+        array_body = self._array_checks(schema, pointer)
+        if array_body:
+            body += self._guarded(types, "array", "isinstance(value, list)", array_body)
+
+        for index, sub in enumerate(schema.get("allOf", [])):
+            body += self._check(sub, f"{pointer}/allOf/{index}")
+
+        if "anyOf" in schema:
+            calls = [
+                f"{self.function_for(sub, f'{pointer}/anyOf/{i}')}(value) is not None"
+                for i, sub in enumerate(schema["anyOf"])
+            ]
+            body += [
+                "if " + " and ".join(calls) + ":",
+                '    return f"{value!r} is not valid under any of the given schemas", []',
+            ]
+
+        if "oneOf" in schema:
+            body += self._one_of(schema, pointer)
+
+        if "if" in schema:
+            condition = self.function_for(schema["if"], f"{pointer}/if")
+            then_ = self.function_for(schema.get("then", True), f"{pointer}/then")
+            else_ = self.function_for(schema.get("else", True), f"{pointer}/else")
+            body += [
+                f"error = {then_}(value) if {condition}(value) is None else {else_}(value)",
+                "if error is not None:",
+                "    return error",
+            ]
+
+        if schema.get("unevaluatedProperties", True) is not True:
+            if schema["unevaluatedProperties"] is not False:
+                raise NotImplementedError(
+                    f"Only 'unevaluatedProperties: false' is supported at {pointer}."
+                )
+            evaluated = self.evaluated_function_for(schema, pointer, own=True)
+            body += self._guarded(
+                types,
+                "object",
+                "isinstance(value, dict)",
+                [
+                    f"evaluated = {evaluated}(value)",
+                    "if evaluated is not None:",
+                    "    unexpected = [key for key in value if key not in evaluated]",
+                    "    if unexpected:",
+                    "        names = ', '.join(repr(key) for key in unexpected)",
+                    "        verb = 'was' if len(unexpected) == 1 else 'were'",
+                    '        return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []',
+                ],
+            )
+
+        self._code += [f"def {name}(value):", f"    # {pointer}"]
+        self._code += ["    " + line for line in body + ["return None"]]
+        self._code += ["", ""]
+
+    def _guarded(
+        self, types: list[str] | None, type_name: str, check: str, lines: list[str]
+    ) -> list[str]:
+        # Keywords for objects and arrays only apply to values of that type. When
+        # the node requires that single type, the type check above already returned.
+        if types == [type_name]:
+            return lines
+        return [f"if {check}:"] + ["    " + line for line in lines]
+
+    def _target(self, schema: Any, pointer: str) -> tuple[Any, str]:
+        """Follows nodes that only hold a `$ref` (and annotations) to their target."""
+        while isinstance(schema, dict) and "$ref" in schema and (
+            set(schema) - {"$ref"} <= _ANNOTATION_KEYWORDS
+        ):
+            schema, pointer = self._resolve(schema["$ref"])
+        return schema, pointer
+
+    def _check(self, schema: Any, pointer: str, key: str | None = None) -> list[str]:
+        """
+        Checks `value` against a schema node, or `item` with `key` prepended to
+        the error path. Scalar leaves are checked inline instead of with a call.
+        """
+        schema, pointer = self._target(schema, pointer)
+        if isinstance(schema, dict) and set(schema) <= _SCALAR_KEYWORDS:
+            if key is None:
+                return self._scalar_checks(schema, "value", "[]")
+            return self._scalar_checks(schema, "item", f"[{key}]")
+        return self._call(self.function_for(schema, pointer), key)
+
+    def _call(self, function: str, key: str | None = None) -> list[str]:
+        """Calls a check on `value`, or on `item` with `key` prepended to the path."""
+        if function == "_always_valid":
+            return []
+        if key is None:
+            return [
+                f"error = {function}(value)",
+                "if error is not None:",
+                "    return error",
+            ]
+        return [
+            f"error = {function}(item)",
+            "if error is not None:",
+            f"    return error[0], [{key}, *error[1]]",
+        ]
+
+    def _scalar_checks(self, schema: dict[str, Any], var: str, path: str) -> list[str]:
+        """Emits the `type`, `const` and `enum` checks of a node for variable `var`."""
+        lines: list[str] = []
+        types = _types(schema)
+        if types:
+            check = " or ".join(_TYPE_CHECKS[t] for t in types).replace("value", var)
+            expected = ", ".join(repr(t) for t in types)
+            lines += [
+                f"if not ({check}):",
+                f'    return f"{{{var}!r}} is not of type {expected}", {path}',
+            ]
+
+        if "const" in schema:
+            const = schema["const"]
+            if isinstance(const, str):
+                check = f"isinstance({var}, str) and {var} == {const!r}"
+            elif isinstance(const, bool):
+                check = f"{var} is {const!r}"
+            else:
+                check = f"_equal({var}, {const!r})"
+            lines += [
+                f"if not ({check}):",
+                f'    return {repr(repr(const) + " was expected")}, {path}',
+            ]
+
+        if "enum" in schema:
+            enum = schema["enum"]
+            if all(isinstance(item, str) for item in enum):
+                members = self._constant("ENUM", f"frozenset({sorted(enum)!r})")
+                check = f"isinstance({var}, str) and {var} in {members}"
+            else:
+                check = f"any(_equal({var}, item) for item in {enum!r})"
+            lines += [
+                f"if not ({check}):",
+                f'    return f"{{{var}!r}} is not one of {enum!r}", {path}',
+            ]
+        return lines
+
+    def _object_checks(self, schema: dict[str, Any], pointer: str) -> list[str]:
+        lines: list[str] = []
+        for required in schema.get("required", []):
+            lines += [
+                f"if {required!r} not in value:",
+                f'    return {repr(repr(required) + " is a required property")}, []',
+            ]
+
+        properties = schema.get("properties", {})
+        for key, sub in properties.items():
+            check = self._check(sub, f"{pointer}/properties/{key}", key=repr(key))
+            if not check:
+                continue
+            if key in schema.get("required", []):
+                # Presence was checked above.
+                lines += [f"item = value[{key!r}]", *check]
+            else:
+                lines += [f"if {key!r} in value:", f"    item = value[{key!r}]"]
+                lines += ["    " + line for line in check]
+
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            known = self._constant("KEYS", f"frozenset({sorted(properties)!r})")
+            if additional is False:
+                lines += [
+                    f"if not {known}.issuperset(value):",
+                    f"    unexpected = [key for key in value if key not in {known}]",
+                    "    names = ', '.join(repr(key) for key in unexpected)",
+                    "    verb = 'was' if len(unexpected) == 1 else 'were'",
+                    '    return f"Additional properties are not allowed ({names} {verb} unexpected)", []',
+                ]
+            else:
+                check = self._check(
+                    additional, f"{pointer}/additionalProperties", key="key"
+                )
+                lines += [
+                    "for key, item in value.items():",
+                    f"    if key not in {known}:",
+                ]
+                lines += ["        " + line for line in check]
+        return lines
+
+    def _array_checks(self, schema: dict[str, Any], pointer: str) -> list[str]:
+        lines: list[str] = []
+        if "minItems" in schema:
+            minimum = schema["minItems"]
+            message = "should be non-empty" if minimum == 1 else "is too short"
+            lines += [
+                f"if len(value) < {minimum}:",
+                f'    return f"{{value!r}} {message}", []',
+            ]
+        if "items" in schema:
+            check = self._check(schema["items"], f"{pointer}/items", key="index")
+            if check:
+                lines += ["for index, item in enumerate(value):"]
+                lines += ["    " + line for line in check]
+        return lines
+
+    def _one_of(self, schema: dict[str, Any], pointer: str) -> list[str]:
+        branches = [
+            self.function_for(sub, f"{pointer}/oneOf/{i}")
+            for i, sub in enumerate(schema["oneOf"])
+        ]
+        errors = ", ".join(f"{branch}(value)" for branch in branches)
+        lines = [
+            f"errors = ({errors},)",
+            "matched = errors.count(None)",
+            "if matched == 0:",
+            "    return _one_of_error(value, errors)",
+            "if matched > 1:",
+            '    return f"{value!r} is valid under more than one of the given schemas", []',
+        ]
+
+        # With a discriminator whose value selects exactly one branch (each branch
+        # pins it with a `const`), only that branch can match, so dispatch to it.
+        dispatch = self._discriminator_dispatch(schema, branches)
+        if dispatch:
+            property_name, table = dispatch
+            lines = [
+                f"tag = value.get({property_name!r}) if isinstance(value, dict) else None",
+                f"if isinstance(tag, str) and tag in {table}:",
+                f"    error = {table}[tag](value)",
+                "    if error is not None:",
+                "        return error",
+                "else:",
+                *["    " + line for line in lines],
+            ]
+        return lines
+
+    def _discriminator_dispatch(
+        self, schema: dict[str, Any], branches: list[str]
+    ) -> tuple[str, str] | None:
+        property_name = schema.get("discriminator", {}).get("propertyName")
+        if not property_name:
+            return None
+        table = {}
+        for sub, branch in zip(schema["oneOf"], branches):
+            const = self._pinned_const(sub, property_name)
+            if not isinstance(const, str) or const in table:
+                return None
+            table[const] = branch
+        entries = "".join(f"    {tag!r}: {branch},\n" for tag, branch in table.items())
+        name = f"_DISPATCH_{len(self._dispatch_tables)}"
+        self._dispatch_tables.append(f"{name} = {{\n{entries}}}\n")
+        return property_name, name
+
+    def _pinned_const(self, schema: Any, property_name: str, depth: int = 0) -> Any:
+        """Finds the `const` a schema requires for a property, following refs and allOf."""
+        if not isinstance(schema, dict) or depth > 8:
+            return None
+        if "$ref" in schema:
+            found = self._pinned_const(
+                self._resolve(schema["$ref"])[0], property_name, depth + 1
+            )
+            if found is not None:
+                return found
+        prop = schema.get("properties", {}).get(property_name)
+        if (
+            isinstance(prop, dict)
+            and "const" in prop
+            and property_name in schema.get("required", [])
+        ):
+            return prop["const"]
+        for sub in schema.get("allOf", []):
+            found = self._pinned_const(sub, property_name, depth + 1)
+            if found is not None:
+                return found
+        return None
+
+    # --- Evaluated properties (for unevaluatedProperties) ---
+
+    def _emit_evaluated(
+        self, name: str, schema: dict[str, Any], pointer: str, own: bool
+    ) -> None:
+        """
+        Emits a function returning the property names a node evaluates, assuming
+        the value is valid against it. It returns None when every property counts
+        as evaluated (e.g. because of `additionalProperties`).
+        """
+        if "if" in schema:
+            raise NotImplementedError(
+                f"'if' below 'unevaluatedProperties' is not supported at {pointer}."
+            )
+        if "additionalProperties" in schema or (
+            "unevaluatedProperties" in schema and not own
+        ):
+            self._code += [f"def {name}(value):", f"    # {pointer}", "    return None"]
+            self._code += ["", ""]
+            return
+
+        static = set(schema.get("properties", {}))
+        dynamic: list[str] = []
+        children = []
+        if "$ref" in schema:
+            children.append(self._resolve(schema["$ref"]))
+        children += [
+            (sub, f"{pointer}/allOf/{i}") for i, sub in enumerate(schema.get("allOf", []))
+        ]
+        for sub, sub_pointer in children:
+            dynamic.append(
+                f"keys = {self.evaluated_function_for(sub, sub_pointer)}(value)"
+            )
+        for keyword_name in ("anyOf", "oneOf"):
+            for i, sub in enumerate(schema.get(keyword_name, [])):
+                sub_pointer = f"{pointer}/{keyword_name}/{i}"
+                check = self.function_for(sub, sub_pointer)
+                evaluated = self.evaluated_function_for(sub, sub_pointer)
+                dynamic.append(
+                    f"keys = {evaluated}(value) if {check}(value) is None else frozenset()"
+                )
+
+        known = self._constant("KEYS", f"frozenset({sorted(static)!r})")
+        body = [f"evaluated = set({known})"]
+        for line in dynamic:
+            body += [line, "if keys is None:", "    return None", "evaluated |= keys"]
+        body += ["return evaluated"]
+        self._code += [f"def {name}(value):", f"    # {pointer}"]
+        self._code += ["    " + line for line in body]
+        self._code += ["", ""]
+
+
+def generate_module(schema: dict[str, Any] = A2UI_SCHEMA_OBJECT) -> str:
+    """
+    Generates the source of the compiled validation module.
+
+    Args:
+        schema: The unified A2UI schema for a single message.
+
+    Returns:
+        The Python source code of a2ui_validator_compiled.py.
+    """
+    compiler = _Compiler(schema)
+    compiler.function_for(schema, "#", name="_message")
+    code = compiler.compile({"type": "array", "items": schema})
+    return (
+        _HEADER.format(sha256=schema_sha256(schema))
+        + "\n\n"
+        + code.rstrip()
+        + "\n"
+        + _FOOTER
+    )
+
+
+def _mutations(value: Any):
+    """Yields single-edit variants of a parsed template for the parity check."""
+    if isinstance(value, dict):
+        for key in value:
+            mutated = copy.copy(value)
+            del mutated[key]
+            yield mutated
+            for replacement in (12345, "unexpected", None, [], {}, True):
+                mutated = copy.copy(value)
+                mutated[key] = replacement
+                yield mutated
+            for inner in _mutations(value[key]):
+                mutated = copy.copy(value)
+                mutated[key] = inner
+                yield mutated
+        mutated = copy.copy(value)
+        mutated["unexpectedProperty"] = "unexpected"
+        yield mutated
+    elif isinstance(value, list):
+        if value:
+            yield value[1:]
+        for index, item in enumerate(value):
+            for inner in _mutations(item):
+                mutated = list(value)
+                mutated[index] = inner
+                yield mutated
+
+
+def _split_components(message: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Splits an `updateComponents` message into one message per component, so each
+    mutation is validated on its own small message instead of the whole surface.
+    """
+    if "updateComponents" not in message:
+        return [message]
+    body = message["updateComponents"]
+    return [
+        {**message, "updateComponents": {**body, "components": [component]}}
+        for component in body["components"]
+    ]
+
+
+def check_parity(template_names: list[str] | None = None) -> list[str]:
+    """
+    Compares the compiled validator with the jsonschema validator over the
+    `ui_examples` templates and single-edit mutations of each of their messages.
+
+    Args:
+        template_names: The templates to check, or None for all of them.
+
+    Returns:
+        A description of every case where the two validators disagree.
+    """
+    import jsonschema
+    import a2ui_validator_compiled
+    from a2ui_validator import validate_a2ui_messages
+    from ui_examples import UI_TEMPLATES
+
+    def is_valid(validate, instance) -> bool:
+        try:
+            validate(instance)
+        except jsonschema.exceptions.ValidationError:
+            return False
+        return True
+
+    if template_names is None:
+        template_names = list(UI_TEMPLATES)
+    mismatches = []
+    cases = 0
+    for template_name in template_names:
+        template = UI_TEMPLATES[template_name]
+        for index, message in enumerate(template.render("http://localhost:10002")):
+            variants = [[message]]
+            for part in _split_components(message):
+                variants += [[mutated] for mutated in _mutations(part)]
+            for variant in variants:
+                cases += 1
+                expected = is_valid(validate_a2ui_messages, variant)
+                actual = is_valid(a2ui_validator_compiled.validate_a2ui_messages, variant)
+                if expected != actual:
+                    mismatches.append(
+                        f"{template_name}[{index}]: jsonschema={expected} "
+                        f"compiled={actual}: {json.dumps(variant)[:200]}"
+                    )
+    click.echo(f"Checked {cases} cases from {len(template_names)} templates.")
+    return mismatches
+
+
+@click.command()
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Check that the compiled module is up to date and agrees with jsonschema.",
+)
+def main(check: bool):
+    """Compiles the A2UI schema into a2ui_validator_compiled.py."""
+    source = generate_module()
+    if not check:
+        with open(OUTPUT_PATH, "w") as f:
+            f.write(source)
+        click.echo(f"Wrote {OUTPUT_PATH}")
+        return
+
+    with open(OUTPUT_PATH) as f:
+        if f.read() != source:
+            click.echo(
+                f"{OUTPUT_PATH} is out of date. Run: python a2ui_validator_codegen.py"
+            )
+            sys.exit(1)
+    mismatches = check_parity()
+    for mismatch in mismatches:
+        click.echo(mismatch)
+    if mismatches:
+        sys.exit(1)
+    click.echo("Compiled validator is up to date and matches jsonschema.")
+
+
+if __name__ == "__main__":
+    main()
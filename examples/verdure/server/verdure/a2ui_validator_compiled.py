@@ -0,0 +1,3084 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# GENERATED FILE - DO NOT EDIT.
+# Compiled from the unified schema in a2ui_schema.py by a2ui_validator_codegen.py.
+# Regenerate with: python a2ui_validator_codegen.py
+#
+# Every check function returns None when the value is valid, or a tuple of
+# (error message, path to the failing value) otherwise.
+
+import jsonschema
+
+SCHEMA_SHA256 = '7de9c9071ec62b2f7f87d37879a1a52e78ff9f652277d7f030a91263a83826f0'
+
+
+def _equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _one_of_error(value, errors):
+    # Report the error of the branch that got furthest into the value, if a single
+    # branch did; otherwise the value does not resemble any branch in particular.
+    deepest = max(errors, key=lambda error: len(error[1]))
+    if sum(len(error[1]) == len(deepest[1]) for error in errors) == 1:
+        return deepest
+    return f"{value!r} is not valid under any of the given schemas", []
+
+
+def _always_valid(value):
+    return None
+
+
+def _never_valid(value):
+    return f"False schema does not allow {value!r}", []
+
+
+def _evaluated_none(value):
+    return frozenset()
+
+
+_KEYS_0 = frozenset(['createSurface', 'version'])
+_KEYS_1 = frozenset(['updateComponents', 'version'])
+_KEYS_2 = frozenset(['updateDataModel', 'version'])
+_KEYS_3 = frozenset(['deleteSurface', 'version'])
+_KEYS_4 = frozenset(['catalogId', 'sendDataModel', 'surfaceId', 'theme'])
+_KEYS_5 = frozenset(['components', 'surfaceId'])
+_KEYS_6 = frozenset(['path', 'surfaceId', 'value'])
+_KEYS_7 = frozenset(['surfaceId'])
+_ENUM_8 = frozenset(['body', 'caption', 'h1', 'h2', 'h3', 'h4', 'h5'])
+_ENUM_9 = frozenset(['contain', 'cover', 'fill', 'none', 'scale-down'])
+_ENUM_10 = frozenset(['avatar', 'header', 'icon', 'largeFeature', 'mediumFeature', 'smallFeature'])
+_ENUM_11 = frozenset(['center', 'end', 'spaceAround', 'spaceBetween', 'spaceEvenly', 'start', 'stretch'])
+_ENUM_12 = frozenset(['center', 'end', 'start', 'stretch'])
+_ENUM_13 = frozenset(['horizontal', 'vertical'])
+_ENUM_14 = frozenset(['borderless', 'primary'])
+_ENUM_15 = frozenset(['longText', 'number', 'obscured', 'shortText'])
+_ENUM_16 = frozenset(['multipleSelection', 'mutuallyExclusive'])
+_KEYS_17 = frozenset(['path'])
+_ENUM_18 = frozenset(['accountCircle', 'add', 'arrowBack', 'arrowForward', 'attachFile', 'calendarToday', 'call', 'camera', 'check', 'close', 'delete', 'download', 'edit', 'error', 'event', 'fastForward', 'favorite', 'favoriteOff', 'folder', 'help', 'home', 'info', 'locationOn', 'lock', 'lockOpen', 'mail', 'menu', 'moreHoriz', 'moreVert', 'notifications', 'notificationsOff', 'pause', 'payment', 'person', 'phone', 'photo', 'play', 'print', 'refresh', 'rewind', 'search', 'send', 'settings', 'share', 'shoppingCart', 'skipNext', 'skipPrevious', 'star', 'starHalf', 'starOff', 'stop', 'upload', 'visibility', 'visibilityOff', 'volumeDown', 'volumeMute', 'volumeOff', 'volumeUp', 'warning'])
+_KEYS_19 = frozenset(['componentId', 'path'])
+_KEYS_20 = frozenset(['child', 'title'])
+_KEYS_21 = frozenset(['event'])
+_KEYS_22 = frozenset(['functionCall'])
+_KEYS_23 = frozenset(['label', 'value'])
+_ENUM_24 = frozenset(['any', 'array', 'boolean', 'number', 'object', 'string', 'void'])
+_KEYS_25 = frozenset(['context', 'name'])
+_KEYS_26 = frozenset([])
+_KEYS_27 = frozenset(['component', 'text', 'variant'])
+_KEYS_28 = frozenset(['component', 'fit', 'url', 'variant'])
+_KEYS_29 = frozenset(['component', 'name'])
+_KEYS_30 = frozenset(['component', 'url'])
+_KEYS_31 = frozenset(['component', 'description', 'url'])
+_KEYS_32 = frozenset(['align', 'children', 'component', 'justify'])
+_KEYS_33 = frozenset(['align', 'children', 'component', 'direction'])
+_KEYS_34 = frozenset(['child', 'component'])
+_KEYS_35 = frozenset(['component', 'tabs'])
+_KEYS_36 = frozenset(['component', 'content', 'trigger'])
+_KEYS_37 = frozenset(['axis', 'component'])
+_KEYS_38 = frozenset(['action', 'child', 'component', 'variant'])
+_KEYS_39 = frozenset(['component', 'label', 'value', 'variant'])
+_KEYS_40 = frozenset(['component', 'label', 'value'])
+_KEYS_41 = frozenset(['component', 'label', 'options', 'value', 'variant'])
+_KEYS_42 = frozenset(['component', 'label', 'max', 'min', 'value'])
+_KEYS_43 = frozenset(['component', 'enableDate', 'enableTime', 'label', 'max', 'min', 'value'])
+_KEYS_44 = frozenset(['message'])
+_KEYS_45 = frozenset(['accessibility', 'id'])
+_KEYS_46 = frozenset(['weight'])
+_KEYS_47 = frozenset(['checks'])
+_KEYS_48 = frozenset(['and'])
+_KEYS_49 = frozenset(['or'])
+_KEYS_50 = frozenset(['not'])
+_KEYS_51 = frozenset(['true'])
+_KEYS_52 = frozenset(['false'])
+_KEYS_53 = frozenset(['returnType'])
+_KEYS_54 = frozenset(['args', 'call', 'returnType'])
+
+
+def _message(value):
+    # #
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    errors = (_defs_CreateSurfaceMessage(value), _defs_UpdateComponentsMessage(value), _defs_UpdateDataModelMessage(value), _defs_DeleteSurfaceMessage(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _response(value):
+    # #response
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    for index, item in enumerate(value):
+        error = _message(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_CreateSurfaceMessage(value):
+    # #/$defs/CreateSurfaceMessage
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'createSurface' not in value:
+        return "'createSurface' is a required property", []
+    if 'version' not in value:
+        return "'version' is a required property", []
+    item = value['version']
+    if not (isinstance(item, str) and item == 'v0.9'):
+        return "'v0.9' was expected", ['version']
+    item = value['createSurface']
+    error = _defs_CreateSurfaceMessage_properties_createSurface(item)
+    if error is not None:
+        return error[0], ['createSurface', *error[1]]
+    if not _KEYS_0.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_0]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_UpdateComponentsMessage(value):
+    # #/$defs/UpdateComponentsMessage
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'updateComponents' not in value:
+        return "'updateComponents' is a required property", []
+    if 'version' not in value:
+        return "'version' is a required property", []
+    item = value['version']
+    if not (isinstance(item, str) and item == 'v0.9'):
+        return "'v0.9' was expected", ['version']
+    item = value['updateComponents']
+    error = _defs_UpdateComponentsMessage_properties_updateComponents(item)
+    if error is not None:
+        return error[0], ['updateComponents', *error[1]]
+    if not _KEYS_1.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_1]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_UpdateDataModelMessage(value):
+    # #/$defs/UpdateDataModelMessage
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'updateDataModel' not in value:
+        return "'updateDataModel' is a required property", []
+    if 'version' not in value:
+        return "'version' is a required property", []
+    item = value['version']
+    if not (isinstance(item, str) and item == 'v0.9'):
+        return "'v0.9' was expected", ['version']
+    item = value['updateDataModel']
+    error = _defs_UpdateDataModelMessage_properties_updateDataModel(item)
+    if error is not None:
+        return error[0], ['updateDataModel', *error[1]]
+    if not _KEYS_2.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_2]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_DeleteSurfaceMessage(value):
+    # #/$defs/DeleteSurfaceMessage
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'deleteSurface' not in value:
+        return "'deleteSurface' is a required property", []
+    if 'version' not in value:
+        return "'version' is a required property", []
+    item = value['version']
+    if not (isinstance(item, str) and item == 'v0.9'):
+        return "'v0.9' was expected", ['version']
+    item = value['deleteSurface']
+    error = _defs_DeleteSurfaceMessage_properties_deleteSurface(item)
+    if error is not None:
+        return error[0], ['deleteSurface', *error[1]]
+    if not _KEYS_3.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_3]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_CreateSurfaceMessage_properties_createSurface(value):
+    # #/$defs/CreateSurfaceMessage/properties/createSurface
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'surfaceId' not in value:
+        return "'surfaceId' is a required property", []
+    if 'catalogId' not in value:
+        return "'catalogId' is a required property", []
+    item = value['surfaceId']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['surfaceId']
+    item = value['catalogId']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['catalogId']
+    if 'theme' in value:
+        item = value['theme']
+        error = _defs_CreateSurfaceMessage_properties_createSurface_properties_theme(item)
+        if error is not None:
+            return error[0], ['theme', *error[1]]
+    if 'sendDataModel' in value:
+        item = value['sendDataModel']
+        if not (isinstance(item, bool)):
+            return f"{item!r} is not of type 'boolean'", ['sendDataModel']
+    if not _KEYS_4.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_4]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_UpdateComponentsMessage_properties_updateComponents(value):
+    # #/$defs/UpdateComponentsMessage/properties/updateComponents
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'surfaceId' not in value:
+        return "'surfaceId' is a required property", []
+    if 'components' not in value:
+        return "'components' is a required property", []
+    item = value['surfaceId']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['surfaceId']
+    item = value['components']
+    error = _defs_UpdateComponentsMessage_properties_updateComponents_properties_components(item)
+    if error is not None:
+        return error[0], ['components', *error[1]]
+    if not _KEYS_5.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_5]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_UpdateDataModelMessage_properties_updateDataModel(value):
+    # #/$defs/UpdateDataModelMessage/properties/updateDataModel
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'surfaceId' not in value:
+        return "'surfaceId' is a required property", []
+    item = value['surfaceId']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['surfaceId']
+    if 'path' in value:
+        item = value['path']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['path']
+    if 'value' in value:
+        item = value['value']
+        error = _defs_UpdateDataModelMessage_properties_updateDataModel_properties_value(item)
+        if error is not None:
+            return error[0], ['value', *error[1]]
+    if not _KEYS_6.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_6]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_DeleteSurfaceMessage_properties_deleteSurface(value):
+    # #/$defs/DeleteSurfaceMessage/properties/deleteSurface
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'surfaceId' not in value:
+        return "'surfaceId' is a required property", []
+    item = value['surfaceId']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['surfaceId']
+    if not _KEYS_7.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_7]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_CreateSurfaceMessage_properties_createSurface_properties_theme(value):
+    # #/$defs/CreateSurfaceMessage/properties/createSurface/properties/theme
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    return None
+
+
+def _defs_UpdateComponentsMessage_properties_updateComponents_properties_components(value):
+    # #/$defs/UpdateComponentsMessage/properties/updateComponents/properties/components
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    if len(value) < 1:
+        return f"{value!r} should be non-empty", []
+    for index, item in enumerate(value):
+        error = _defs_anyComponent(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_UpdateDataModelMessage_properties_updateDataModel_properties_value(value):
+    # #/$defs/UpdateDataModelMessage/properties/updateDataModel/properties/value
+    return None
+
+
+def _defs_anyComponent(value):
+    # #/$defs/anyComponent
+    tag = value.get('component') if isinstance(value, dict) else None
+    if isinstance(tag, str) and tag in _DISPATCH_0:
+        error = _DISPATCH_0[tag](value)
+        if error is not None:
+            return error
+    else:
+        errors = (_components_Text(value), _components_Image(value), _components_Icon(value), _components_Video(value), _components_AudioPlayer(value), _components_Row(value), _components_Column(value), _components_List(value), _components_Card(value), _components_Tabs(value), _components_Modal(value), _components_Divider(value), _components_Button(value), _components_TextField(value), _components_CheckBox(value), _components_ChoicePicker(value), _components_Slider(value), _components_DateTimeInput(value),)
+        matched = errors.count(None)
+        if matched == 0:
+            return _one_of_error(value, errors)
+        if matched > 1:
+            return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_Text(value):
+    # #/components/Text
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Text_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Text(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Image(value):
+    # #/components/Image
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Image_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Image(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Icon(value):
+    # #/components/Icon
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Icon_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Icon(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Video(value):
+    # #/components/Video
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Video_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Video(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_AudioPlayer(value):
+    # #/components/AudioPlayer
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_AudioPlayer_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_AudioPlayer(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Row(value):
+    # #/components/Row
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Row_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Row(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Column(value):
+    # #/components/Column
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Column_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Column(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_List(value):
+    # #/components/List
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_List_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_List(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Card(value):
+    # #/components/Card
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Card_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Card(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Tabs(value):
+    # #/components/Tabs
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Tabs_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Tabs(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Modal(value):
+    # #/components/Modal
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Modal_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Modal(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Divider(value):
+    # #/components/Divider
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _components_Divider_allOf_2(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Divider(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Button(value):
+    # #/components/Button
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_Checkable(value)
+    if error is not None:
+        return error
+    error = _components_Button_allOf_3(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Button(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_TextField(value):
+    # #/components/TextField
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_Checkable(value)
+    if error is not None:
+        return error
+    error = _components_TextField_allOf_3(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_TextField(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_CheckBox(value):
+    # #/components/CheckBox
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_Checkable(value)
+    if error is not None:
+        return error
+    error = _components_CheckBox_allOf_3(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_CheckBox(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_ChoicePicker(value):
+    # #/components/ChoicePicker
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_Checkable(value)
+    if error is not None:
+        return error
+    error = _components_ChoicePicker_allOf_3(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_ChoicePicker(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Slider(value):
+    # #/components/Slider
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_Checkable(value)
+    if error is not None:
+        return error
+    error = _components_Slider_allOf_3(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_Slider(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_DateTimeInput(value):
+    # #/components/DateTimeInput
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_ComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_CatalogComponentCommon(value)
+    if error is not None:
+        return error
+    error = _defs_Checkable(value)
+    if error is not None:
+        return error
+    error = _components_DateTimeInput_allOf_3(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_components_DateTimeInput(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_ComponentCommon(value):
+    # #/$defs/ComponentCommon
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'id' not in value:
+        return "'id' is a required property", []
+    item = value['id']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['id']
+    if 'accessibility' in value:
+        item = value['accessibility']
+        error = _defs_AccessibilityAttributes(item)
+        if error is not None:
+            return error[0], ['accessibility', *error[1]]
+    return None
+
+
+def _defs_CatalogComponentCommon(value):
+    # #/$defs/CatalogComponentCommon
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'weight' in value:
+        item = value['weight']
+        if not ((isinstance(item, (int, float)) and not isinstance(item, bool))):
+            return f"{item!r} is not of type 'number'", ['weight']
+    return None
+
+
+def _components_Text_allOf_2(value):
+    # #/components/Text/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'text' not in value:
+        return "'text' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Text'):
+        return "'Text' was expected", ['component']
+    item = value['text']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['text', *error[1]]
+    if 'variant' in value:
+        item = value['variant']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['variant']
+        if not (isinstance(item, str) and item in _ENUM_8):
+            return f"{item!r} is not one of ['h1', 'h2', 'h3', 'h4', 'h5', 'caption', 'body']", ['variant']
+    return None
+
+
+def _components_Image_allOf_2(value):
+    # #/components/Image/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'url' not in value:
+        return "'url' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Image'):
+        return "'Image' was expected", ['component']
+    item = value['url']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['url', *error[1]]
+    if 'fit' in value:
+        item = value['fit']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['fit']
+        if not (isinstance(item, str) and item in _ENUM_9):
+            return f"{item!r} is not one of ['contain', 'cover', 'fill', 'none', 'scale-down']", ['fit']
+    if 'variant' in value:
+        item = value['variant']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['variant']
+        if not (isinstance(item, str) and item in _ENUM_10):
+            return f"{item!r} is not one of ['icon', 'avatar', 'smallFeature', 'mediumFeature', 'largeFeature', 'header']", ['variant']
+    return None
+
+
+def _components_Icon_allOf_2(value):
+    # #/components/Icon/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'name' not in value:
+        return "'name' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Icon'):
+        return "'Icon' was expected", ['component']
+    item = value['name']
+    error = _components_Icon_allOf_2_properties_name(item)
+    if error is not None:
+        return error[0], ['name', *error[1]]
+    return None
+
+
+def _components_Video_allOf_2(value):
+    # #/components/Video/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'url' not in value:
+        return "'url' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Video'):
+        return "'Video' was expected", ['component']
+    item = value['url']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['url', *error[1]]
+    return None
+
+
+def _components_AudioPlayer_allOf_2(value):
+    # #/components/AudioPlayer/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'url' not in value:
+        return "'url' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'AudioPlayer'):
+        return "'AudioPlayer' was expected", ['component']
+    item = value['url']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['url', *error[1]]
+    if 'description' in value:
+        item = value['description']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['description', *error[1]]
+    return None
+
+
+def _components_Row_allOf_2(value):
+    # #/components/Row/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'children' not in value:
+        return "'children' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Row'):
+        return "'Row' was expected", ['component']
+    item = value['children']
+    error = _defs_ChildList(item)
+    if error is not None:
+        return error[0], ['children', *error[1]]
+    if 'justify' in value:
+        item = value['justify']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['justify']
+        if not (isinstance(item, str) and item in _ENUM_11):
+            return f"{item!r} is not one of ['center', 'end', 'spaceAround', 'spaceBetween', 'spaceEvenly', 'start', 'stretch']", ['justify']
+    if 'align' in value:
+        item = value['align']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['align']
+        if not (isinstance(item, str) and item in _ENUM_12):
+            return f"{item!r} is not one of ['start', 'center', 'end', 'stretch']", ['align']
+    return None
+
+
+def _components_Column_allOf_2(value):
+    # #/components/Column/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'children' not in value:
+        return "'children' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Column'):
+        return "'Column' was expected", ['component']
+    item = value['children']
+    error = _defs_ChildList(item)
+    if error is not None:
+        return error[0], ['children', *error[1]]
+    if 'justify' in value:
+        item = value['justify']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['justify']
+        if not (isinstance(item, str) and item in _ENUM_11):
+            return f"{item!r} is not one of ['start', 'center', 'end', 'spaceBetween', 'spaceAround', 'spaceEvenly', 'stretch']", ['justify']
+    if 'align' in value:
+        item = value['align']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['align']
+        if not (isinstance(item, str) and item in _ENUM_12):
+            return f"{item!r} is not one of ['center', 'end', 'start', 'stretch']", ['align']
+    return None
+
+
+def _components_List_allOf_2(value):
+    # #/components/List/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'children' not in value:
+        return "'children' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'List'):
+        return "'List' was expected", ['component']
+    item = value['children']
+    error = _defs_ChildList(item)
+    if error is not None:
+        return error[0], ['children', *error[1]]
+    if 'direction' in value:
+        item = value['direction']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['direction']
+        if not (isinstance(item, str) and item in _ENUM_13):
+            return f"{item!r} is not one of ['vertical', 'horizontal']", ['direction']
+    if 'align' in value:
+        item = value['align']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['align']
+        if not (isinstance(item, str) and item in _ENUM_12):
+            return f"{item!r} is not one of ['start', 'center', 'end', 'stretch']", ['align']
+    return None
+
+
+def _components_Card_allOf_2(value):
+    # #/components/Card/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'child' not in value:
+        return "'child' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Card'):
+        return "'Card' was expected", ['component']
+    item = value['child']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['child']
+    return None
+
+
+def _components_Tabs_allOf_2(value):
+    # #/components/Tabs/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'tabs' not in value:
+        return "'tabs' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Tabs'):
+        return "'Tabs' was expected", ['component']
+    item = value['tabs']
+    error = _components_Tabs_allOf_2_properties_tabs(item)
+    if error is not None:
+        return error[0], ['tabs', *error[1]]
+    return None
+
+
+def _components_Modal_allOf_2(value):
+    # #/components/Modal/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'trigger' not in value:
+        return "'trigger' is a required property", []
+    if 'content' not in value:
+        return "'content' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Modal'):
+        return "'Modal' was expected", ['component']
+    item = value['trigger']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['trigger']
+    item = value['content']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['content']
+    return None
+
+
+def _components_Divider_allOf_2(value):
+    # #/components/Divider/allOf/2
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Divider'):
+        return "'Divider' was expected", ['component']
+    if 'axis' in value:
+        item = value['axis']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['axis']
+        if not (isinstance(item, str) and item in _ENUM_13):
+            return f"{item!r} is not one of ['horizontal', 'vertical']", ['axis']
+    return None
+
+
+def _defs_Checkable(value):
+    # #/$defs/Checkable
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'checks' in value:
+        item = value['checks']
+        error = _defs_Checkable_properties_checks(item)
+        if error is not None:
+            return error[0], ['checks', *error[1]]
+    return None
+
+
+def _components_Button_allOf_3(value):
+    # #/components/Button/allOf/3
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'child' not in value:
+        return "'child' is a required property", []
+    if 'action' not in value:
+        return "'action' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Button'):
+        return "'Button' was expected", ['component']
+    item = value['child']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['child']
+    if 'variant' in value:
+        item = value['variant']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['variant']
+        if not (isinstance(item, str) and item in _ENUM_14):
+            return f"{item!r} is not one of ['primary', 'borderless']", ['variant']
+    item = value['action']
+    error = _defs_Action(item)
+    if error is not None:
+        return error[0], ['action', *error[1]]
+    return None
+
+
+def _components_TextField_allOf_3(value):
+    # #/components/TextField/allOf/3
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'label' not in value:
+        return "'label' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'TextField'):
+        return "'TextField' was expected", ['component']
+    item = value['label']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['label', *error[1]]
+    if 'value' in value:
+        item = value['value']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['value', *error[1]]
+    if 'variant' in value:
+        item = value['variant']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['variant']
+        if not (isinstance(item, str) and item in _ENUM_15):
+            return f"{item!r} is not one of ['longText', 'number', 'shortText', 'obscured']", ['variant']
+    return None
+
+
+def _components_CheckBox_allOf_3(value):
+    # #/components/CheckBox/allOf/3
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'label' not in value:
+        return "'label' is a required property", []
+    if 'value' not in value:
+        return "'value' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'CheckBox'):
+        return "'CheckBox' was expected", ['component']
+    item = value['label']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['label', *error[1]]
+    item = value['value']
+    error = _defs_DynamicBoolean(item)
+    if error is not None:
+        return error[0], ['value', *error[1]]
+    return None
+
+
+def _components_ChoicePicker_allOf_3(value):
+    # #/components/ChoicePicker/allOf/3
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'options' not in value:
+        return "'options' is a required property", []
+    if 'value' not in value:
+        return "'value' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'ChoicePicker'):
+        return "'ChoicePicker' was expected", ['component']
+    if 'label' in value:
+        item = value['label']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['label', *error[1]]
+    if 'variant' in value:
+        item = value['variant']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['variant']
+        if not (isinstance(item, str) and item in _ENUM_16):
+            return f"{item!r} is not one of ['multipleSelection', 'mutuallyExclusive']", ['variant']
+    item = value['options']
+    error = _components_ChoicePicker_allOf_3_properties_options(item)
+    if error is not None:
+        return error[0], ['options', *error[1]]
+    item = value['value']
+    error = _defs_DynamicStringList(item)
+    if error is not None:
+        return error[0], ['value', *error[1]]
+    return None
+
+
+def _components_Slider_allOf_3(value):
+    # #/components/Slider/allOf/3
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'value' not in value:
+        return "'value' is a required property", []
+    if 'min' not in value:
+        return "'min' is a required property", []
+    if 'max' not in value:
+        return "'max' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'Slider'):
+        return "'Slider' was expected", ['component']
+    if 'label' in value:
+        item = value['label']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['label', *error[1]]
+    item = value['min']
+    if not ((isinstance(item, (int, float)) and not isinstance(item, bool))):
+        return f"{item!r} is not of type 'number'", ['min']
+    item = value['max']
+    if not ((isinstance(item, (int, float)) and not isinstance(item, bool))):
+        return f"{item!r} is not of type 'number'", ['max']
+    item = value['value']
+    error = _defs_DynamicNumber(item)
+    if error is not None:
+        return error[0], ['value', *error[1]]
+    return None
+
+
+def _components_DateTimeInput_allOf_3(value):
+    # #/components/DateTimeInput/allOf/3
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'component' not in value:
+        return "'component' is a required property", []
+    if 'value' not in value:
+        return "'value' is a required property", []
+    item = value['component']
+    if not (isinstance(item, str) and item == 'DateTimeInput'):
+        return "'DateTimeInput' was expected", ['component']
+    item = value['value']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['value', *error[1]]
+    if 'enableDate' in value:
+        item = value['enableDate']
+        if not (isinstance(item, bool)):
+            return f"{item!r} is not of type 'boolean'", ['enableDate']
+    if 'enableTime' in value:
+        item = value['enableTime']
+        if not (isinstance(item, bool)):
+            return f"{item!r} is not of type 'boolean'", ['enableTime']
+    if 'min' in value:
+        item = value['min']
+        error = _components_DateTimeInput_allOf_3_properties_min(item)
+        if error is not None:
+            return error[0], ['min', *error[1]]
+    if 'max' in value:
+        item = value['max']
+        error = _components_DateTimeInput_allOf_3_properties_max(item)
+        if error is not None:
+            return error[0], ['max', *error[1]]
+    if 'label' in value:
+        item = value['label']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['label', *error[1]]
+    return None
+
+
+def _defs_AccessibilityAttributes(value):
+    # #/$defs/AccessibilityAttributes
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'label' in value:
+        item = value['label']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['label', *error[1]]
+    if 'description' in value:
+        item = value['description']
+        error = _defs_DynamicString(item)
+        if error is not None:
+            return error[0], ['description', *error[1]]
+    return None
+
+
+def _defs_DynamicString(value):
+    # #/$defs/DynamicString
+    errors = (_defs_DynamicString_oneOf_0(value), _defs_DataBinding(value), _defs_DynamicString_oneOf_2(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_Icon_allOf_2_properties_name(value):
+    # #/components/Icon/allOf/2/properties/name
+    errors = (_components_Icon_allOf_2_properties_name_oneOf_0(value), _components_Icon_allOf_2_properties_name_oneOf_1(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _defs_ChildList(value):
+    # #/$defs/ChildList
+    errors = (_defs_ChildList_oneOf_0(value), _defs_ChildList_oneOf_1(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_Tabs_allOf_2_properties_tabs(value):
+    # #/components/Tabs/allOf/2/properties/tabs
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    for index, item in enumerate(value):
+        error = _components_Tabs_allOf_2_properties_tabs_items(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_Checkable_properties_checks(value):
+    # #/$defs/Checkable/properties/checks
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    for index, item in enumerate(value):
+        error = _defs_CheckRule(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_Action(value):
+    # #/$defs/Action
+    errors = (_defs_Action_oneOf_0(value), _defs_Action_oneOf_1(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _defs_DynamicBoolean(value):
+    # #/$defs/DynamicBoolean
+    errors = (_defs_DynamicBoolean_oneOf_0(value), _defs_DataBinding(value), _defs_LogicExpression(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_ChoicePicker_allOf_3_properties_options(value):
+    # #/components/ChoicePicker/allOf/3/properties/options
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    for index, item in enumerate(value):
+        error = _components_ChoicePicker_allOf_3_properties_options_items(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_DynamicStringList(value):
+    # #/$defs/DynamicStringList
+    errors = (_defs_DynamicStringList_oneOf_0(value), _defs_DataBinding(value), _defs_DynamicStringList_oneOf_2(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _defs_DynamicNumber(value):
+    # #/$defs/DynamicNumber
+    errors = (_defs_DynamicNumber_oneOf_0(value), _defs_DataBinding(value), _defs_DynamicNumber_oneOf_2(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_min(value):
+    # #/components/DateTimeInput/allOf/3/properties/min
+    error = _defs_DynamicString(value)
+    if error is not None:
+        return error
+    error = _components_DateTimeInput_allOf_3_properties_min_allOf_1(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_max(value):
+    # #/components/DateTimeInput/allOf/3/properties/max
+    error = _defs_DynamicString(value)
+    if error is not None:
+        return error
+    error = _components_DateTimeInput_allOf_3_properties_max_allOf_1(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _defs_DynamicString_oneOf_0(value):
+    # #/$defs/DynamicString/oneOf/0
+    if not (isinstance(value, str)):
+        return f"{value!r} is not of type 'string'", []
+    return None
+
+
+def _defs_DataBinding(value):
+    # #/$defs/DataBinding
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'path' not in value:
+        return "'path' is a required property", []
+    item = value['path']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['path']
+    if not _KEYS_17.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_17]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_DynamicString_oneOf_2(value):
+    # #/$defs/DynamicString/oneOf/2
+    error = _defs_FunctionCall(value)
+    if error is not None:
+        return error
+    error = _defs_DynamicString_oneOf_2_allOf_1(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _components_Icon_allOf_2_properties_name_oneOf_0(value):
+    # #/components/Icon/allOf/2/properties/name/oneOf/0
+    if not (isinstance(value, str)):
+        return f"{value!r} is not of type 'string'", []
+    if not (isinstance(value, str) and value in _ENUM_18):
+        return f"{value!r} is not one of ['accountCircle', 'add', 'arrowBack', 'arrowForward', 'attachFile', 'calendarToday', 'call', 'camera', 'check', 'close', 'delete', 'download', 'edit', 'event', 'error', 'fastForward', 'favorite', 'favoriteOff', 'folder', 'help', 'home', 'info', 'locationOn', 'lock', 'lockOpen', 'mail', 'menu', 'moreVert', 'moreHoriz', 'notificationsOff', 'notifications', 'pause', 'payment', 'person', 'phone', 'photo', 'play', 'print', 'refresh', 'rewind', 'search', 'send', 'settings', 'share', 'shoppingCart', 'skipNext', 'skipPrevious', 'star', 'starHalf', 'starOff', 'stop', 'upload', 'visibility', 'visibilityOff', 'volumeDown', 'volumeMute', 'volumeOff', 'volumeUp', 'warning']", []
+    return None
+
+
+def _components_Icon_allOf_2_properties_name_oneOf_1(value):
+    # #/components/Icon/allOf/2/properties/name/oneOf/1
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'path' not in value:
+        return "'path' is a required property", []
+    item = value['path']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['path']
+    if not _KEYS_17.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_17]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_ChildList_oneOf_0(value):
+    # #/$defs/ChildList/oneOf/0
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    for index, item in enumerate(value):
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", [index]
+    return None
+
+
+def _defs_ChildList_oneOf_1(value):
+    # #/$defs/ChildList/oneOf/1
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'componentId' not in value:
+        return "'componentId' is a required property", []
+    if 'path' not in value:
+        return "'path' is a required property", []
+    item = value['componentId']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['componentId']
+    item = value['path']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['path']
+    if not _KEYS_19.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_19]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _components_Tabs_allOf_2_properties_tabs_items(value):
+    # #/components/Tabs/allOf/2/properties/tabs/items
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'title' not in value:
+        return "'title' is a required property", []
+    if 'child' not in value:
+        return "'child' is a required property", []
+    item = value['title']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['title', *error[1]]
+    item = value['child']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['child']
+    if not _KEYS_20.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_20]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_CheckRule(value):
+    # #/$defs/CheckRule
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    error = _defs_LogicExpression(value)
+    if error is not None:
+        return error
+    error = _defs_CheckRule_allOf_1(value)
+    if error is not None:
+        return error
+    evaluated = _own_evaluated_defs_CheckRule(value)
+    if evaluated is not None:
+        unexpected = [key for key in value if key not in evaluated]
+        if unexpected:
+            names = ', '.join(repr(key) for key in unexpected)
+            verb = 'was' if len(unexpected) == 1 else 'were'
+            return f"Unevaluated properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_Action_oneOf_0(value):
+    # #/$defs/Action/oneOf/0
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'event' not in value:
+        return "'event' is a required property", []
+    item = value['event']
+    error = _defs_Action_oneOf_0_properties_event(item)
+    if error is not None:
+        return error[0], ['event', *error[1]]
+    if not _KEYS_21.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_21]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_Action_oneOf_1(value):
+    # #/$defs/Action/oneOf/1
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'functionCall' not in value:
+        return "'functionCall' is a required property", []
+    item = value['functionCall']
+    error = _defs_FunctionCall(item)
+    if error is not None:
+        return error[0], ['functionCall', *error[1]]
+    if not _KEYS_22.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_22]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_DynamicBoolean_oneOf_0(value):
+    # #/$defs/DynamicBoolean/oneOf/0
+    if not (isinstance(value, bool)):
+        return f"{value!r} is not of type 'boolean'", []
+    return None
+
+
+def _defs_LogicExpression(value):
+    # #/$defs/LogicExpression
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    errors = (_defs_LogicExpression_oneOf_0(value), _defs_LogicExpression_oneOf_1(value), _defs_LogicExpression_oneOf_2(value), _defs_LogicExpression_oneOf_3(value), _defs_LogicExpression_oneOf_4(value), _defs_LogicExpression_oneOf_5(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_ChoicePicker_allOf_3_properties_options_items(value):
+    # #/components/ChoicePicker/allOf/3/properties/options/items
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'label' not in value:
+        return "'label' is a required property", []
+    if 'value' not in value:
+        return "'value' is a required property", []
+    item = value['label']
+    error = _defs_DynamicString(item)
+    if error is not None:
+        return error[0], ['label', *error[1]]
+    item = value['value']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['value']
+    if not _KEYS_23.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_23]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_DynamicStringList_oneOf_0(value):
+    # #/$defs/DynamicStringList/oneOf/0
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    for index, item in enumerate(value):
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", [index]
+    return None
+
+
+def _defs_DynamicStringList_oneOf_2(value):
+    # #/$defs/DynamicStringList/oneOf/2
+    error = _defs_FunctionCall(value)
+    if error is not None:
+        return error
+    error = _defs_DynamicStringList_oneOf_2_allOf_1(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _defs_DynamicNumber_oneOf_0(value):
+    # #/$defs/DynamicNumber/oneOf/0
+    if not ((isinstance(value, (int, float)) and not isinstance(value, bool))):
+        return f"{value!r} is not of type 'number'", []
+    return None
+
+
+def _defs_DynamicNumber_oneOf_2(value):
+    # #/$defs/DynamicNumber/oneOf/2
+    error = _defs_FunctionCall(value)
+    if error is not None:
+        return error
+    error = _defs_DynamicNumber_oneOf_2_allOf_1(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_min_allOf_1(value):
+    # #/components/DateTimeInput/allOf/3/properties/min/allOf/1
+    error = _components_DateTimeInput_allOf_3_properties_min_allOf_1_then(value) if _components_DateTimeInput_allOf_3_properties_min_allOf_1_if(value) is None else _always_valid(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_max_allOf_1(value):
+    # #/components/DateTimeInput/allOf/3/properties/max/allOf/1
+    error = _components_DateTimeInput_allOf_3_properties_max_allOf_1_then(value) if _components_DateTimeInput_allOf_3_properties_max_allOf_1_if(value) is None else _always_valid(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _defs_FunctionCall(value):
+    # #/$defs/FunctionCall
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'call' not in value:
+        return "'call' is a required property", []
+    item = value['call']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['call']
+    if 'args' in value:
+        item = value['args']
+        error = _defs_FunctionCall_properties_args(item)
+        if error is not None:
+            return error[0], ['args', *error[1]]
+    if 'returnType' in value:
+        item = value['returnType']
+        if not (isinstance(item, str)):
+            return f"{item!r} is not of type 'string'", ['returnType']
+        if not (isinstance(item, str) and item in _ENUM_24):
+            return f"{item!r} is not one of ['string', 'number', 'boolean', 'array', 'object', 'any', 'void']", ['returnType']
+    return None
+
+
+def _defs_DynamicString_oneOf_2_allOf_1(value):
+    # #/$defs/DynamicString/oneOf/2/allOf/1
+    if isinstance(value, dict):
+        if 'returnType' not in value:
+            return "'returnType' is a required property", []
+        item = value['returnType']
+        if not (isinstance(item, str) and item == 'string'):
+            return "'string' was expected", ['returnType']
+    return None
+
+
+def _defs_CheckRule_allOf_1(value):
+    # #/$defs/CheckRule/allOf/1
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'message' not in value:
+        return "'message' is a required property", []
+    item = value['message']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['message']
+    return None
+
+
+def _defs_Action_oneOf_0_properties_event(value):
+    # #/$defs/Action/oneOf/0/properties/event
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    if 'name' not in value:
+        return "'name' is a required property", []
+    item = value['name']
+    if not (isinstance(item, str)):
+        return f"{item!r} is not of type 'string'", ['name']
+    if 'context' in value:
+        item = value['context']
+        error = _defs_Action_oneOf_0_properties_event_properties_context(item)
+        if error is not None:
+            return error[0], ['context', *error[1]]
+    if not _KEYS_25.issuperset(value):
+        unexpected = [key for key in value if key not in _KEYS_25]
+        names = ', '.join(repr(key) for key in unexpected)
+        verb = 'was' if len(unexpected) == 1 else 'were'
+        return f"Additional properties are not allowed ({names} {verb} unexpected)", []
+    return None
+
+
+def _defs_LogicExpression_oneOf_0(value):
+    # #/$defs/LogicExpression/oneOf/0
+    if isinstance(value, dict):
+        if 'and' not in value:
+            return "'and' is a required property", []
+        item = value['and']
+        error = _defs_LogicExpression_oneOf_0_properties_and(item)
+        if error is not None:
+            return error[0], ['and', *error[1]]
+    return None
+
+
+def _defs_LogicExpression_oneOf_1(value):
+    # #/$defs/LogicExpression/oneOf/1
+    if isinstance(value, dict):
+        if 'or' not in value:
+            return "'or' is a required property", []
+        item = value['or']
+        error = _defs_LogicExpression_oneOf_1_properties_or(item)
+        if error is not None:
+            return error[0], ['or', *error[1]]
+    return None
+
+
+def _defs_LogicExpression_oneOf_2(value):
+    # #/$defs/LogicExpression/oneOf/2
+    if isinstance(value, dict):
+        if 'not' not in value:
+            return "'not' is a required property", []
+        item = value['not']
+        error = _defs_LogicExpression(item)
+        if error is not None:
+            return error[0], ['not', *error[1]]
+    return None
+
+
+def _defs_LogicExpression_oneOf_3(value):
+    # #/$defs/LogicExpression/oneOf/3
+    error = _defs_FunctionCall(value)
+    if error is not None:
+        return error
+    error = _defs_LogicExpression_oneOf_3_allOf_1(value)
+    if error is not None:
+        return error
+    return None
+
+
+def _defs_LogicExpression_oneOf_4(value):
+    # #/$defs/LogicExpression/oneOf/4
+    if isinstance(value, dict):
+        if 'true' not in value:
+            return "'true' is a required property", []
+        item = value['true']
+        if not (item is True):
+            return 'True was expected', ['true']
+    return None
+
+
+def _defs_LogicExpression_oneOf_5(value):
+    # #/$defs/LogicExpression/oneOf/5
+    if isinstance(value, dict):
+        if 'false' not in value:
+            return "'false' is a required property", []
+        item = value['false']
+        if not (item is False):
+            return 'False was expected', ['false']
+    return None
+
+
+def _defs_DynamicStringList_oneOf_2_allOf_1(value):
+    # #/$defs/DynamicStringList/oneOf/2/allOf/1
+    if isinstance(value, dict):
+        if 'returnType' not in value:
+            return "'returnType' is a required property", []
+        item = value['returnType']
+        if not (isinstance(item, str) and item == 'array'):
+            return "'array' was expected", ['returnType']
+    return None
+
+
+def _defs_DynamicNumber_oneOf_2_allOf_1(value):
+    # #/$defs/DynamicNumber/oneOf/2/allOf/1
+    if isinstance(value, dict):
+        if 'returnType' not in value:
+            return "'returnType' is a required property", []
+        item = value['returnType']
+        if not (isinstance(item, str) and item == 'number'):
+            return "'number' was expected", ['returnType']
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_min_allOf_1_if(value):
+    # #/components/DateTimeInput/allOf/3/properties/min/allOf/1/if
+    if not (isinstance(value, str)):
+        return f"{value!r} is not of type 'string'", []
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_min_allOf_1_then(value):
+    # #/components/DateTimeInput/allOf/3/properties/min/allOf/1/then
+    errors = (_always_valid(value), _always_valid(value), _always_valid(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_max_allOf_1_if(value):
+    # #/components/DateTimeInput/allOf/3/properties/max/allOf/1/if
+    if not (isinstance(value, str)):
+        return f"{value!r} is not of type 'string'", []
+    return None
+
+
+def _components_DateTimeInput_allOf_3_properties_max_allOf_1_then(value):
+    # #/components/DateTimeInput/allOf/3/properties/max/allOf/1/then
+    errors = (_always_valid(value), _always_valid(value), _always_valid(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _defs_FunctionCall_properties_args(value):
+    # #/$defs/FunctionCall/properties/args
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    for key, item in value.items():
+        if key not in _KEYS_26:
+            error = _defs_FunctionCall_properties_args_additionalProperties(item)
+            if error is not None:
+                return error[0], [key, *error[1]]
+    return None
+
+
+def _defs_Action_oneOf_0_properties_event_properties_context(value):
+    # #/$defs/Action/oneOf/0/properties/event/properties/context
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    for key, item in value.items():
+        if key not in _KEYS_26:
+            error = _defs_DynamicValue(item)
+            if error is not None:
+                return error[0], [key, *error[1]]
+    return None
+
+
+def _defs_LogicExpression_oneOf_0_properties_and(value):
+    # #/$defs/LogicExpression/oneOf/0/properties/and
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    if len(value) < 1:
+        return f"{value!r} should be non-empty", []
+    for index, item in enumerate(value):
+        error = _defs_LogicExpression(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_LogicExpression_oneOf_1_properties_or(value):
+    # #/$defs/LogicExpression/oneOf/1/properties/or
+    if not (isinstance(value, list)):
+        return f"{value!r} is not of type 'array'", []
+    if len(value) < 1:
+        return f"{value!r} should be non-empty", []
+    for index, item in enumerate(value):
+        error = _defs_LogicExpression(item)
+        if error is not None:
+            return error[0], [index, *error[1]]
+    return None
+
+
+def _defs_LogicExpression_oneOf_3_allOf_1(value):
+    # #/$defs/LogicExpression/oneOf/3/allOf/1
+    if isinstance(value, dict):
+        if 'returnType' in value:
+            item = value['returnType']
+            if not (isinstance(item, str) and item == 'boolean'):
+                return "'boolean' was expected", ['returnType']
+    return None
+
+
+def _defs_FunctionCall_properties_args_additionalProperties(value):
+    # #/$defs/FunctionCall/properties/args/additionalProperties
+    if _defs_DynamicValue(value) is not None and _defs_FunctionCall_properties_args_additionalProperties_anyOf_1(value) is not None:
+        return f"{value!r} is not valid under any of the given schemas", []
+    return None
+
+
+def _defs_DynamicValue(value):
+    # #/$defs/DynamicValue
+    errors = (_defs_DynamicValue_oneOf_0(value), _defs_DynamicValue_oneOf_1(value), _defs_DynamicValue_oneOf_2(value), _defs_DataBinding(value), _defs_FunctionCall(value),)
+    matched = errors.count(None)
+    if matched == 0:
+        return _one_of_error(value, errors)
+    if matched > 1:
+        return f"{value!r} is valid under more than one of the given schemas", []
+    return None
+
+
+def _defs_FunctionCall_properties_args_additionalProperties_anyOf_1(value):
+    # #/$defs/FunctionCall/properties/args/additionalProperties/anyOf/1
+    if not (isinstance(value, dict)):
+        return f"{value!r} is not of type 'object'", []
+    return None
+
+
+def _defs_DynamicValue_oneOf_0(value):
+    # #/$defs/DynamicValue/oneOf/0
+    if not (isinstance(value, str)):
+        return f"{value!r} is not of type 'string'", []
+    return None
+
+
+def _defs_DynamicValue_oneOf_1(value):
+    # #/$defs/DynamicValue/oneOf/1
+    if not ((isinstance(value, (int, float)) and not isinstance(value, bool))):
+        return f"{value!r} is not of type 'number'", []
+    return None
+
+
+def _defs_DynamicValue_oneOf_2(value):
+    # #/$defs/DynamicValue/oneOf/2
+    if not (isinstance(value, bool)):
+        return f"{value!r} is not of type 'boolean'", []
+    return None
+
+
+def _own_evaluated_components_Text(value):
+    # #/components/Text
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Text_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Text_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Text_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Image(value):
+    # #/components/Image
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Image_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Image_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Image_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Icon(value):
+    # #/components/Icon
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Icon_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Icon_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Icon_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Video(value):
+    # #/components/Video
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Video_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Video_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Video_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_AudioPlayer(value):
+    # #/components/AudioPlayer
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_AudioPlayer_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_AudioPlayer_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_AudioPlayer_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Row(value):
+    # #/components/Row
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Row_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Row_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Row_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Column(value):
+    # #/components/Column
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Column_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Column_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Column_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_List(value):
+    # #/components/List
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_List_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_List_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_List_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Card(value):
+    # #/components/Card
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Card_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Card_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Card_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Tabs(value):
+    # #/components/Tabs
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Tabs_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Tabs_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Tabs_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Modal(value):
+    # #/components/Modal
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Modal_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Modal_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Modal_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Divider(value):
+    # #/components/Divider
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Divider_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Divider_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Divider_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Button(value):
+    # #/components/Button
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Button_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Button_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Button_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Button_allOf_3(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_TextField(value):
+    # #/components/TextField
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_TextField_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_TextField_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_TextField_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_TextField_allOf_3(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_CheckBox(value):
+    # #/components/CheckBox
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_CheckBox_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_CheckBox_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_CheckBox_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_CheckBox_allOf_3(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_ChoicePicker(value):
+    # #/components/ChoicePicker
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_ChoicePicker_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_ChoicePicker_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_ChoicePicker_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_ChoicePicker_allOf_3(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_Slider(value):
+    # #/components/Slider
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_Slider_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Slider_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Slider_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_Slider_allOf_3(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_components_DateTimeInput(value):
+    # #/components/DateTimeInput
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_components_DateTimeInput_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_DateTimeInput_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_DateTimeInput_allOf_2(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_components_DateTimeInput_allOf_3(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _own_evaluated_defs_CheckRule(value):
+    # #/$defs/CheckRule
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CheckRule_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_CheckRule_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Text_allOf_0(value):
+    # #/components/Text/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Text_allOf_1(value):
+    # #/components/Text/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Text_allOf_2(value):
+    # #/components/Text/allOf/2
+    evaluated = set(_KEYS_27)
+    return evaluated
+
+
+def _evaluated_components_Image_allOf_0(value):
+    # #/components/Image/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Image_allOf_1(value):
+    # #/components/Image/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Image_allOf_2(value):
+    # #/components/Image/allOf/2
+    evaluated = set(_KEYS_28)
+    return evaluated
+
+
+def _evaluated_components_Icon_allOf_0(value):
+    # #/components/Icon/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Icon_allOf_1(value):
+    # #/components/Icon/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Icon_allOf_2(value):
+    # #/components/Icon/allOf/2
+    evaluated = set(_KEYS_29)
+    return evaluated
+
+
+def _evaluated_components_Video_allOf_0(value):
+    # #/components/Video/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Video_allOf_1(value):
+    # #/components/Video/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Video_allOf_2(value):
+    # #/components/Video/allOf/2
+    evaluated = set(_KEYS_30)
+    return evaluated
+
+
+def _evaluated_components_AudioPlayer_allOf_0(value):
+    # #/components/AudioPlayer/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_AudioPlayer_allOf_1(value):
+    # #/components/AudioPlayer/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_AudioPlayer_allOf_2(value):
+    # #/components/AudioPlayer/allOf/2
+    evaluated = set(_KEYS_31)
+    return evaluated
+
+
+def _evaluated_components_Row_allOf_0(value):
+    # #/components/Row/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Row_allOf_1(value):
+    # #/components/Row/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Row_allOf_2(value):
+    # #/components/Row/allOf/2
+    evaluated = set(_KEYS_32)
+    return evaluated
+
+
+def _evaluated_components_Column_allOf_0(value):
+    # #/components/Column/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Column_allOf_1(value):
+    # #/components/Column/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Column_allOf_2(value):
+    # #/components/Column/allOf/2
+    evaluated = set(_KEYS_32)
+    return evaluated
+
+
+def _evaluated_components_List_allOf_0(value):
+    # #/components/List/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_List_allOf_1(value):
+    # #/components/List/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_List_allOf_2(value):
+    # #/components/List/allOf/2
+    evaluated = set(_KEYS_33)
+    return evaluated
+
+
+def _evaluated_components_Card_allOf_0(value):
+    # #/components/Card/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Card_allOf_1(value):
+    # #/components/Card/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Card_allOf_2(value):
+    # #/components/Card/allOf/2
+    evaluated = set(_KEYS_34)
+    return evaluated
+
+
+def _evaluated_components_Tabs_allOf_0(value):
+    # #/components/Tabs/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Tabs_allOf_1(value):
+    # #/components/Tabs/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Tabs_allOf_2(value):
+    # #/components/Tabs/allOf/2
+    evaluated = set(_KEYS_35)
+    return evaluated
+
+
+def _evaluated_components_Modal_allOf_0(value):
+    # #/components/Modal/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Modal_allOf_1(value):
+    # #/components/Modal/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Modal_allOf_2(value):
+    # #/components/Modal/allOf/2
+    evaluated = set(_KEYS_36)
+    return evaluated
+
+
+def _evaluated_components_Divider_allOf_0(value):
+    # #/components/Divider/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Divider_allOf_1(value):
+    # #/components/Divider/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Divider_allOf_2(value):
+    # #/components/Divider/allOf/2
+    evaluated = set(_KEYS_37)
+    return evaluated
+
+
+def _evaluated_components_Button_allOf_0(value):
+    # #/components/Button/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Button_allOf_1(value):
+    # #/components/Button/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Button_allOf_2(value):
+    # #/components/Button/allOf/2
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_Checkable(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Button_allOf_3(value):
+    # #/components/Button/allOf/3
+    evaluated = set(_KEYS_38)
+    return evaluated
+
+
+def _evaluated_components_TextField_allOf_0(value):
+    # #/components/TextField/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_TextField_allOf_1(value):
+    # #/components/TextField/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_TextField_allOf_2(value):
+    # #/components/TextField/allOf/2
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_Checkable(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_TextField_allOf_3(value):
+    # #/components/TextField/allOf/3
+    evaluated = set(_KEYS_39)
+    return evaluated
+
+
+def _evaluated_components_CheckBox_allOf_0(value):
+    # #/components/CheckBox/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_CheckBox_allOf_1(value):
+    # #/components/CheckBox/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_CheckBox_allOf_2(value):
+    # #/components/CheckBox/allOf/2
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_Checkable(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_CheckBox_allOf_3(value):
+    # #/components/CheckBox/allOf/3
+    evaluated = set(_KEYS_40)
+    return evaluated
+
+
+def _evaluated_components_ChoicePicker_allOf_0(value):
+    # #/components/ChoicePicker/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_ChoicePicker_allOf_1(value):
+    # #/components/ChoicePicker/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_ChoicePicker_allOf_2(value):
+    # #/components/ChoicePicker/allOf/2
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_Checkable(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_ChoicePicker_allOf_3(value):
+    # #/components/ChoicePicker/allOf/3
+    evaluated = set(_KEYS_41)
+    return evaluated
+
+
+def _evaluated_components_Slider_allOf_0(value):
+    # #/components/Slider/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Slider_allOf_1(value):
+    # #/components/Slider/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Slider_allOf_2(value):
+    # #/components/Slider/allOf/2
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_Checkable(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_Slider_allOf_3(value):
+    # #/components/Slider/allOf/3
+    evaluated = set(_KEYS_42)
+    return evaluated
+
+
+def _evaluated_components_DateTimeInput_allOf_0(value):
+    # #/components/DateTimeInput/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_ComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_DateTimeInput_allOf_1(value):
+    # #/components/DateTimeInput/allOf/1
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_CatalogComponentCommon(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_DateTimeInput_allOf_2(value):
+    # #/components/DateTimeInput/allOf/2
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_Checkable(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_components_DateTimeInput_allOf_3(value):
+    # #/components/DateTimeInput/allOf/3
+    evaluated = set(_KEYS_43)
+    return evaluated
+
+
+def _evaluated_defs_CheckRule_allOf_0(value):
+    # #/$defs/CheckRule/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_LogicExpression(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_defs_CheckRule_allOf_1(value):
+    # #/$defs/CheckRule/allOf/1
+    evaluated = set(_KEYS_44)
+    return evaluated
+
+
+def _evaluated_defs_ComponentCommon(value):
+    # #/$defs/ComponentCommon
+    evaluated = set(_KEYS_45)
+    return evaluated
+
+
+def _evaluated_defs_CatalogComponentCommon(value):
+    # #/$defs/CatalogComponentCommon
+    evaluated = set(_KEYS_46)
+    return evaluated
+
+
+def _evaluated_defs_Checkable(value):
+    # #/$defs/Checkable
+    evaluated = set(_KEYS_47)
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression(value):
+    # #/$defs/LogicExpression
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_LogicExpression_oneOf_0(value) if _defs_LogicExpression_oneOf_0(value) is None else frozenset()
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_LogicExpression_oneOf_1(value) if _defs_LogicExpression_oneOf_1(value) is None else frozenset()
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_LogicExpression_oneOf_2(value) if _defs_LogicExpression_oneOf_2(value) is None else frozenset()
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_LogicExpression_oneOf_3(value) if _defs_LogicExpression_oneOf_3(value) is None else frozenset()
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_LogicExpression_oneOf_4(value) if _defs_LogicExpression_oneOf_4(value) is None else frozenset()
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_LogicExpression_oneOf_5(value) if _defs_LogicExpression_oneOf_5(value) is None else frozenset()
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_0(value):
+    # #/$defs/LogicExpression/oneOf/0
+    evaluated = set(_KEYS_48)
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_1(value):
+    # #/$defs/LogicExpression/oneOf/1
+    evaluated = set(_KEYS_49)
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_2(value):
+    # #/$defs/LogicExpression/oneOf/2
+    evaluated = set(_KEYS_50)
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_3(value):
+    # #/$defs/LogicExpression/oneOf/3
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_LogicExpression_oneOf_3_allOf_0(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    keys = _evaluated_defs_LogicExpression_oneOf_3_allOf_1(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_4(value):
+    # #/$defs/LogicExpression/oneOf/4
+    evaluated = set(_KEYS_51)
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_5(value):
+    # #/$defs/LogicExpression/oneOf/5
+    evaluated = set(_KEYS_52)
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_3_allOf_0(value):
+    # #/$defs/LogicExpression/oneOf/3/allOf/0
+    evaluated = set(_KEYS_26)
+    keys = _evaluated_defs_FunctionCall(value)
+    if keys is None:
+        return None
+    evaluated |= keys
+    return evaluated
+
+
+def _evaluated_defs_LogicExpression_oneOf_3_allOf_1(value):
+    # #/$defs/LogicExpression/oneOf/3/allOf/1
+    evaluated = set(_KEYS_53)
+    return evaluated
+
+
+def _evaluated_defs_FunctionCall(value):
+    # #/$defs/FunctionCall
+    evaluated = set(_KEYS_54)
+    return evaluated
+
+
+_DISPATCH_0 = {
+    'Text': _components_Text,
+    'Image': _components_Image,
+    'Icon': _components_Icon,
+    'Video': _components_Video,
+    'AudioPlayer': _components_AudioPlayer,
+    'Row': _components_Row,
+    'Column': _components_Column,
+    'List': _components_List,
+    'Card': _components_Card,
+    'Tabs': _components_Tabs,
+    'Modal': _components_Modal,
+    'Divider': _components_Divider,
+    'Button': _components_Button,
+    'TextField': _components_TextField,
+    'CheckBox': _components_CheckBox,
+    'ChoicePicker': _components_ChoicePicker,
+    'Slider': _components_Slider,
+    'DateTimeInput': _components_DateTimeInput,
+}
+
+
+def validate_a2ui_messages(instance):
+    """
+    Validates a parsed LLM response (a list of A2UI messages).
+
+    Raises:
+        jsonschema.exceptions.ValidationError: For the first error found, with
+            the path to the failing value.
+    """
+    error = _response(instance)
+    if error is not None:
+        message, path = error
+        raise jsonschema.exceptions.ValidationError(message, path=path)
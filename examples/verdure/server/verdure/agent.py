@@ -12,63 +12,150 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextlib
+import dataclasses
 import json
 import logging
 import os
-from collections.abc import AsyncIterable
+import pathlib
+import uuid
+from collections.abc import AsyncIterable, Callable
 from typing import Any
 
 import jsonschema
 
 # --- IMPORT MODIFICATION ---
-from a2ui_schema import A2UI_SCHEMA
+from a2ui_repair import RepairedResponse, repair_a2ui_json, repair_a2ui_response
+from a2ui_stream import A2uiStreamParser, get_response_text
+from a2ui_validator import find_invalid_messages, get_a2ui_validator
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.agents.invocation_context import new_invocation_context_id
 from google.adk.artifacts import InMemoryArtifactService
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event, EventActions
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.models.lite_llm import LiteLlm
+from google.adk.models.llm_request import LlmRequest
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService, Session
 from google.genai import types
+from history_compaction import compact_history
 from prompt_builder import (
-    get_text_prompt,
-    get_ui_prompt,
+    BASE_URL_PLACEHOLDER,
+    PROMPT_EXAMPLES_MODES,
+    PROMPT_REGISTRY,
+    RenderedPrompt,
+    get_action_templates,
+    get_catalog_components,
+    get_context_cache_kwargs,
+    get_prompt_schema,
+    get_repair_prompt,
+    load_action_templates,
 )
 
 # --- END MODIFICATION ---
+from session_store import SCRATCH_SESSION_MARKER, BoundedInMemorySessionService
+from sqlite_store import SqliteSessionService, open_database
 from tools import get_landscape_options
-from ui_examples import LANDSCAPE_UI_EXAMPLES
+from ui_examples import validate_ui_templates
 
 logger = logging.getLogger(__name__)
 
-AGENT_INSTRUCTION = """
-    You are a helpful landscape design assistant. Your goal is to guide users through designing their dream landscape using a rich UI.
-    You MUST follow the UI TEMPLATE RULES. For every user query that matches a rule, you MUST generate the UI using the specified template.
-    DO NOT just reply with text if a UI template is available for the query.
+# The status sent to the client in each phase of a generation.
+CALLING_TOOL_STATUS = "Looking up landscape options..."
+GENERATING_UI_STATUS = "Building your screen..."
+VALIDATING_STATUS = "Checking your screen..."
 
-    To achieve this, you MUST follow this logic:
+# The state key set by the user message of each attempt, "<request id>:<attempt>".
+# It tags the events of a request, since the events of other requests on the same
+# session may come between them.
+ATTEMPT_STATE_KEY = "a2ui_attempt"
 
-    1.  **Welcome:**
-        a. If the user sends a greeting (e.g., "hi", "start"), you MUST generate the UI using the `WELCOME_SCREEN_EXAMPLE` template.
 
-    2.  **Project Details:**
-        a. When you receive a query like 'USER_WANTS_TO_START_PROJECT', you MUST generate the UI using the `PROJECT_DETAILS_EXAMPLE` template. DO NOT just say "OK, let's start".
+@dataclasses.dataclass
+class _Generation:
+    """One response of the LLM, validated."""
 
-    3.  **Dynamic Questionnaire:**
-        a. When you receive a query like 'USER_SUBMITTED_DETAILS...', this means the user has "uploaded" a photo.
-        b. You MUST **analyze the features of the user's photo** (which will be provided as a URL or description) and **dynamically generate a new questionnaire** based on what you see.
-        c. The `QUESTIONNAIRE_EXAMPLE` is your template for this. For example, the photo in the template (`old_backyard.png`) has an old concrete patio, some bushes, and a grill area. Therefore, you MUST generate specific questions about those exact items (e.g., "What to do with the concrete patio?", "Preserve established bushes?").
-        d. If a user uploads a photo of a grassy lawn, your questions should be about *that* (e.g., "Add a flower bed?", "Install a patio?").
+    # The final response, or None if the model returned none.
+    content: str | None
+    # The parsed text and A2UI messages, for valid UI responses.
+    ui_response: RepairedResponse | None = None
+    # The leading A2UI messages the client already received.
+    streamed_message_count: int = 0
+    # Why the response is invalid, or None if it is valid.
+    error: str | None = None
+    # Whether the deadline passed before the response was complete.
+    timed_out: bool = False
 
-    4.  **Get Options:**
-        a. When you receive a query like 'USER_SUBMITTED_QUESTIONNAIRE...', you MUST first call the `get_landscape_options` tool. Pass the `guest_count`, `preserve_bushes`, and `patio_plan` (or `lawn_plan`) from the query to the tool.
-        b. After receiving the data, you MUST use the `OPTIONS_PRESENTATION_EXAMPLE` template, populating the `updateDataModel.contents` with the JSON data from the tool.
+    @property
+    def is_valid(self) -> bool:
+        return self.content is not None and self.error is None
 
-    5.  **Shopping Cart:**
-        a. When you receive a query like 'USER_SELECTED_OPTION...', you MUST generate the UI using the `SHOPPING_CART_EXAMPLE` template. Populate the `updateDataModel.contents` with simulated cart items for the chosen design.
 
-    6.  **Confirmation:**
-        a. When you receive a query like 'USER_CHECKED_OUT...', you MUST use the `ORDER_CONFIRMATION_EXAMPLE` template, populating the `updateDataModel.contents` with the final order details.
-"""
+def _drop_inline_images(event: Event, image_url: str | None) -> Event:
+    """
+    Returns the event with its inline image bytes replaced by a reference, so
+    that they are not stored in the session and resent on every later turn.
+    """
+    if not event.content or not any(
+        part.inline_data for part in event.content.parts or []
+    ):
+        return event
+    reference = f"[The image {image_url} was attached here.]" if image_url else (
+        "[An image was attached here.]"
+    )
+    parts = [
+        types.Part.from_text(text=reference) if part.inline_data else part
+        for part in event.content.parts
+    ]
+    return event.model_copy(
+        update={"content": event.content.model_copy(update={"parts": parts})}
+    )
+
+
+def _get_attempt_invocations(events: list[Event], request_id: str) -> dict[str, int]:
+    """Maps the invocations of the attempts of a request to their attempt number."""
+    prefix = f"{request_id}:"
+    invocations = {}
+    for event in events:
+        tag = (event.actions.state_delta if event.actions else {}).get(
+            ATTEMPT_STATE_KEY
+        )
+        if event.author == "user" and isinstance(tag, str) and tag.startswith(prefix):
+            invocations[event.invocation_id] = int(tag[len(prefix) :])
+    return invocations
+
+
+def _get_delete_surface_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Returns the messages that delete the surfaces created by `messages`, e.g.
+    those a discarded generation streamed to the client.
+    """
+    return [
+        {"version": "v0.9", "deleteSurface": {"surfaceId": surface_id}}
+        for surface_id in dict.fromkeys(
+            message["createSurface"]["surfaceId"]
+            for message in messages
+            if "createSurface" in message
+        )
+    ]
+
+
+async def _get_before(queue: asyncio.Queue, deadline: float | None) -> Any:
+    """
+    Gets an item from a queue.
+
+    Raises:
+        TimeoutError: If the event loop time reaches `deadline` first.
+    """
+    if deadline is None:
+        return await queue.get()
+    timeout = deadline - asyncio.get_running_loop().time()
+    return await asyncio.wait_for(queue.get(), max(timeout, 0))
 
 
 class LandscapeAgent:
@@ -76,60 +163,218 @@ class LandscapeAgent:
 
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self, base_url: str, use_ui: bool = False):
+    def __init__(self, base_url: str):
         self.base_url = base_url
-        self.use_ui = use_ui
-        self._agent = self._build_agent(use_ui)
+        # The catalog components the UI prompt offers, or None for all of them.
+        self._components = get_catalog_components(
+            os.getenv("A2UI_CATALOG_COMPONENTS", "all")
+        )
+        self._prompt_layout = os.getenv("A2UI_PROMPT_LAYOUT", "default")
+        self._prompt_examples = os.getenv("A2UI_PROMPT_EXAMPLES", "all")
+        self._action_templates = load_action_templates(
+            os.getenv("A2UI_ACTION_TEMPLATES")
+        )
+        # Responses are streamed from the model. The conversational text is sent
+        # to the client as it arrives, and each A2UI message as soon as it is
+        # complete and valid.
+        self._stream_text = os.getenv("A2UI_STREAM_TEXT", "true").lower() == "true"
+        self._stream_messages = (
+            os.getenv("A2UI_STREAM_MESSAGES", "true").lower() == "true"
+        )
+        self._run_config = (
+            RunConfig(streaming_mode=StreamingMode.SSE)
+            if self._stream_text or self._stream_messages
+            else None
+        )
+        # Invalid UI messages are sent back to the model on their own to be
+        # corrected, instead of regenerating the whole response.
+        self._targeted_repair = (
+            os.getenv("A2UI_TARGETED_REPAIR", "true").lower() == "true"
+        )
+        # Hedging: a second generation races the first one, in its own scratch
+        # session, after A2UI_HEDGE_DELAY seconds or immediately for the actions
+        # in A2UI_HEDGE_ACTIONS. The first valid response wins. At most
+        # A2UI_MAX_HEDGES_UI (or _TEXT) hedges run at once per mode.
+        hedge_delay = os.getenv("A2UI_HEDGE_DELAY")
+        self._hedge_delay = float(hedge_delay) if hedge_delay else None
+        self._hedge_actions = {
+            action.strip()
+            for action in os.getenv("A2UI_HEDGE_ACTIONS", "").split(",")
+            if action.strip()
+        }
+        # The hedge slots of each mode, keyed by whether the turn uses UI.
+        self._hedge_slots: dict[bool, asyncio.Semaphore] = {}
+        if self._hedge_delay is not None or self._hedge_actions:
+            for use_ui, max_hedges in (
+                (True, int(os.getenv("A2UI_MAX_HEDGES_UI", "2"))),
+                (False, int(os.getenv("A2UI_MAX_HEDGES_TEXT", "1"))),
+            ):
+                if max_hedges > 0:
+                    self._hedge_slots[use_ui] = asyncio.Semaphore(max_hedges)
+        # The most retries per request. With a deadline, a retry is also only
+        # made if the time left is enough for another attempt.
+        self._max_retries = int(os.getenv("A2UI_MAX_RETRIES", "1"))
+        # Before each model call, the oldest UI responses and tool results of the
+        # history are summarized until it fits the token budget. 0 disables it.
+        self._history_token_budget = int(
+            os.getenv("A2UI_HISTORY_TOKEN_BUDGET", "4000")
+        )
+        # One agent, runner and session store serve both modes. The mode of each
+        # turn selects the instruction variant, so a conversation that switches
+        # between UI and text keeps a single history.
+        self._agent = self._build_agent()
         self._user_id = "remote_agent"
         self._runner = Runner(
             app_name=self._agent.name,
             agent=self._agent,
             artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
+            session_service=self._build_session_service(),
             memory_service=InMemoryMemoryService(),
         )
 
-        # --- MODIFICATION: Wrap the schema ---
-        # Load the A2UI_SCHEMA string into a Python object for validation
-        try:
-            # First, load the schema for a *single message*
-            single_message_schema = json.loads(A2UI_SCHEMA)
+        # UI responses are validated with the process-wide validators, which are
+        # built once from A2UI_SCHEMA and shared by every agent instance.
+        validate_with_subset = (
+            os.getenv("A2UI_VALIDATE_CATALOG_SUBSET", "false").lower() == "true"
+        )
+        self._validate_ui_response = get_a2ui_validator(
+            os.getenv("A2UI_VALIDATION_MODE", "jsonschema"),
+            self._components if validate_with_subset else None,
+        )
+        # Fail fast if a template the prompt shows would not pass validation.
+        validate_ui_templates(self._validate_ui_response)
 
-            # The prompt instructs the LLM to return a *list* of messages.
-            # Therefore, our validation schema must be an *array* of the single message schema.
-            self.a2ui_schema_object = {"type": "array", "items": single_message_schema}
-            logger.info(
-                "A2UI_SCHEMA successfully loaded and wrapped in an array validator."
-            )
-        except json.JSONDecodeError as e:
-            logger.error(f"CRITICAL: Failed to parse A2UI_SCHEMA: {e}")
-            self.a2ui_schema_object = None
-        # --- END MODIFICATION ---
+    def _build_session_service(self) -> BaseSessionService:
+        """Builds the session store configured by A2UI_SQLITE_PATH."""
+        sqlite_path = os.getenv("A2UI_SQLITE_PATH")
+        if sqlite_path:
+            # Shared by the server processes on this machine, and kept across
+            # restarts.
+            return SqliteSessionService(open_database(sqlite_path))
+        # Sessions are evicted when idle, or least recently used first beyond
+        # the session count or byte budget.
+        return BoundedInMemorySessionService(
+            max_sessions=int(os.getenv("A2UI_MAX_SESSIONS", "1000")),
+            idle_ttl=float(os.getenv("A2UI_SESSION_TTL", "3600")),
+            max_bytes=int(os.getenv("A2UI_SESSION_MAX_BYTES", "268435456")),
+        )
 
     def get_processing_message(self) -> str:
         return "Designing your landscape options..."
 
-    def _build_agent(self, use_ui: bool) -> LlmAgent:
+    def _get_prompt(
+        self, use_ui: bool = True, action: str | None = None
+    ) -> RenderedPrompt:
+        """Returns the system prompt, with the UI templates for `action` if needed."""
+        if not use_ui:
+            return PROMPT_REGISTRY.get_text_prompt()
+        templates = None
+        if self._prompt_examples == "per-action":
+            templates = get_action_templates(action, self._action_templates)
+        # Prompts are rendered once per base URL and mode, and shared by every
+        # agent instance through the prompt registry.
+        return PROMPT_REGISTRY.get_ui_prompt(
+            self.base_url,
+            schema_mode=os.getenv("A2UI_PROMPT_SCHEMA_MODE", "full"),
+            components=self._components,
+            model=os.getenv("LITELLM_MODEL", "gemini-2.5-flash"),
+            layout=self._prompt_layout,
+            templates=templates,
+        )
+
+    def _get_turn_prompt(self, state) -> RenderedPrompt:
+        """Returns the system prompt for the mode and client action of a turn."""
+        return self._get_prompt(
+            state.get("a2ui_mode", "ui") == "ui", state.get("a2ui_action")
+        )
+
+    def _provide_instruction(self, context: ReadonlyContext) -> str:
+        """Selects the instruction variant of the current turn's mode and action."""
+        return self._get_turn_prompt(context.state).text
+
+    def _compact_history(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> None:
+        """Compacts the conversation history of a model call to its token budget."""
+        llm_request.contents = compact_history(
+            llm_request.contents, self._history_token_budget, self._agent.model.model
+        )
+
+    def _split_static_instruction(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> None:
+        """
+        Sends the static part of the prompt as the system instruction, and the
+        host-specific remainder after the conversation, as ADK does with a
+        `static_instruction`. The static instruction of a shared agent cannot
+        depend on the mode, so it is set here per turn.
+        """
+        prompt = self._get_turn_prompt(callback_context.state)
+        if not prompt.dynamic_text:
+            return
+        llm_request.config.system_instruction = (
+            llm_request.config.system_instruction.replace(
+                prompt.text, prompt.static_text, 1
+            )
+        )
+        # Before the trailing user messages, where ADK puts dynamic instructions.
+        contents = llm_request.contents
+        index = len(contents)
+        while (
+            index > 0
+            and contents[index - 1].role == "user"
+            and not any(p.function_response for p in contents[index - 1].parts or [])
+        ):
+            index -= 1
+        contents.insert(
+            index,
+            types.Content(
+                role="user", parts=[types.Part.from_text(text=prompt.dynamic_text)]
+            ),
+        )
+
+    def _build_agent(self) -> LlmAgent:
         """Builds the LLM agent for the landscape agent."""
         LITELLM_MODEL = os.getenv("LITELLM_MODEL", "gemini-2.5-flash")
 
-        if use_ui:
-            # Construct the full prompt with UI instructions, examples, and schema
-            instruction = AGENT_INSTRUCTION + get_ui_prompt(
-                self.base_url, LANDSCAPE_UI_EXAMPLES
+        if self._prompt_examples not in PROMPT_EXAMPLES_MODES:
+            raise ValueError(
+                f"Unknown prompt examples mode '{self._prompt_examples}'. "
+                f"Expected one of {PROMPT_EXAMPLES_MODES}."
             )
-        else:
-            instruction = get_text_prompt()
+        prompt = self._get_prompt()
+
+        before_model_callbacks = []
+        if self._history_token_budget > 0:
+            before_model_callbacks.append(self._compact_history)
+        if self._prompt_layout == "cache-friendly":
+            # The static part goes first, as is, and the host-specific remainder
+            # after it, so the prefix is the same for every host.
+            before_model_callbacks.append(self._split_static_instruction)
 
         return LlmAgent(
-            model=LiteLlm(model=LITELLM_MODEL),
+            model=LiteLlm(
+                model=LITELLM_MODEL, **get_context_cache_kwargs(prompt, LITELLM_MODEL)
+            ),
             name="landscape_agent",
             description="An agent that helps design landscapes.",
-            instruction=instruction,
             tools=[get_landscape_options],
+            # The prompt is picked per turn, from the mode and, in the
+            # "per-action" examples mode, the client action.
+            instruction=self._provide_instruction,
+            before_model_callback=before_model_callbacks or None,
         )
 
-    async def stream(self, query, session_id, image_part=None) -> AsyncIterable[dict[str, Any]]:
+    def _hold_session(self, session_id: str) -> contextlib.AbstractContextManager:
+        """Keeps a session from being evicted until the request is answered."""
+        service = self._runner.session_service
+        if isinstance(service, BoundedInMemorySessionService):
+            return service.hold(
+                app_name=self._agent.name, user_id=self._user_id, session_id=session_id
+            )
+        return contextlib.nullcontext()
+
+    async def _get_or_create_session(self, session_id: str) -> Session:
         session_state = {"base_url": self.base_url}
 
         session = await self._runner.session_service.get_session(
@@ -138,173 +383,850 @@ class LandscapeAgent:
             session_id=session_id,
         )
         if session is None:
-            session = await self._runner.session_service.create_session(
-                app_name=self._agent.name,
-                user_id=self._user_id,
-                state=session_state,
-                session_id=session_id,
-            )
+            try:
+                session = await self._runner.session_service.create_session(
+                    app_name=self._agent.name,
+                    user_id=self._user_id,
+                    state=session_state,
+                    session_id=session_id,
+                )
+            except AlreadyExistsError:
+                # Created by a concurrent request, possibly in another process,
+                # since it was looked up.
+                return await self._get_or_create_session(session_id)
         elif "base_url" not in session.state:
             session.state["base_url"] = self.base_url
+        return session
 
-        # --- Begin: UI Validation and Retry Logic ---
-        max_retries = 1  # Total 2 attempts
-        attempt = 0
-        current_query_text = query
+    async def record_exchange(
+        self,
+        session_id: str,
+        query: str,
+        response_content: str,
+        action: str | None = None,
+    ) -> None:
+        """
+        Records a UI turn answered without the LLM in the session history, so
+        that the model sees it on later turns as if it had answered it.
 
-        # Ensure schema was loaded
-        if self.use_ui and self.a2ui_schema_object is None:
-            logger.error(
-                "--- LandscapeAgent.stream: A2UI_SCHEMA is not loaded. "
-                "Cannot perform UI validation. ---"
-            )
-            yield {
-                "is_task_complete": True,
-                "content": (
-                    "I'm sorry, I'm facing an internal configuration error with my UI components. "
-                    "Please contact support."
+        Args:
+            session_id: The session (A2A context) id.
+            query: The query the LLM would have received.
+            response_content: The response, in the format the LLM would have used.
+            action: The client action of the turn.
+        """
+        session = await self._get_or_create_session(session_id)
+        invocation_id = new_invocation_context_id()
+        await self._runner.session_service.append_event(
+            session,
+            Event(
+                invocation_id=invocation_id,
+                author="user",
+                content=types.Content(
+                    role="user", parts=[types.Part.from_text(text=query)]
+                ),
+                actions=EventActions(
+                    state_delta={"a2ui_mode": "ui", "a2ui_action": action}
                 ),
-            }
+            ),
+        )
+        await self._runner.session_service.append_event(
+            session,
+            Event(
+                invocation_id=invocation_id,
+                author=self._agent.name,
+                content=types.Content(
+                    role="model", parts=[types.Part.from_text(text=response_content)]
+                ),
+            ),
+        )
+
+    async def _repair_ui_messages(
+        self,
+        messages: list[Any],
+        error: jsonschema.exceptions.ValidationError,
+    ) -> list[Any]:
+        """
+        Asks the LLM to correct only the invalid messages of a UI response.
+
+        The request is made outside the session, so the conversation history is
+        unchanged. The corrected messages replace the invalid ones in place.
+
+        Args:
+            messages: The parsed A2UI messages of the response.
+            error: The validation error of the whole response.
+
+        Returns:
+            The messages, with the invalid ones corrected.
+
+        Raises:
+            ValueError: If the invalid messages cannot be singled out, or the
+                correction is malformed.
+            json.JSONDecodeError: If the correction is not valid JSON.
+            jsonschema.exceptions.ValidationError: If the corrected response is
+                still invalid.
+        """
+        failures = find_invalid_messages(self._validate_ui_response, messages)
+        if not failures:
+            # E.g. a constraint on the list itself.
+            raise ValueError(f"No single message is invalid: {error.message}")
+
+        logger.info(
+            f"--- LandscapeAgent: Repairing invalid messages {list(failures)} "
+            f"of {len(messages)} ---"
+        )
+        prompt = get_repair_prompt(
+            [
+                (path, e.message, messages[index])
+                for index, (path, e) in failures.items()
+            ],
+            get_prompt_schema(
+                os.getenv("A2UI_PROMPT_SCHEMA_MODE", "full"), self._components
+            ),
+        )
+        request = LlmRequest(
+            model=self._agent.model.model,
+            contents=[
+                types.Content(role="user", parts=[types.Part.from_text(text=prompt)])
+            ],
+        )
+        content = ""
+        async for response in self._agent.model.generate_content_async(request):
+            if response.content and response.content.parts:
+                content += "".join(
+                    p.text for p in response.content.parts if p.text and not p.thought
+                )
+        if self._prompt_layout == "cache-friendly":
+            content = content.replace(BASE_URL_PLACEHOLDER, self.base_url)
+
+        corrected = repair_a2ui_json(content)
+        if len(corrected) != len(failures):
+            raise ValueError(
+                f"Expected {len(failures)} corrected messages, got {len(corrected)}."
+            )
+        repaired = list(messages)
+        for index, message in zip(failures, corrected):
+            repaired[index] = message
+        self._validate_ui_response(repaired)
+        return repaired
+
+    def _get_hedge_delay(self, use_ui: bool, action: str | None) -> float | None:
+        """Returns how long to wait before hedging a generation, or None."""
+        if use_ui not in self._hedge_slots:
+            return None
+        if action in self._hedge_actions:
+            return 0.0
+        return self._hedge_delay
+
+    async def _get_session(self, session_id: str) -> Session:
+        """
+        Gets a session that exists, as the runner does.
+
+        Raises:
+            ValueError: If the session was deleted, e.g. by another process.
+        """
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name, user_id=self._user_id, session_id=session_id
+        )
+        if session is None:
+            raise ValueError(f"Session not found: {session_id}")
+        return session
+
+    async def _fork_session(
+        self, session_id: str, request_id: str, attempt: int
+    ) -> Session:
+        """
+        Creates a scratch copy of a session without the events of an attempt, to
+        generate another response to it in isolation.
+        """
+        session = await self._get_session(session_id)
+        invocations = _get_attempt_invocations(session.events, request_id)
+        fork = await self._runner.session_service.create_session(
+            app_name=self._agent.name,
+            user_id=self._user_id,
+            state=dict(session.state),
+            session_id=f"{session_id}{SCRATCH_SESSION_MARKER}{uuid.uuid4().hex}",
+        )
+        try:
+            for event in session.events:
+                if invocations.get(event.invocation_id) != attempt:
+                    await self._runner.session_service.append_event(fork, event)
+        except BaseException:
+            await self._delete_session(fork)
+            raise
+        return fork
+
+    async def _delete_invocations(
+        self, session_id: str, invocation_ids: set[str]
+    ) -> None:
+        await self._runner.session_service.delete_invocations(
+            app_name=self._agent.name,
+            user_id=self._user_id,
+            session_id=session_id,
+            invocation_ids=invocation_ids,
+        )
+
+    async def _rollback_request(self, session_id: str, request_id: str) -> None:
+        """Deletes the events of every attempt of a request from a session."""
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name, user_id=self._user_id, session_id=session_id
+        )
+        if session is None:
             return
+        invocations = _get_attempt_invocations(session.events, request_id)
+        if invocations:
+            await self._delete_invocations(session_id, set(invocations))
 
-        while attempt <= max_retries:
-            attempt += 1
-            logger.info(
-                f"--- LandscapeAgent.stream: Attempt {attempt}/{max_retries + 1} "
-                f"for session {session_id} ---"
+    async def _commit_fork(
+        self, fork: Session, session_id: str, request_id: str, attempt: int
+    ) -> None:
+        """
+        Replaces the events of an attempt in a session with those generated for
+        it in a fork of the session.
+        """
+        fork = await self._get_session(fork.id)
+        session = await self._get_session(session_id)
+        await self._delete_invocations(
+            session_id,
+            {
+                invocation_id
+                for invocation_id, number in _get_attempt_invocations(
+                    session.events, request_id
+                ).items()
+                if number == attempt
+            },
+        )
+        fork_invocations = _get_attempt_invocations(fork.events, request_id)
+        for event in fork.events:
+            if fork_invocations.get(event.invocation_id) == attempt:
+                await self._runner.session_service.append_event(session, event)
+
+    async def _commit_exchange(
+        self,
+        session_id: str,
+        request_id: str,
+        attempt: int,
+        generation: _Generation,
+        image_url: str | None = None,
+    ) -> None:
+        """
+        Leaves only the exchange that produced a valid response in the session:
+        the user message and the final attempt, without the failed attempts and
+        retry prompts before it. The events of other requests are kept.
+
+        Args:
+            session_id: The session the attempts ran in.
+            request_id: The request the attempts answered.
+            attempt: The number of the final attempt, from 1.
+            generation: The valid response.
+            image_url: The URL of the image attached to the user message, if
+                any. The image bytes were sent with this turn; the history only
+                keeps a reference to them.
+        """
+        repaired = generation.ui_response is not None and generation.ui_response.repairs
+        if attempt == 1 and not repaired and image_url is None:
+            # The events of the turn are already as they should be kept.
+            return
+
+        session = await self._runner.session_service.get_session(
+            app_name=self._agent.name, user_id=self._user_id, session_id=session_id
+        )
+        if session is None:
+            logger.warning(
+                f"--- LandscapeAgent.stream: Session {session_id} was deleted. "
+                "The exchange is not recorded. ---"
+            )
+            return
+        invocations = _get_attempt_invocations(session.events, request_id)
+        # The original user message, then the final attempt without its retry
+        # prompt.
+        events = [
+            event
+            for event in session.events
+            if (invocations.get(event.invocation_id) == 1 and event.author == "user")
+            or (
+                invocations.get(event.invocation_id) == attempt
+                and (attempt == 1 or event.author != "user")
+            )
+        ]
+        if not events:
+            return
+        if repaired:
+            # Keep the repaired response, so later turns build on valid JSON.
+            events[-1] = events[-1].model_copy(
+                update={
+                    "content": types.Content(
+                        role="model",
+                        parts=[types.Part.from_text(text=generation.content)],
+                    )
+                }
+            )
+        await self._delete_invocations(session_id, set(invocations))
+        session.events = [
+            event for event in session.events if event.invocation_id not in invocations
+        ]
+        for event in events:
+            await self._runner.session_service.append_event(
+                session, _drop_inline_images(event, image_url)
             )
 
-            parts = [types.Part.from_text(text=current_query_text)]
-            if image_part:
-                if image_part.bytes_data:
-                    logger.info(f"Adding image bytes to message")
-                    parts.append(
-                        types.Part.from_bytes(
-                            data=image_part.bytes_data,
-                            mime_type=image_part.mime_type or "image/jpeg",
-                        )
+    async def _delete_session(self, session: Session) -> None:
+        await self._runner.session_service.delete_session(
+            app_name=self._agent.name, user_id=self._user_id, session_id=session.id
+        )
+
+    async def _generate(
+        self,
+        session_id: str,
+        attempt_tag: str,
+        query_text: str,
+        image_part,
+        action: str | None,
+        use_ui: bool,
+        emit: Callable[[dict[str, Any]], None] | None,
+    ) -> _Generation:
+        """
+        Generates and validates one response.
+
+        Args:
+            session_id: The session to run the agent in.
+            attempt_tag: The ATTEMPT_STATE_KEY of the user message.
+            query_text: The user message.
+            image_part: An image to attach to the message, if any.
+            action: The client action of the turn.
+            use_ui: Whether to respond with A2UI messages, or with text only.
+            emit: Called with each streamed update for the client, or None to
+                generate without streaming.
+
+        Returns:
+            The response, with the reason it is invalid if it is.
+        """
+        parts = [types.Part.from_text(text=query_text)]
+        if image_part:
+            if image_part.path:
+                logger.info(f"Adding image bytes to message")
+                parts.append(
+                    types.Part.from_bytes(
+                        data=await asyncio.to_thread(
+                            pathlib.Path(image_part.path).read_bytes
+                        ),
+                        mime_type=image_part.mime_type or "image/jpeg",
                     )
-                else:
-                    logger.info(f"Adding image URL to message: {image_part.url}")
-                    parts.append(
-                        types.Part.from_uri(
-                            file_uri=image_part.url,
-                            mime_type=image_part.mime_type or "image/jpeg",
-                        )
+                )
+            else:
+                logger.info(f"Adding image URL to message: {image_part.url}")
+                parts.append(
+                    types.Part.from_uri(
+                        file_uri=image_part.url,
+                        mime_type=image_part.mime_type or "image/jpeg",
                     )
+                )
 
-            current_message = types.Content(role="user", parts=parts)
-            final_response_content = None
+        current_message = types.Content(role="user", parts=parts)
+        final_response_content = None
+        # Messages of this generation already validated and sent to the
+        # client, in order.
+        streamed_messages = []
+        # The text of this generation already sent to the client.
+        streamed_text = ""
+        building_ui = False
+        run_config = self._run_config if emit else None
+        stream_parser = A2uiStreamParser(ui=use_ui) if run_config else None
 
-            async for event in self._runner.run_async(
-                user_id=self._user_id,
-                session_id=session.id,
-                new_message=current_message,
-            ):
-                logger.info(f"Event from runner: {event}")
-                if event.is_final_response():
-                    if (
-                        event.content
-                        and event.content.parts
-                        and event.content.parts[0].text
-                    ):
-                        final_response_content = "\n".join(
-                            [p.text for p in event.content.parts if p.text]
+        async for event in self._runner.run_async(
+            user_id=self._user_id,
+            session_id=session_id,
+            new_message=current_message,
+            # The mode of this turn, which selects the instruction variant,
+            # and its client action, which selects the UI templates of the
+            # prompt in the "per-action" examples mode.
+            state_delta={
+                "a2ui_mode": "ui" if use_ui else "text",
+                "a2ui_action": action,
+                ATTEMPT_STATE_KEY: attempt_tag,
+            },
+            run_config=run_config,
+        ):
+            if event.partial:
+                if stream_parser is None or not event.content:
+                    continue
+                chunk = "".join(
+                    p.text for p in event.content.parts if p.text and not p.thought
+                )
+                messages = stream_parser.feed(chunk)
+
+                text_delta = stream_parser.text[len(streamed_text) :]
+                if self._stream_text and text_delta:
+                    streamed_text += text_delta
+                    emit({"is_task_complete": False, "updates": text_delta})
+                if use_ui and stream_parser.json_started and not building_ui:
+                    building_ui = True
+                    emit({"is_task_complete": False, "status": GENERATING_UI_STATUS})
+
+                if not (use_ui and self._stream_messages):
+                    continue
+                for message in messages:
+                    try:
+                        self._validate_ui_response([message])
+                    except jsonschema.exceptions.ValidationError as e:
+                        # The full response is validated, and retried, below.
+                        stream_parser.stop(
+                            f"message {len(streamed_messages)} is invalid: "
+                            f"{e.message}"
                         )
-                    break  # Got the final response, stop consuming events
-                else:
-                    logger.info(f"Intermediate event: {event}")
-                    # Yield intermediate updates on every attempt
-                    yield {
+                        break
+                    streamed_messages.append(message)
+                    emit({"is_task_complete": False, "a2ui_message": message})
+                continue
+
+            logger.info(f"Event from runner: {event}")
+            if event.is_final_response():
+                if event.content and event.content.parts and event.content.parts[0].text:
+                    final_response_content = "\n".join(
+                        [p.text for p in event.content.parts if p.text]
+                    )
+                break  # Got the final response, stop consuming events
+            else:
+                logger.info(f"Intermediate event: {event}")
+                if stream_parser is not None and not streamed_messages:
+                    # E.g. a tool call. The final response comes from the next
+                    # model call, so parse that one from the start.
+                    stream_parser = A2uiStreamParser(ui=use_ui)
+                    streamed_text = ""
+                # Report the phase on every attempt
+                if emit:
+                    emit(
+                        {
+                            "is_task_complete": False,
+                            "status": (
+                                CALLING_TOOL_STATUS
+                                if event.get_function_calls()
+                                else self.get_processing_message()
+                            ),
+                        }
+                    )
+
+        if final_response_content is None:
+            return _Generation(content=None)
+
+        if self._prompt_layout == "cache-friendly":
+            # The templates use a placeholder for the base URL; make sure none
+            # of it leaks into the response.
+            final_response_content = final_response_content.replace(
+                BASE_URL_PLACEHOLDER, self.base_url
+            )
+
+        if streamed_text:
+            # The parser held back the end of the text while it could have been
+            # the start of the delimiter or of the JSON. Send the rest of it.
+            final_text = (
+                get_response_text(final_response_content)
+                if use_ui
+                else final_response_content
+            )
+            if final_text.startswith(streamed_text) and final_text != streamed_text:
+                emit(
+                    {
                         "is_task_complete": False,
-                        "updates": self.get_processing_message(),
+                        "updates": final_text[len(streamed_text) :],
                     }
+                )
+
+        if not use_ui:  # Not using UI, so text is always "valid"
+            return _Generation(content=final_response_content)
 
-            if final_response_content is None:
+        logger.info(f"--- LandscapeAgent.stream: Validating UI response... ---")
+        if emit:
+            emit({"is_task_complete": False, "status": VALIDATING_STATUS})
+        ui_response = None
+        try:
+            # 1. Parse the JSON part, repairing formatting mistakes
+            # locally instead of spending a retry on them.
+            ui_response = repair_a2ui_response(final_response_content)
+            if ui_response.repairs:
+                final_response_content = ui_response.content
+
+            # 2. Check if it validates against the A2UI_SCHEMA
+            # This will raise jsonschema.exceptions.ValidationError if it fails
+            logger.info("--- LandscapeAgent.stream: Validating against A2UI_SCHEMA... ---")
+            # The streamed messages were validated one by one as they arrived,
+            # so only the rest are, unless the local repairs changed them.
+            validated_count = (
+                len(streamed_messages)
+                if ui_response.messages[: len(streamed_messages)] == streamed_messages
+                else 0
+            )
+            try:
+                self._validate_ui_response(ui_response.messages[validated_count:])
+            except jsonschema.exceptions.ValidationError as e:
+                if not self._targeted_repair:
+                    raise
                 logger.warning(
-                    f"--- LandscapeAgent.stream: Received no final response content from runner "
-                    f"(Attempt {attempt}). ---"
+                    f"--- LandscapeAgent.stream: A2UI validation failed: {e.message}. "
+                    "Repairing the invalid messages... ---"
                 )
-                if attempt <= max_retries:
-                    current_query_text = (
-                        "I received no response. Please try again."
-                        f"Please retry the original request: '{query}'"
-                    )
-                    continue  # Go to next retry
-                else:
-                    # Retries exhausted on no-response
-                    final_response_content = "I'm sorry, I encountered an error and couldn't process your request."
-                    # Fall through to send this as a text-only error
+                # 3. Correct only the invalid messages; the valid ones,
+                # and those already streamed, are kept as they are.
+                ui_response = RepairedResponse(
+                    text=ui_response.text,
+                    messages=await self._repair_ui_messages(ui_response.messages, e),
+                    repairs=ui_response.repairs + ["corrected invalid messages"],
+                )
+                final_response_content = ui_response.content
 
-            is_valid = False
-            error_message = ""
+            logger.info(
+                "--- LandscapeAgent.stream: UI JSON successfully parsed AND validated "
+                "against schema. Validation OK. ---"
+            )
+        except (
+            ValueError,
+            json.JSONDecodeError,
+            jsonschema.exceptions.ValidationError,
+        ) as e:
+            logger.warning(f"--- LandscapeAgent.stream: A2UI validation failed: {e} ---")
+            logger.warning(
+                f"--- Failed response content: {final_response_content[:500]}... ---"
+            )
+            return _Generation(
+                content=final_response_content,
+                ui_response=ui_response,
+                streamed_message_count=len(streamed_messages),
+                error=f"Validation failed: {e}.",
+            )
 
-            if self.use_ui:
-                logger.info(
-                    f"--- LandscapeAgent.stream: Validating UI response (Attempt {attempt})... ---"
-                )
-                try:
-                    if "---a2ui_JSON---" not in final_response_content:
-                        raise ValueError("Delimiter '---a2ui_JSON---' not found.")
+        return _Generation(
+            content=final_response_content,
+            ui_response=ui_response,
+            streamed_message_count=len(streamed_messages),
+        )
 
-                    text_part, json_string = final_response_content.split(
-                        "---a2ui_JSON---", 1
-                    )
+    async def _generate_hedged(
+        self,
+        session_id: str,
+        request_id: str,
+        attempt: int,
+        query_text: str,
+        image_part,
+        action: str | None,
+        use_ui: bool,
+        deadline: float | None = None,
+        stream: bool = True,
+    ) -> AsyncIterable[dict[str, Any] | _Generation]:
+        """
+        Generates one response, racing a second generation against it if hedging
+        is enabled for the action.
 
-                    if not json_string.strip():
-                        raise ValueError("JSON part is empty.")
+        The first generation runs in the session, and streams to the client
+        unless `stream` is False. The hedge starts after the hedge delay if a
+        hedge slot is free, in a scratch copy of the session without the events
+        of the first generation. The first valid response wins, and the other
+        generation is cancelled. If the hedge wins, its events replace those of
+        the first generation in the session, the surfaces the first generation
+        streamed are deleted, and the hedge's messages are all sent with the
+        final response.
 
-                    json_string_cleaned = (
-                        json_string.strip().lstrip("```json").rstrip("```").strip()
-                    )
+        The generations are cancelled if the event loop time reaches `deadline`
+        first.
 
-                    if not json_string_cleaned:
-                        raise ValueError("Cleaned JSON string is empty.")
+        Yields:
+            The streamed updates, then the winning (or failed) generation.
+        """
+        attempt_tag = f"{request_id}:{attempt}"
+        delay = self._get_hedge_delay(use_ui, action)
+        if delay is None:
+            updates = asyncio.Queue()
+            task = asyncio.create_task(
+                self._generate(
+                    session_id,
+                    attempt_tag,
+                    query_text,
+                    image_part,
+                    action,
+                    use_ui,
+                    updates.put_nowait if stream else None,
+                )
+            )
+            task.add_done_callback(lambda _: updates.put_nowait(None))
+            timed_out = False
+            try:
+                while True:
+                    try:
+                        update = await _get_before(updates, deadline)
+                    except TimeoutError:
+                        timed_out = True
+                        break
+                    if update is None:
+                        break
+                    yield update
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            yield _Generation(content=None, timed_out=True) if timed_out else task.result()
+            return
 
-                    # --- New Validation Steps ---
-                    # 1. Check if it's parsable JSON
-                    parsed_json_data = json.loads(json_string_cleaned)
+        # The streamed updates, and a (kind, generation) tuple for each finished
+        # generation.
+        queue = asyncio.Queue()
+        hedge_started = asyncio.Event()
+        # The scratch session the hedge runs in, once it started.
+        hedge_fork: Session | None = None
 
-                    # 2. Check if it validates against the A2UI_SCHEMA
-                    # This will raise jsonschema.exceptions.ValidationError if it fails
-                    logger.info(
-                        "--- LandscapeAgent.stream: Validating against A2UI_SCHEMA... ---"
+        async def run_primary() -> None:
+            try:
+                generation = await self._generate(
+                    session_id,
+                    attempt_tag,
+                    query_text,
+                    image_part,
+                    action,
+                    use_ui,
+                    queue.put_nowait if stream else None,
+                )
+            except Exception as e:
+                queue.put_nowait(("error", e))
+                return
+            queue.put_nowait(("primary", generation))
+
+        hedge_slots = self._hedge_slots[use_ui]
+
+        async def run_hedge() -> None:
+            nonlocal hedge_fork
+            await asyncio.sleep(delay)
+            if hedge_slots.locked():
+                logger.info("--- LandscapeAgent.stream: No hedge slot free. ---")
+                queue.put_nowait(("hedge", None))
+                return
+            async with hedge_slots:
+                hedge_started.set()
+                logger.info(f"--- LandscapeAgent.stream: Hedging after {delay}s ---")
+                try:
+                    hedge_fork = await self._fork_session(
+                        session_id, request_id, attempt
                     )
-                    jsonschema.validate(
-                        instance=parsed_json_data, schema=self.a2ui_schema_object
+                    generation = await self._generate(
+                        hedge_fork.id,
+                        attempt_tag,
+                        query_text,
+                        image_part,
+                        action,
+                        use_ui,
+                        None,
                     )
-                    # --- End New Validation Steps ---
+                except Exception as e:
+                    logger.warning(f"--- LandscapeAgent.stream: Hedge failed: {e} ---")
+                    generation = None
+                queue.put_nowait(("hedge", generation))
 
-                    logger.info(
-                        f"--- LandscapeAgent.stream: UI JSON successfully parsed AND validated against schema. "
-                        f"Validation OK (Attempt {attempt}). ---"
+        tasks = [asyncio.create_task(run_primary()), asyncio.create_task(run_hedge())]
+        results: dict[str, _Generation | None] = {}
+        # The A2UI messages the primary streamed to the client.
+        streamed_messages = []
+        winner = None
+        try:
+            while winner is None:
+                try:
+                    item = await _get_before(queue, deadline)
+                except TimeoutError:
+                    break
+                if isinstance(item, dict):
+                    if "a2ui_message" in item:
+                        streamed_messages.append(item["a2ui_message"])
+                    yield item
+                    continue
+                kind, generation = item
+                if kind == "error":
+                    raise generation
+                results[kind] = generation
+                if generation is not None and generation.is_valid:
+                    winner = kind
+                elif kind == "primary" and not hedge_started.is_set():
+                    # Failed before the hedge started, so retry instead.
+                    winner = kind
+                elif len(results) == 2:
+                    winner = "primary"
+            if winner is not None:
+                logger.info(f"--- LandscapeAgent.stream: Using the {winner} response ---")
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancelled generations to stop, so that none of them
+            # is still writing to its session below.
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if hedge_fork is not None:
+                if winner == "hedge":
+                    await self._commit_fork(
+                        hedge_fork, session_id, request_id, attempt
                     )
-                    is_valid = True
+                await self._delete_session(hedge_fork)
+        if winner == "hedge":
+            # The client shows the screen the primary started streaming; the
+            # hedge's messages all come with the final response instead.
+            for message in _get_delete_surface_messages(streamed_messages):
+                yield {"is_task_complete": False, "a2ui_message": message}
+        yield results[winner] if winner else _Generation(content=None, timed_out=True)
 
-                except (
-                    ValueError,
-                    json.JSONDecodeError,
-                    jsonschema.exceptions.ValidationError,
-                ) as e:
-                    logger.warning(
-                        f"--- LandscapeAgent.stream: A2UI validation failed: {e} (Attempt {attempt}) ---"
-                    )
+    def _get_out_of_time_response(self) -> dict[str, Any]:
+        return {
+            "is_task_complete": True,
+            "content": (
+                "I'm sorry, this is taking longer than expected. "
+                "Please try again in a moment."
+            ),
+            # Lets the caller answer some other way, e.g. without the UI.
+            "out_of_time": True,
+        }
+
+    async def _stream_attempts(
+        self,
+        session: Session,
+        query: str,
+        image_part,
+        action: str | None,
+        use_ui: bool,
+        deadline: float | None,
+    ) -> AsyncIterable[dict[str, Any]]:
+        """
+        Runs the attempts of `stream` in the session. Unless a response is
+        valid, the events of the attempts are rolled back once the generator is
+        closed. The events of other requests on the session are kept.
+        """
+        request_id = uuid.uuid4().hex
+        committed = False
+        try:
+            async for item in self._run_attempts(
+                session.id, request_id, query, image_part, action, use_ui, deadline
+            ):
+                if item["is_task_complete"] and "a2ui_response" in item:
+                    committed = True
+                yield item
+        finally:
+            if not committed:
+                await self._rollback_request(session.id, request_id)
+
+    async def _run_attempts(
+        self,
+        session_id: str,
+        request_id: str,
+        query: str,
+        image_part,
+        action: str | None,
+        use_ui: bool,
+        deadline: float | None,
+    ) -> AsyncIterable[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+
+        # --- Begin: UI Validation and Retry Logic ---
+        max_retries = self._max_retries
+        attempt = 0
+        current_query_text = query
+        # The image is sent with the first attempt only. Retries run after it in
+        # the session, so the model still sees it once.
+        current_image_part = image_part
+        # The longest attempt so far, to estimate whether a retry can finish in time.
+        longest_attempt = 0.0
+        # Whether the client received conversational text during this turn.
+        text_streamed = False
+
+        while attempt <= max_retries:
+            if attempt > 0 and deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining < longest_attempt:
                     logger.warning(
-                        f"--- Failed response content: {final_response_content[:500]}... ---"
+                        f"--- LandscapeAgent.stream: Not retrying, {remaining:.1f}s left "
+                        f"and an attempt takes up to {longest_attempt:.1f}s. ---"
                     )
-                    error_message = f"Validation failed: {e}."
+                    yield self._get_out_of_time_response()
+                    return
+            attempt += 1
+            logger.info(
+                f"--- LandscapeAgent.stream: Attempt {attempt}/{max_retries + 1} "
+                f"for session {session_id} ---"
+            )
+
+            generation = None
+            started = loop.time()
+            # The A2UI messages this attempt streamed to the client.
+            streamed_messages = []
+            async for item in self._generate_hedged(
+                session_id,
+                request_id,
+                attempt,
+                current_query_text,
+                current_image_part,
+                action,
+                use_ui,
+                deadline,
+                # Retries are not streamed: their response comes whole with the
+                # final item, once it is valid, so the client never receives
+                # the same text or surface twice.
+                stream=attempt == 1,
+            ):
+                if isinstance(item, _Generation):
+                    generation = item
+                    continue
+                if "a2ui_message" in item:
+                    streamed_messages.append(item["a2ui_message"])
+                elif "updates" in item:
+                    text_streamed = True
+                yield item
+            current_image_part = None
+            longest_attempt = max(longest_attempt, loop.time() - started)
+            if not generation.is_valid:
+                # The client drops the screen of the discarded response. A
+                # retry's screen comes whole with the final item.
+                for message in _get_delete_surface_messages(streamed_messages):
+                    yield {"is_task_complete": False, "a2ui_message": message}
+
+            if generation.timed_out:
+                logger.warning(
+                    f"--- LandscapeAgent.stream: Deadline reached during attempt {attempt}. ---"
+                )
+                yield self._get_out_of_time_response()
+                return
 
-            else:  # Not using UI, so text is always "valid"
-                is_valid = True
+            if generation.content is None:
+                logger.warning(
+                    f"--- LandscapeAgent.stream: Received no final response content from runner "
+                    f"(Attempt {attempt}). ---"
+                )
+                if attempt <= max_retries:
+                    current_query_text = (
+                        "I received no response. Please try again."
+                        f"Please retry the original request: '{query}'"
+                    )
+                    continue  # Go to next retry
+                elif use_ui:
+                    break  # Retries exhausted on no-response
+                else:
+                    # Retries exhausted on no-response; send this as text
+                    yield {
+                        "is_task_complete": True,
+                        "content": "I'm sorry, I encountered an error and couldn't process your request.",
+                    }
+                    return
 
-            if is_valid:
+            if generation.is_valid:
                 logger.info(
                     f"--- LandscapeAgent.stream: Response is valid. Sending final response (Attempt {attempt}). ---"
                 )
-                logger.info(f"Final response: {final_response_content}")
+                logger.info(f"Final response: {generation.content}")
+                await self._commit_exchange(
+                    session_id,
+                    request_id,
+                    attempt,
+                    generation,
+                    image_url=image_part.url if image_part else None,
+                )
                 yield {
                     "is_task_complete": True,
-                    "content": final_response_content,
+                    "content": generation.content,
+                    # The parsed text and A2UI messages, for UI responses.
+                    "a2ui_response": generation.ui_response,
+                    # The leading A2UI messages the client already received.
+                    "streamed_message_count": generation.streamed_message_count,
+                    # Whether the client already received the text of the
+                    # turn, from this response or from an attempt before it.
+                    "text_streamed": text_streamed,
                 }
                 return  # We're done, exit the generator
 
@@ -314,9 +1236,10 @@ class LandscapeAgent:
                 logger.warning(
                     f"--- LandscapeAgent.stream: Retrying... ({attempt}/{max_retries + 1}) ---"
                 )
+                yield {"is_task_complete": False, "status": GENERATING_UI_STATUS}
                 # Prepare the query for the retry
                 current_query_text = (
-                    f"Your previous response was invalid. {error_message} "
+                    f"Your previous response was invalid. {generation.error} "
                     "You MUST generate a valid response that strictly follows the A2UI JSON SCHEMA. "
                     "The response MUST be a JSON list of A2UI messages. "
                     "Ensure the response is split by '---a2ui_JSON---' and the JSON part is well-formed. "
@@ -336,3 +1259,55 @@ class LandscapeAgent:
             ),
         }
         # --- End: UI Validation andRetry Logic ---
+
+    async def stream(
+        self,
+        query,
+        session_id,
+        image_part=None,
+        action: str | None = None,
+        deadline: float | None = None,
+        use_ui: bool = False,
+    ) -> AsyncIterable[dict[str, Any]]:
+        """
+        Streams the response to a query.
+
+        Args:
+            query: The user message.
+            session_id: The session (A2A context) id.
+            image_part: An image to attach to the message, if any.
+            action: The client action of the turn.
+            deadline: The event loop time by which the response must be complete.
+                Generations still running then are cancelled, and retries are
+                only made if the time left is enough for another attempt. If
+                time runs out, the final item has `out_of_time` set.
+            use_ui: Whether to respond with A2UI messages, or with text only.
+                Both modes share the session, so a conversation can switch
+                between them from one turn to the next.
+
+        Yields:
+            Intermediate items, with `is_task_complete` False, that carry one of:
+            `updates`, a delta of the conversational text; `status`, the phase of
+            the generation, such as CALLING_TOOL_STATUS; or `a2ui_message`, a
+            validated A2UI message, or a deleteSurface message for a surface
+            streamed by a discarded response. Then the final item, with the
+            `content`.
+        """
+        with self._hold_session(session_id):
+            session = await self._get_or_create_session(session_id)
+
+            # The attempts run in the session itself. Only the exchange that
+            # produced the valid response is kept, so failed attempts and retry
+            # prompts do not stay in the history of later turns.
+            final_item = None
+            async with contextlib.aclosing(
+                self._stream_attempts(
+                    session, query, image_part, action, use_ui, deadline
+                )
+            ) as items:
+                async for item in items:
+                    if item["is_task_complete"]:
+                        final_item = item
+                        break
+                    yield item
+        yield final_item
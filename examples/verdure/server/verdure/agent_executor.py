@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import base64
 import json
 import logging
 import mimetypes
 import os
-import uuid
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -33,31 +33,159 @@ from a2a.types import (
 )
 from a2a.utils import (
     new_agent_parts_message,
-    new_agent_text_message,
     new_task,
 )
 from a2a.utils.errors import ServerError
 from a2ui_ext import a2ui_MIME_TYPE
 from agent import LandscapeAgent
+from fast_path import get_fast_path_action, render_fast_path
+from image_uploads import ImageUploadStore
+from status_updates import StatusUpdateCoalescer
 
 logger = logging.getLogger(__name__)
 
+# The latency budget in seconds of each client action whose response usually takes
+# longer than A2UI_LATENCY_BUDGET, e.g. because the LLM first calls a tool.
+ACTION_LATENCY_BUDGETS: dict[str, float] = {
+    "submit_questionnaire": 45.0,
+}
+
+
+def load_latency_budgets(overrides: str | None = None) -> dict[str, float]:
+    """
+    Returns ACTION_LATENCY_BUDGETS with the given overrides applied.
+
+    Args:
+        overrides: A JSON object of action name -> budget in seconds, e.g. the
+            value of A2UI_ACTION_LATENCY_BUDGETS.
+
+    Raises:
+        ValueError: If the overrides are malformed or a budget is not positive.
+    """
+    budgets = dict(ACTION_LATENCY_BUDGETS)
+    if overrides:
+        try:
+            parsed = json.loads(overrides)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid action latency budgets JSON: {e}") from e
+        if not isinstance(parsed, dict):
+            raise ValueError("Action latency budgets must be a JSON object.")
+        budgets.update(parsed)
+
+    for action, budget in budgets.items():
+        if not isinstance(budget, (int, float)) or budget <= 0:
+            raise ValueError(
+                f"Invalid latency budget {budget!r} for action '{action}'. "
+                "Expected a positive number of seconds."
+            )
+    return budgets
+
 
 class ImagePart:
-    def __init__(self, url: str, mime_type: str = None, bytes_data: bytes = None):
+    def __init__(self, url: str, mime_type: str = None, path: str = None):
         self.url = url
         self.mime_type = mime_type
-        self.bytes_data = bytes_data
+        # The uploaded file, read when the image is sent to the LLM.
+        self.path = path
 
 
 class LandscapeAgentExecutor(AgentExecutor):
     """Landscape AgentExecutor Example."""
 
     def __init__(self, base_url: str):
-        # Instantiate two agents: one for UI and one for text-only.
-        # The appropriate one will be chosen at execution time.
-        self.ui_agent = LandscapeAgent(base_url=base_url, use_ui=True)
-        self.text_agent = LandscapeAgent(base_url=base_url, use_ui=False)
+        # One agent, runner and session store for UI and text-only turns. The
+        # mode is chosen per turn at execution time.
+        self.agent = LandscapeAgent(base_url=base_url)
+        # Uploaded images are decoded and saved off the event loop, by at most
+        # A2UI_UPLOAD_WORKERS threads at once. They are stored once per content,
+        # and the least recently used are deleted beyond the disk quota.
+        upload_quota = int(os.getenv("A2UI_UPLOAD_QUOTA_BYTES", "1073741824"))
+        self.uploads = ImageUploadStore(
+            os.path.join(os.path.dirname(__file__), "images", "uploads"),
+            max_workers=int(os.getenv("A2UI_UPLOAD_WORKERS", "2")),
+            max_bytes=int(os.getenv("A2UI_MAX_UPLOAD_BYTES", "20971520")),
+            quota_bytes=upload_quota if upload_quota > 0 else None,
+            gc_interval=float(os.getenv("A2UI_UPLOAD_GC_INTERVAL", "300")),
+        )
+        # Deterministic UI screens are rendered from the templates without the LLM.
+        self.use_fast_path = os.getenv("A2UI_FAST_PATH", "true").lower() == "true"
+        # The minimum time in seconds between two intermediate text updates.
+        self.status_min_interval = float(
+            os.getenv("A2UI_STATUS_MIN_INTERVAL", "0.25")
+        )
+        # If A2UI_LATENCY_BUDGET is set, each request must be answered within its
+        # latency budget. A UI turn gets the budget minus the text fallback
+        # reserve; if it runs out of time, a text-only turn answers in the reserve.
+        # Without it, requests have no deadline.
+        latency_budget = os.getenv("A2UI_LATENCY_BUDGET")
+        self.latency_budget = float(latency_budget) if latency_budget else None
+        self.latency_budgets = load_latency_budgets(
+            os.getenv("A2UI_ACTION_LATENCY_BUDGETS")
+        )
+        self.text_fallback_reserve = float(
+            os.getenv("A2UI_TEXT_FALLBACK_RESERVE", "8")
+        )
+
+    async def _stream(
+        self,
+        query: str,
+        context_id: str,
+        image_part: ImagePart | None,
+        action: str | None,
+        use_ui: bool,
+    ):
+        """
+        Streams the agent's response within the latency budget of the action,
+        falling back to a text-only response if a UI turn runs out of time.
+
+        The text of a UI turn that can still fall back is not streamed, but sent
+        with its final response, since the client cannot take back text it
+        received.
+        """
+        if self.latency_budget is None:
+            async for item in self.agent.stream(
+                query, context_id, image_part=image_part, action=action, use_ui=use_ui
+            ):
+                yield item
+            return
+
+        budget = self.latency_budgets.get(action, self.latency_budget)
+        deadline = asyncio.get_running_loop().time() + budget
+        can_fall_back = use_ui and self.text_fallback_reserve > 0
+
+        out_of_time = False
+        async for item in self.agent.stream(
+            query,
+            context_id,
+            image_part=image_part,
+            action=action,
+            deadline=deadline - self.text_fallback_reserve if can_fall_back else deadline,
+            use_ui=use_ui,
+        ):
+            if item.get("out_of_time") and can_fall_back:
+                out_of_time = True
+                break
+            if can_fall_back and "updates" in item:
+                continue
+            if can_fall_back and item["is_task_complete"]:
+                item = {**item, "text_streamed": False}
+            yield item
+        if not out_of_time:
+            return
+
+        logger.warning(
+            f"--- AGENT_EXECUTOR: UI turn ran out of its {budget}s budget. "
+            "Answering with text only. ---"
+        )
+        async for item in self.agent.stream(
+            query,
+            context_id,
+            image_part=image_part,
+            action=action,
+            deadline=deadline,
+            use_ui=False,
+        ):
+            yield item
 
     async def execute(
         self,
@@ -69,17 +197,18 @@ class LandscapeAgentExecutor(AgentExecutor):
         ui_event_part = None
         image_part = None
         action = None
+        ctx = {}
 
-        # Determine which agent to use based on whether the a2ui extension is active.
+        # Determine the mode of the turn based on whether the a2ui extension is
+        # active.
+        agent = self.agent
         if use_ui:
-            agent = self.ui_agent
             logger.info(
-                "--- AGENT_EXECUTOR: A2UI extension is active. Using UI agent. ---"
+                "--- AGENT_EXECUTOR: A2UI extension is active. Responding with UI. ---"
             )
         else:
-            agent = self.text_agent
             logger.info(
-                "--- AGENT_EXECUTOR: A2UI extension is not active. Using text agent. ---"
+                "--- AGENT_EXECUTOR: A2UI extension is not active. Responding with text. ---"
             )
 
         if context.message and context.message.parts:
@@ -96,10 +225,12 @@ class LandscapeAgentExecutor(AgentExecutor):
                 elif isinstance(part.root, TextPart):
                     logger.info(f"  Part {i}: TextPart (text: {part.root.text})")
                 elif isinstance(part.root, FilePart):
-                    logger.info(f"  Part {i}: Found FilePart: bytes: {part.root.file.bytes[0:100]}...")
                     file_data = part.root.file
-                    if file_data.bytes:
-                        logger.info(f"  Extracting {len(part.root.file.bytes)} bytes")
+                    if getattr(file_data, "bytes", None):
+                        logger.info(
+                            f"  Part {i}: Found FilePart with {len(file_data.bytes)} "
+                            "base64 characters"
+                        )
                         mime_type = file_data.mime_type or ""
                         logger.info(f"  Part {i}: FilePart mime_type: '{mime_type}'")
                         if mime_type.startswith("application/json"):
@@ -117,29 +248,21 @@ class LandscapeAgentExecutor(AgentExecutor):
                                 logger.error(f"Failed to parse application/json FilePart: {e}")
                         else:
                             try:
-                                image_bytes = base64.b64decode(file_data.bytes)
-                                mime_type = file_data.mime_type
-                                extension = {
-                                    "image/png": ".png",
-                                    "image/jpeg": ".jpg",
-                                    "image/heic": ".heic",
-                                    "image/webp": ".webp",
-                                }.get(mime_type, ".jpg")
-                                filename = f"{uuid.uuid4()}{extension}"
-                                images_dir = os.path.join(os.path.dirname(__file__), "images", "uploads")
-                                os.makedirs(images_dir, exist_ok=True)
-                                filepath = os.path.join(images_dir, filename)
-                                with open(filepath, "wb") as f:
-                                    f.write(image_bytes)
-
-                                image_url = f"{self.ui_agent.base_url}/images/uploads/{filename}"
+                                filename = await self.uploads.save(
+                                    file_data.bytes, file_data.mime_type
+                                )
+                                image_url = f"{self.agent.base_url}/images/uploads/{filename}"
                                 mime_type = file_data.mime_type if file_data.mime_type else "image/jpeg"
-                                image_part = ImagePart(image_url, mime_type, image_bytes)
+                                image_part = ImagePart(
+                                    image_url,
+                                    mime_type,
+                                    os.path.join(self.uploads.directory, filename),
+                                )
                                 logger.info(f"  Part {i}: Set image_part to a {mime_type} image.")
-                                logger.info(f"  Saved FilePart to {filepath}, URL: {image_url}")
+                                logger.info(f"  Saved FilePart, URL: {image_url}")
                             except Exception as e:
                                 logger.error(f"Failed to save FilePart: {e}")
-                    elif file_data.uri:
+                    elif getattr(file_data, "uri", None):
                          logger.info(f"  Part {i}: FilePart has URI: {file_data.uri}")
                          # Handle URI if needed, but for now focus on bytes
                 else:
@@ -220,14 +343,78 @@ class LandscapeAgentExecutor(AgentExecutor):
             await event_queue.enqueue_event(task)
         updater = TaskUpdater(event_queue, task.id, task.context_id)
 
-        async for item in agent.stream(query, task.context_id, image_part=image_part):
+        fast_path_action = (
+            get_fast_path_action(action, query)
+            if use_ui and self.use_fast_path and not image_part
+            else None
+        )
+        if fast_path_action:
+            text_content, messages = render_fast_path(
+                fast_path_action, ctx, agent.base_url
+            )
+            # Keep the session history as if the LLM had answered.
+            await agent.record_exchange(
+                task.context_id,
+                query,
+                f"{text_content}\n---a2ui_JSON---\n{json.dumps(messages)}",
+                action,
+            )
+            final_parts = [Part(root=TextPart(text=text_content))] + [
+                Part(root=DataPart(data=message, mime_type=a2ui_MIME_TYPE))
+                for message in messages
+            ]
+            final_state = (
+                TaskState.completed
+                if action == "checkout"
+                else TaskState.input_required
+            )
+            await updater.update_status(
+                final_state,
+                new_agent_parts_message(final_parts, task.context_id, task.id),
+                final=(final_state == TaskState.completed),
+            )
+            return
+
+        coalescer = StatusUpdateCoalescer(self.status_min_interval)
+        async for item in self._stream(
+            query, task.context_id, image_part, action, use_ui
+        ):
             is_task_complete = item["is_task_complete"]
-            if not is_task_complete:
+            if not is_task_complete and "a2ui_message" in item:
+                # An A2UI message streamed ahead of the final response, after the
+                # text streamed before it.
                 await updater.update_status(
                     TaskState.working,
-                    new_agent_text_message(item["updates"], task.context_id, task.id),
+                    new_agent_parts_message(
+                        [Part(root=part) for part in coalescer.flush()]
+                        + [
+                            Part(
+                                root=DataPart(
+                                    data=item["a2ui_message"],
+                                    mime_type=a2ui_MIME_TYPE,
+                                )
+                            )
+                        ],
+                        task.context_id,
+                        task.id,
+                    ),
                 )
                 continue
+            if not is_task_complete:
+                if "status" in item:
+                    text_parts = coalescer.add_status(item["status"])
+                else:
+                    text_parts = coalescer.add_text(item["updates"])
+                if text_parts:
+                    await updater.update_status(
+                        TaskState.working,
+                        new_agent_parts_message(
+                            [Part(root=part) for part in text_parts],
+                            task.context_id,
+                            task.id,
+                        ),
+                    )
+                continue
 
             final_state = (
                 TaskState.completed
@@ -236,54 +423,33 @@ class LandscapeAgentExecutor(AgentExecutor):
             )
 
             content = item["content"]
-            final_parts = []
-            if "---a2ui_JSON---" in content:
+            # The rest of the streamed text. The text the client already
+            # received is not sent again.
+            final_parts = [Part(root=part) for part in coalescer.flush()]
+            text_streamed = item.get("text_streamed", False)
+            ui_response = item.get("a2ui_response")
+            if ui_response is not None:
                 logger.info("Splitting final response into text and UI parts.")
-                text_content, json_string = content.split("---a2ui_JSON---", 1)
-
-                if text_content.strip():
-                    final_parts.append(Part(root=TextPart(text=text_content.strip())))
-
-                if json_string.strip():
-                    try:
-                        json_string_cleaned = (
-                            json_string.strip().lstrip("```json").rstrip("```").strip()
-                        )
-                        # The new protocol sends a stream of JSON objects.
-                        # For this example, we'll assume they are sent as a list in the final response.
-                        json_data = json.loads(json_string_cleaned)
-
-                        if isinstance(json_data, list):
-                            logger.info(
-                                f"Found {len(json_data)} messages. Creating individual DataParts."
-                            )
-                            for message in json_data:
-                                final_parts.append(
-                                    Part(
-                                        root=DataPart(
-                                            data=message,
-                                            mime_type=a2ui_MIME_TYPE,
-                                        )
-                                    )
-                                )
-                        else:
-                            # Handle the case where a single JSON object is returned
-                            logger.info(
-                                "Received a single JSON object. Creating a DataPart."
-                            )
-                            final_parts.append(
-                                Part(
-                                    root=DataPart(
-                                        data=json_data,
-                                        mime_type=a2ui_MIME_TYPE,
-                                    )
-                                )
+                text = ui_response.text.strip()
+                if text and not text_streamed:
+                    final_parts.append(Part(root=TextPart(text=text)))
+
+                # Skip the messages that were already streamed.
+                streamed = item.get("streamed_message_count", 0)
+                logger.info(
+                    f"Found {len(ui_response.messages)} messages, {streamed} already "
+                    "streamed. Creating individual DataParts."
+                )
+                for message in ui_response.messages[streamed:]:
+                    final_parts.append(
+                        Part(
+                            root=DataPart(
+                                data=message,
+                                mime_type=a2ui_MIME_TYPE,
                             )
-
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse UI JSON: {e}")
-                        final_parts.append(Part(root=TextPart(text=json_string)))
-            else:
+                        )
+                    )
+            elif not text_streamed:
                 final_parts.append(Part(root=TextPart(text=content.strip())))
 
             logger.info("--- FINAL PARTS TO BE SENT ---")
@@ -0,0 +1,103 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file builds the A2A server app. It is separate from __main__.py so that
+# uvicorn can import it by name in each worker process when --workers is set.
+
+import logging
+import os
+import pathlib
+
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from a2ui_ext import a2uiExtension
+from agent import LandscapeAgent
+from agent_executor import LandscapeAgentExecutor
+from sqlite_store import SqliteTaskStore, open_database
+from starlette.applications import Starlette
+from starlette.middleware.cors import CORSMiddleware
+from starlette.staticfiles import StaticFiles
+
+
+def create_app() -> Starlette:
+    """
+    Builds the server app. It is the uvicorn app factory, called once in each
+    worker process, with the base URL set by `__main__` in A2UI_BASE_URL.
+    """
+    # The worker processes do not run `__main__`.
+    logging.basicConfig(level=logging.INFO)
+    base_url = os.environ["A2UI_BASE_URL"]
+    hello_ext = a2uiExtension()
+    capabilities = AgentCapabilities(
+        streaming=True,
+        extensions=[
+            hello_ext.agent_extension(),
+        ],
+    )
+    skill = AgentSkill(
+        id="design_landscape",
+        name="Landscape Design Tool",
+        description="Helps users design a landscape by guiding them through preferences and options.",
+        tags=["landscape", "design", "garden"],
+        examples=["Design my backyard", "Start a new landscape project"],
+    )
+
+    agent_card = AgentCard(
+        name="A2UIScape Design",
+        description="This agent helps you envision your dream landscape.",
+        url=base_url,  # <-- Use base_url here
+        version="1.0.0",
+        default_input_modes=LandscapeAgent.SUPPORTED_CONTENT_TYPES,
+        default_output_modes=LandscapeAgent.SUPPORTED_CONTENT_TYPES,
+        capabilities=capabilities,
+        skills=[skill],
+    )
+
+    agent_executor = LandscapeAgentExecutor(base_url=base_url)
+
+    # Tasks are stored with the sessions if A2UI_SQLITE_PATH is set, so that
+    # several server processes can share them.
+    sqlite_path = os.getenv("A2UI_SQLITE_PATH")
+    task_store = (
+        SqliteTaskStore(open_database(sqlite_path))
+        if sqlite_path
+        else InMemoryTaskStore()
+    )
+
+    agent_executor = hello_ext.wrap_executor(agent_executor)
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=agent_executor,
+        task_store=task_store,
+    )
+    server = A2AStarletteApplication(
+        agent_card=agent_card, http_handler=request_handler
+    )
+
+    app = server.build()
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    images_dir = current_dir / "images"
+    app.mount("/images", StaticFiles(directory=images_dir), name="images")
+    return app
@@ -0,0 +1,112 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file renders the screens that do not need the LLM.
+# The welcome, project details and order confirmation screens are the same for
+# every user, up to a few values from the client action's context. They are filled
+# from the parsed UI templates in ui_examples.py instead of being generated, which
+# takes milliseconds instead of an LLM round trip.
+
+import dataclasses
+import logging
+import random
+import re
+from collections.abc import Callable
+from typing import Any
+
+from ui_examples import UI_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+# The pseudo action of a greeting sent as free text.
+GREETING_ACTION = "greeting"
+
+_GREETING_PATTERN = re.compile(
+    r"^\s*(hi|hello|hey|hi there|start|get started|good (morning|afternoon|evening))"
+    r"[\s!.]*$",
+    re.IGNORECASE,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class FastPathScreen:
+    """A screen rendered from a UI template without the LLM."""
+
+    # The name of the template in UI_TEMPLATES.
+    template: str
+    # The conversational text. It is formatted with the template data.
+    text: str
+    # Builds the template data from the client action's context.
+    data: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+
+
+def _order_confirmation_data(context: dict[str, Any]) -> dict[str, Any]:
+    price = str(context.get("totalPrice", "Unknown Price"))
+    return {
+        "designName": context.get("optionName", "Unknown Option"),
+        "price": price.removeprefix("Total:").strip(),
+        "orderNumber": f"#LSC-{random.randint(10000, 99999)}",
+    }
+
+
+# Client action -> the screen it shows.
+FAST_PATH_SCREENS: dict[str, FastPathScreen] = {
+    GREETING_ACTION: FastPathScreen(
+        template="WELCOME_SCREEN_EXAMPLE",
+        text="Welcome to Verdure! Let's design your dream landscape together.",
+    ),
+    "start_project": FastPathScreen(
+        template="PROJECT_DETAILS_EXAMPLE",
+        text="Great, let's get started! Upload a photo of your yard and we'll design around it.",
+    ),
+    "checkout": FastPathScreen(
+        template="ORDER_CONFIRMATION_EXAMPLE",
+        text="Thank you! Your order for the {designName} is confirmed.",
+        data=_order_confirmation_data,
+    ),
+}
+
+
+def get_fast_path_action(action: str | None, query: str) -> str | None:
+    """
+    Returns the FAST_PATH_SCREENS key for a request, or None if it needs the LLM.
+
+    Args:
+        action: The client action, or None for free text.
+        query: The user's text.
+    """
+    if action is None:
+        return GREETING_ACTION if _GREETING_PATTERN.match(query or "") else None
+    return action if action in FAST_PATH_SCREENS else None
+
+
+def render_fast_path(
+    action: str, context: dict[str, Any], base_url: str
+) -> tuple[str, list[dict[str, Any]]]:
+    """
+    Renders the screen of a fast path action.
+
+    Args:
+        action: A key of FAST_PATH_SCREENS.
+        context: The client action's context.
+        base_url: The base URL for resolving static assets like logos.
+
+    Returns:
+        The conversational text and the A2UI messages.
+    """
+    screen = FAST_PATH_SCREENS[action]
+    data = screen.data(context) if screen.data else {}
+    messages = UI_TEMPLATES[screen.template].render(base_url, data)
+    logger.info(f"--- Rendered {screen.template} for '{action}' without the LLM ---")
+    return screen.text.format(**data), messages
@@ -0,0 +1,220 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file compacts the conversation history sent to the LLM on each model call.
+# Every UI response keeps its full A2UI JSON in the session, often several KB per
+# screen, and tool results stay there too, so each turn resends more than the last.
+# When the history is over its token budget, the oldest entries are compacted
+# first, until it fits:
+# - the JSON of a UI response is replaced with a one-line summary of the screen,
+#   e.g. "[Rendered the options screen: option1: Modern Zen Garden, ...]"
+# - a tool result is folded into a summary of the same kind
+# The current turn is never compacted. Only the request is changed; the session
+# keeps the full history.
+
+import functools
+import json
+import logging
+from typing import Any
+
+from a2ui_repair import repair_a2ui_response
+from a2ui_stream import A2UI_DELIMITER
+from google.genai import types
+from prompt_builder import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# The most values listed in a summary.
+_MAX_SUMMARY_VALUES = 10
+# Longer values, and URLs, are left out of summaries.
+_MAX_SUMMARY_VALUE_LENGTH = 40
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str, model: str | None) -> int:
+    return count_tokens(text, model)
+
+
+def _summarize_values(value: Any, key: str | None = None) -> list[str]:
+    """Lists the names and short scalar values of a data model, depth first."""
+    if isinstance(value, dict):
+        name = value.get("name")
+        if isinstance(name, str) and key is not None:
+            label = value.get("id")
+            return [f"{label if isinstance(label, str) else key}: {name}"]
+        values = []
+        for child_key, child in value.items():
+            values.extend(_summarize_values(child, child_key))
+        return values
+    if isinstance(value, list):
+        if all(isinstance(item, (str, int, float, bool)) for item in value):
+            value = ", ".join(str(item) for item in value)
+        else:
+            values = []
+            for index, item in enumerate(value):
+                values.extend(_summarize_values(item, f"{key}[{index}]"))
+            return values
+    if key is None:
+        return []
+    text = str(value)
+    if len(text) > _MAX_SUMMARY_VALUE_LENGTH or "://" in text:
+        return []
+    return [f"{key}={text}"]
+
+
+def _format_values(values: list[str]) -> str:
+    if len(values) > _MAX_SUMMARY_VALUES:
+        values = values[:_MAX_SUMMARY_VALUES] + ["..."]
+    return ", ".join(values)
+
+
+def summarize_ui_response(content: str) -> str | None:
+    """
+    Summarizes the A2UI messages of a UI response.
+
+    Returns:
+        The conversational text followed by a one-line summary of each rendered
+        surface, or None if the response has no parsable A2UI part.
+    """
+    if A2UI_DELIMITER not in content:
+        return None
+    try:
+        response = repair_a2ui_response(content)
+    except ValueError:
+        # Including json.JSONDecodeError.
+        return None
+
+    surfaces: dict[str, list[str]] = {}
+    for message in response.messages:
+        if not isinstance(message, dict):
+            continue
+        for body in message.values():
+            if isinstance(body, dict) and isinstance(body.get("surfaceId"), str):
+                values = surfaces.setdefault(body["surfaceId"], [])
+                if "value" in body:
+                    values.extend(_summarize_values(body["value"]))
+    lines = [
+        f"[Rendered the {surface} screen"
+        + (f": {_format_values(values)}]" if values else "]")
+        for surface, values in surfaces.items()
+    ]
+    return "\n".join([response.text.strip(), *lines]).strip()
+
+
+def summarize_tool_result(response: dict[str, Any]) -> dict[str, Any]:
+    """Folds the result of a tool call into a summary of its names and values."""
+    result = response.get("result", response)
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except json.JSONDecodeError:
+            pass
+    if isinstance(result, list):
+        summary = f"{len(result)} items"
+        values = _summarize_values(result, "item")
+    else:
+        summary = "result"
+        values = _summarize_values(result, "result")
+    if values:
+        summary += f": {_format_values(values)}"
+    return {"result": f"[Compacted tool result, {summary}]"}
+
+
+def _get_content_text(content: types.Content) -> str:
+    texts = []
+    for part in content.parts or []:
+        if part.text:
+            texts.append(part.text)
+        elif part.function_call or part.function_response:
+            texts.append(part.model_dump_json(exclude_none=True))
+    return "".join(texts)
+
+
+def _compact_content(content: types.Content) -> types.Content | None:
+    """Returns a compacted copy of a content, or None if it cannot be compacted."""
+    parts = []
+    compacted = False
+    for part in content.parts or []:
+        if content.role == "model" and part.text and not part.thought:
+            summary = summarize_ui_response(part.text)
+            if summary is not None:
+                part = types.Part.from_text(text=summary)
+                compacted = True
+        elif part.function_response and part.function_response.response:
+            folded = summarize_tool_result(part.function_response.response)
+            if folded != part.function_response.response:
+                part = part.model_copy(
+                    update={
+                        "function_response": part.function_response.model_copy(
+                            update={"response": folded}
+                        )
+                    }
+                )
+                compacted = True
+        parts.append(part)
+    if not compacted:
+        return None
+    return content.model_copy(update={"parts": parts})
+
+
+def _get_current_turn_start(contents: list[types.Content]) -> int:
+    """Returns the index of the last user message, which starts the current turn."""
+    for index in range(len(contents) - 1, -1, -1):
+        content = contents[index]
+        if content.role == "user" and not any(
+            part.function_response for part in content.parts or []
+        ):
+            return index
+    return len(contents)
+
+
+def compact_history(
+    contents: list[types.Content], token_budget: int, model: str | None = None
+) -> list[types.Content]:
+    """
+    Compacts the oldest entries of a conversation until it fits a token budget.
+
+    Args:
+        contents: The conversation, as sent to the LLM. It is not modified.
+        token_budget: The tokens the history before the current turn may use.
+        model: The model whose tokenizer is used for counting.
+
+    Returns:
+        The conversation, with old UI responses and tool results summarized if
+        it was over the budget.
+    """
+    end = _get_current_turn_start(contents)
+    tokens = [_count_tokens(_get_content_text(c), model) for c in contents[:end]]
+    total = before = sum(tokens)
+    if total <= token_budget:
+        return contents
+
+    contents = list(contents)
+    compacted_count = 0
+    for index in range(end):
+        if total <= token_budget:
+            break
+        compacted = _compact_content(contents[index])
+        if compacted is None:
+            continue
+        contents[index] = compacted
+        count = _count_tokens(_get_content_text(compacted), model)
+        total -= tokens[index] - count
+        compacted_count += 1
+
+    logger.info(
+        f"--- HistoryCompaction: Compacted {compacted_count} entries, "
+        f"{before} -> {total} tokens (budget {token_budget}) ---"
+    )
+    return contents
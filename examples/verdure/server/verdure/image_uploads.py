@@ -0,0 +1,269 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file saves the images uploaded with A2A messages, off the event loop.
+# Decoding a photo of several MB and writing it to disk would otherwise stall every
+# other stream served by the process. Uploads are decoded and written by a small
+# thread pool:
+# - the base64 text is decoded, hashed and written in chunks, so neither a copy
+#   of it nor the whole decoded image is ever held in memory
+# - uploads are rejected as soon as their decoded size exceeds the size limit
+# - the file is written under a temporary name and renamed when complete, so a
+#   partial upload is never served
+# Images are named by the sha256 of their bytes, so the same photo uploaded again,
+# e.g. after a retry or a back-navigation, is stored once. The hash also serves as
+# a cache key for the image. An upload of an image that is already stored only
+# refreshes its modification time, which is used as its last access time.
+# A background task deletes the least recently used images when the directory is
+# over its disk quota. Images used within the minimum age are always kept, since
+# the screens and history of recent conversations link to them.
+
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# The file extension of each supported image type. Other types are saved as JPEG.
+IMAGE_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/heic": ".heic",
+    "image/webp": ".webp",
+}
+
+# Base64 characters decoded at once.
+_DECODE_CHUNK_SIZE = 4 * 64 * 1024
+
+
+class ImageUploadStore:
+    """A content-addressed store of uploaded images, written in a thread pool."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_workers: int = 2,
+        max_bytes: int | None = None,
+        quota_bytes: int | None = None,
+        gc_interval: float = 300.0,
+        min_age: float = 600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            directory: The directory to save the images in.
+            max_workers: The most uploads decoded and written at once. Others
+                wait for a free worker.
+            max_bytes: The largest decoded upload accepted, or None for no limit.
+            quota_bytes: The disk quota of the directory, or None for no limit.
+            gc_interval: Seconds between two checks of the quota. The quota is
+                also checked as soon as an upload may exceed it.
+            min_age: Seconds after their last access during which images are
+                never deleted.
+            clock: Returns the current time in seconds, as file times are.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.quota_bytes = quota_bytes
+        self.gc_interval = gc_interval
+        self.min_age = min_age
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="image-upload"
+        )
+        # The size of the stored images as of the last collection, plus the
+        # uploads since. None until the first collection.
+        self._total_bytes: int | None = None
+        self._gc_task: asyncio.Task | None = None
+        self._gc_needed: asyncio.Event | None = None
+
+    async def save(self, data: str, mime_type: str | None = None) -> str:
+        """
+        Decodes and saves a base64-encoded image.
+
+        Args:
+            data: The base64-encoded image, as in an A2A FilePart.
+            mime_type: The image type, which selects the file extension.
+
+        Returns:
+            The file name in the directory, which is the sha256 of the image
+            with the extension of its type.
+
+        Raises:
+            ValueError: If the image is larger than the size limit, or is not
+                valid base64.
+        """
+        self._start_gc()
+        loop = asyncio.get_running_loop()
+        filename, size, added = await loop.run_in_executor(
+            self._executor, self._write, data, IMAGE_EXTENSIONS.get(mime_type, ".jpg")
+        )
+        if not added:
+            logger.info(f"--- ImageUploadStore: {filename} is already stored ---")
+            return filename
+
+        logger.info(f"--- ImageUploadStore: Saved {size} bytes to {filename} ---")
+        if self._total_bytes is not None:
+            self._total_bytes += size
+            if self.quota_bytes is not None and self._total_bytes > self.quota_bytes:
+                self._gc_needed.set()
+        return filename
+
+    def _write(self, data: str, extension: str) -> tuple[str, int, bool]:
+        """
+        Decodes `data` into the file named by its hash, unless it exists.
+        Runs in the thread pool.
+
+        Returns:
+            The file name, the size of the image, and whether the file was added.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = os.path.join(self.directory, f".{uuid.uuid4().hex}.tmp")
+        sha256 = hashlib.sha256()
+        size = 0
+        # The characters of the last chunk past its last full 4-character group.
+        carry = ""
+        try:
+            with open(temp_path, "wb") as f:
+                for start in range(0, len(data), _DECODE_CHUNK_SIZE):
+                    # Whitespace, such as the line breaks of MIME-wrapped
+                    # base64, is dropped as b64decode drops it without
+                    # validation. It would also shift the chunks off the
+                    # 4-character groups. Other characters are rejected.
+                    chunk = carry + "".join(
+                        data[start : start + _DECODE_CHUNK_SIZE].split()
+                    )
+                    end = len(chunk) - len(chunk) % 4
+                    carry = chunk[end:]
+                    decoded = base64.b64decode(chunk[:end], validate=True)
+                    size += len(decoded)
+                    if self.max_bytes is not None and size > self.max_bytes:
+                        raise ValueError(
+                            f"Upload is larger than the limit of {self.max_bytes} "
+                            "bytes."
+                        )
+                    f.write(decoded)
+                    sha256.update(decoded)
+            if carry:
+                raise ValueError("Upload is not valid base64: truncated.")
+            filename = f"{sha256.hexdigest()}{extension}"
+            added = self._link_if_absent(
+                temp_path, os.path.join(self.directory, filename)
+            )
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return filename, size, added
+
+    @staticmethod
+    def _link_if_absent(temp_path: str, path: str) -> bool:
+        """Atomically adds `temp_path` as `path` if absent, else touches `path`."""
+        try:
+            # Fails if the file exists, including when another process or
+            # thread adds the same image at the same time.
+            os.link(temp_path, path)
+            return True
+        except FileExistsError:
+            try:
+                os.utime(path)
+                return False
+            except FileNotFoundError:
+                # Deleted by the collector in the meantime.
+                pass
+        except OSError:
+            # E.g. a file system without hard links. The content is the same
+            # either way, so replacing an existing file is harmless.
+            pass
+        os.replace(temp_path, path)
+        return True
+
+    def _start_gc(self) -> None:
+        """Starts the background collection on the running event loop, once."""
+        if self.quota_bytes is None or (
+            self._gc_task is not None and not self._gc_task.done()
+        ):
+            return
+        self._gc_needed = asyncio.Event()
+        self._gc_task = asyncio.create_task(self._run_gc())
+
+    async def _run_gc(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(self._executor, self.collect_garbage)
+            except OSError as e:
+                logger.warning(f"--- ImageUploadStore: Collection failed: {e} ---")
+            try:
+                await asyncio.wait_for(self._gc_needed.wait(), self.gc_interval)
+            except TimeoutError:
+                pass
+            self._gc_needed.clear()
+
+    def collect_garbage(self) -> int:
+        """
+        Deletes the least recently used images until the directory is within its
+        quota, and the leftovers of interrupted uploads.
+
+        Returns:
+            The number of images deleted.
+        """
+        now = self._clock()
+        images = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if entry.name.startswith("."):
+                        if now - stat.st_mtime > self.min_age:
+                            self._remove(entry.path)
+                        continue
+                    images.append((stat.st_mtime, entry.path, stat.st_size))
+                    total += stat.st_size
+        except FileNotFoundError:
+            # Nothing was uploaded yet.
+            self._total_bytes = 0
+            return 0
+
+        deleted = 0
+        if self.quota_bytes is not None:
+            for last_access, path, size in sorted(images):
+                if total <= self.quota_bytes or now - last_access < self.min_age:
+                    break
+                self._remove(path)
+                total -= size
+                deleted += 1
+        self._total_bytes = total
+        if deleted:
+            logger.info(
+                f"--- ImageUploadStore: Deleted {deleted} least recently used "
+                f"images. {len(images) - deleted} images, {total} bytes left "
+                f"(quota {self.quota_bytes}). ---"
+            )
+        return deleted
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
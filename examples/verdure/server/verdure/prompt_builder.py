@@ -12,31 +12,162 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+from collections.abc import Callable
+from typing import Any
+
 # --- MODIFIED IMPORTS ---
-from a2ui_schema import A2UI_SCHEMA
-from ui_examples import LANDSCAPE_UI_EXAMPLES
+from a2ui_schema import (
+    A2UI_SCHEMA,
+    A2UI_SCHEMA_OBJECT,
+    A2UI_SCHEMA_SHA256,
+    render_schema,
+    subset_schema,
+)
+from ui_examples import (
+    LANDSCAPE_UI_EXAMPLES,
+    UI_TEMPLATES,
+    UITemplate,
+    render_ui_examples,
+)
 
 # --- END MODIFICATION ---
 
+logger = logging.getLogger(__name__)
 
 # --- The large LANDSCAPE_UI_EXAMPLES string has been removed from here ---
 
+AGENT_INSTRUCTION = """
+    You are a helpful landscape design assistant. Your goal is to guide users through designing their dream landscape using a rich UI.
+    You MUST follow the UI TEMPLATE RULES. For every user query that matches a rule, you MUST generate the UI using the specified template.
+    DO NOT just reply with text if a UI template is available for the query.
+
+    To achieve this, you MUST follow this logic:
+
+    1.  **Welcome:**
+        a. If the user sends a greeting (e.g., "hi", "start"), you MUST generate the UI using the `WELCOME_SCREEN_EXAMPLE` template.
+
+    2.  **Project Details:**
+        a. When you receive a query like 'USER_WANTS_TO_START_PROJECT', you MUST generate the UI using the `PROJECT_DETAILS_EXAMPLE` template. DO NOT just say "OK, let's start".
+
+    3.  **Dynamic Questionnaire:**
+        a. When you receive a query like 'USER_SUBMITTED_DETAILS...', this means the user has "uploaded" a photo.
+        b. You MUST **analyze the features of the user's photo** (which will be provided as a URL or description) and **dynamically generate a new questionnaire** based on what you see.
+        c. The `QUESTIONNAIRE_EXAMPLE` is your template for this. For example, the photo in the template (`old_backyard.png`) has an old concrete patio, some bushes, and a grill area. Therefore, you MUST generate specific questions about those exact items (e.g., "What to do with the concrete patio?", "Preserve established bushes?").
+        d. If a user uploads a photo of a grassy lawn, your questions should be about *that* (e.g., "Add a flower bed?", "Install a patio?").
+
+    4.  **Get Options:**
+        a. When you receive a query like 'USER_SUBMITTED_QUESTIONNAIRE...', you MUST first call the `get_landscape_options` tool. Pass the `guest_count`, `preserve_bushes`, and `patio_plan` (or `lawn_plan`) from the query to the tool.
+        b. After receiving the data, you MUST use the `OPTIONS_PRESENTATION_EXAMPLE` template, populating the `updateDataModel.contents` with the JSON data from the tool.
+
+    5.  **Shopping Cart:**
+        a. When you receive a query like 'USER_SELECTED_OPTION...', you MUST generate the UI using the `SHOPPING_CART_EXAMPLE` template. Populate the `updateDataModel.contents` with simulated cart items for the chosen design.
 
-def get_ui_prompt(base_url: str, examples: str) -> str:
+    6.  **Confirmation:**
+        a. When you receive a query like 'USER_CHECKED_OUT...', you MUST use the `ORDER_CONFIRMATION_EXAMPLE` template, populating the `updateDataModel.contents` with the final order details.
+"""
+
+# How the A2UI schema is rendered into the UI prompt. Validation always uses the
+# full schema, whatever the prompt mode.
+PROMPT_SCHEMA_MODES = {
+    # Pretty-printed with every description, as in A2UI_SCHEMA.
+    "full": {},
+    # Minified, with repeated subschemas shared through `$defs`.
+    "compact": {"compact": True},
+    # As "compact", without "description" annotations.
+    "compact-no-descriptions": {"compact": True, "strip_descriptions": True},
+}
+
+
+@functools.cache
+def get_prompt_schema(
+    mode: str = "full", components: frozenset[str] | None = None
+) -> str:
     """
-    Constructs the full prompt with UI instructions, rules, examples, and schema.
+    Renders the A2UI schema for the prompt.
+
+    Args:
+        mode: One of the keys of PROMPT_SCHEMA_MODES.
+        components: If set, only these catalog components are rendered (see
+            `get_catalog_components`).
+
+    Raises:
+        ValueError: If the mode or a component is unknown.
+    """
+    if mode not in PROMPT_SCHEMA_MODES:
+        raise ValueError(
+            f"Unknown prompt schema mode '{mode}'. "
+            f"Expected one of {sorted(PROMPT_SCHEMA_MODES)}."
+        )
+    if components is None:
+        if mode == "full":
+            return A2UI_SCHEMA
+        return render_schema(**PROMPT_SCHEMA_MODES[mode])
+    schema = subset_schema(A2UI_SCHEMA_OBJECT, components)
+    return render_schema(schema, **PROMPT_SCHEMA_MODES[mode])
+
+
+def get_catalog_components(
+    spec: str = "all", templates: dict[str, UITemplate] = UI_TEMPLATES
+) -> frozenset[str] | None:
+    """
+    Resolves which catalog components the agent may use.
+
+    Args:
+        spec: "all" for the whole catalog, "auto" for the components used by
+            `templates`, or a comma-separated list of component names.
+        templates: The UI example templates used for "auto".
+
+    Returns:
+        The component names, or None for the whole catalog.
+
+    Raises:
+        ValueError: If a component is not in the catalog.
+    """
+    spec = spec.strip()
+    if spec == "all":
+        return None
+    if spec == "auto":
+        components = frozenset().union(
+            *(template.components for template in templates.values())
+        )
+    else:
+        components = frozenset(name.strip() for name in spec.split(",") if name.strip())
+
+    unknown = components - set(A2UI_SCHEMA_OBJECT["components"])
+    if unknown:
+        raise ValueError(
+            f"Unknown catalog components {sorted(unknown)}. "
+            f"Expected any of {sorted(A2UI_SCHEMA_OBJECT['components'])}."
+        )
+    return components
+
+
+def get_ui_prompt_sections(
+    base_url: str, examples: str, schema: str = A2UI_SCHEMA
+) -> dict[str, str]:
+    """
+    Constructs the UI prompt as named sections, in prompt order.
 
     Args:
         base_url: The base URL for resolving static assets like logos.
         examples: A string containing the specific UI examples for the agent's task.
+        schema: The rendered A2UI schema (see `get_prompt_schema`).
 
     Returns:
-        A formatted string to be used as the system prompt for the LLM.
+        The "rules", "examples" and "schema" sections. Joined, they form the prompt
+        returned by `get_ui_prompt`.
     """
     # The f-string substitution for base_url happens here, at runtime.
     formatted_examples = examples.format(base_url=base_url)
 
-    return f"""
+    rules = f"""
     You are a helpful landscape design assistant. Your final output MUST be an a2ui UI JSON response.
 
     To generate the response, you MUST follow these rules:
@@ -62,12 +193,347 @@ def get_ui_prompt(base_url: str, examples: str) -> str:
     -   If the query is 'USER_SELECTED_OPTION', you MUST use the `SHOPPING_CART_EXAMPLE` template. Populate the `updateDataModel.contents` with items for the selected option.
     -   If the query is 'USER_CHECKED_OUT', you MUST use the `ORDER_CONFIRMATION_EXAMPLE` template.
 
-    {formatted_examples}
+    """
 
-    ---BEGIN A2UI JSON SCHEMA---
-    {A2UI_SCHEMA}
+    return {
+        "rules": rules,
+        "examples": _examples_section(formatted_examples),
+        "schema": f"""---BEGIN A2UI JSON SCHEMA---
+    {schema}
     ---END A2UI JSON SCHEMA---
+    """,
+    }
+
+
+def _examples_section(formatted_examples: str) -> str:
+    return f"{formatted_examples}\n\n    "
+
+
+def get_ui_prompt(base_url: str, examples: str, schema: str = A2UI_SCHEMA) -> str:
+    """
+    Constructs the full prompt with UI instructions, rules, examples, and schema.
+
+    Args:
+        base_url: The base URL for resolving static assets like logos.
+        examples: A string containing the specific UI examples for the agent's task.
+        schema: The rendered A2UI schema (see `get_prompt_schema`).
+
+    Returns:
+        A formatted string to be used as the system prompt for the LLM.
+    """
+    return "".join(get_ui_prompt_sections(base_url, examples, schema).values())
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """
+    Counts the tokens of a prompt section with LiteLLM's tokenizer for the model,
+    falling back to an estimate of 4 bytes per token.
+    """
+    try:
+        import litellm
+
+        return litellm.token_counter(model=model or "", text=text)
+    except Exception:
+        return len(text.encode("utf-8")) // 4
+
+
+def get_prompt_report(
+    sections: dict[str, str], model: str | None = None
+) -> list[dict[str, int | str]]:
+    """
+    Measures each prompt section.
+
+    Args:
+        sections: The prompt sections, e.g. from `get_ui_prompt_sections`.
+        model: The model whose tokenizer should be used for counting.
+
+    Returns:
+        One row per section, plus a "total" row, with its byte and token counts.
+    """
+    rows = [
+        {
+            "section": name,
+            "bytes": len(text.encode("utf-8")),
+            "tokens": count_tokens(text, model),
+        }
+        for name, text in sections.items()
+    ]
+    rows.append(
+        {
+            "section": "total",
+            "bytes": sum(row["bytes"] for row in rows),
+            "tokens": sum(row["tokens"] for row in rows),
+        }
+    )
+    return rows
+
+
+def log_prompt_report(sections: dict[str, str], model: str | None = None) -> None:
+    """Logs the byte and token counts of each prompt section."""
+    for row in get_prompt_report(sections, model):
+        logger.info(
+            f"  Prompt section {row['section']:<12} "
+            f"{row['bytes']:>8} bytes {row['tokens']:>8} tokens"
+        )
+
+
+def get_catalog_version(components: frozenset[str] | None) -> str:
+    """Identifies the schema and catalog subset a UI prompt was rendered from."""
+    catalog = ",".join(sorted(components)) if components is not None else "all"
+    return f"{A2UI_SCHEMA_SHA256[:12]}:{catalog}"
+
+
+# Stands for the base URL in the host-neutral sections of the "cache-friendly" layout.
+BASE_URL_PLACEHOLDER = "<BASE_URL>"
+
+# How the sections of the UI prompt are laid out.
+# - "default": the base URL is interpolated into the rules and examples, so only the
+#   agent instruction is the same for every host.
+# - "cache-friendly": the instruction, rules, examples and schema are rendered with
+#   BASE_URL_PLACEHOLDER and come first, byte for byte the same for every host. A
+#   short "host" section at the end gives the actual base URL. Before each model
+#   call, the agent keeps only the static part in the system instruction and
+#   inserts the rest as a user message before the current turn, so providers can
+#   cache the system instruction.
+PROMPT_LAYOUTS = ("default", "cache-friendly")
+
+
+def get_host_section(base_url: str) -> str:
+    """Renders the host-specific section of the "cache-friendly" layout."""
+    return f"""
+    --- HOST ---
+    In the rules and templates above, {BASE_URL_PLACEHOLDER} stands for the base URL {base_url}.
+    You MUST always write asset URLs in full, e.g. {base_url}/images/old_backyard.png, never with {BASE_URL_PLACEHOLDER}.
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderedPrompt:
+    """A system prompt rendered by the PromptRegistry."""
+
+    # (kind, layout, schema mode, base URL, catalog version, templates). kind is
+    # "ui" or "text", templates is "all" or the selected template names.
+    key: tuple[str, str, str, str, str, str]
+    sections: dict[str, str]
+    # The leading sections that are the same for every host, and the rest.
+    static_text: str
+    dynamic_text: str
+    text: str
+    sha256: str
+    # The sha256 of static_text. Prompts with the same cache key share a prefix
+    # that model-side prefix or context caches can reuse.
+    cache_key: str
+
+
+class PromptRegistry:
+    """
+    Renders each system prompt once, and shares it across agents.
+
+    Prompts are keyed by (kind, layout, schema mode, base URL, catalog version,
+    templates), so adding agents, serving the same host again or repeating an
+    action reuses the rendered prompt.
+    """
+
+    def __init__(self):
+        self._prompts: dict[tuple[str, ...], RenderedPrompt] = {}
+
+    def _get(
+        self, key, render_sections, static_sections, model: str | None
+    ) -> RenderedPrompt:
+        prompt = self._prompts.get(key)
+        if prompt is not None:
+            return prompt
+
+        sections = render_sections()
+        static_text = ""
+        for name in sections:
+            if name not in static_sections:
+                break
+            static_text += sections[name]
+        text = "".join(sections.values())
+        prompt = RenderedPrompt(
+            key=key,
+            sections=sections,
+            static_text=static_text,
+            dynamic_text=text[len(static_text) :],
+            text=text,
+            sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            cache_key=hashlib.sha256(static_text.encode("utf-8")).hexdigest(),
+        )
+        self._prompts[key] = prompt
+        logger.info(
+            f"--- Rendered prompt {key} (sha256 {prompt.sha256[:12]}, "
+            f"cache key {prompt.cache_key[:12]}, {len(static_text)} static bytes) ---"
+        )
+        log_prompt_report(sections, model)
+        return prompt
+
+    def get_ui_prompt(
+        self,
+        base_url: str,
+        schema_mode: str = "full",
+        components: frozenset[str] | None = None,
+        model: str | None = None,
+        layout: str = "default",
+        templates: tuple[str, ...] | None = None,
+    ) -> RenderedPrompt:
+        """
+        Returns the system prompt of the UI agent.
+
+        Args:
+            base_url: The base URL for resolving static assets like logos.
+            schema_mode: One of the keys of PROMPT_SCHEMA_MODES.
+            components: The catalog components to offer, or None for all of them.
+            model: The model whose tokenizer is used for the size report.
+            layout: One of PROMPT_LAYOUTS.
+            templates: The UI templates to include (see `get_action_templates`),
+                or None for LANDSCAPE_UI_EXAMPLES as is. With a selection, the
+                examples come after the schema, so that with the "cache-friendly"
+                layout the static part is the same for every selection.
+
+        Raises:
+            ValueError: If the layout is unknown.
+        """
+        if layout not in PROMPT_LAYOUTS:
+            raise ValueError(
+                f"Unknown prompt layout '{layout}'. Expected one of {PROMPT_LAYOUTS}."
+            )
+        schema = get_prompt_schema(schema_mode, components)
+        key = (
+            "ui",
+            layout,
+            schema_mode,
+            base_url,
+            get_catalog_version(components),
+            ",".join(templates) if templates is not None else "all",
+        )
+        # The host-neutral sections of the "cache-friendly" layout use a placeholder.
+        prompt_base_url = base_url if layout == "default" else BASE_URL_PLACEHOLDER
+
+        def render_sections() -> dict[str, str]:
+            sections = {
+                "instruction": AGENT_INSTRUCTION,
+                **get_ui_prompt_sections(prompt_base_url, LANDSCAPE_UI_EXAMPLES, schema),
+            }
+            if templates is not None:
+                del sections["examples"]
+                sections["examples"] = _examples_section(
+                    render_ui_examples(prompt_base_url, list(templates))
+                )
+            if layout == "cache-friendly":
+                sections["host"] = get_host_section(base_url)
+            return sections
+
+        if layout == "default":
+            static_sections = ("instruction",)
+        elif templates is not None:
+            static_sections = ("instruction", "rules", "schema")
+        else:
+            static_sections = ("instruction", "rules", "examples", "schema")
+        return self._get(key, render_sections, static_sections, model)
+
+    def get_text_prompt(self, model: str | None = None) -> RenderedPrompt:
+        """Returns the system prompt of the text-only agent."""
+        return self._get(
+            ("text", "", "", "", "", ""),
+            lambda: {"instruction": get_text_prompt()},
+            ("instruction",),
+            model,
+        )
+
+    def entries(self) -> list[RenderedPrompt]:
+        """Returns the prompts rendered so far, for inspection."""
+        return list(self._prompts.values())
+
+
+# The UI templates relevant to each client action, for the "per-action" examples
+# mode. Any other action, and free text, gets every template.
+# A2UI_ACTION_TEMPLATES can override entries with a JSON object of the same shape.
+ACTION_TEMPLATES: dict[str, tuple[str, ...]] = {
+    "start_project": ("PROJECT_DETAILS_EXAMPLE",),
+    "submit_details": ("QUESTIONNAIRE_EXAMPLE",),
+    "submit_questionnaire": ("OPTIONS_PRESENTATION_EXAMPLE",),
+    "select_option": ("SHOPPING_CART_EXAMPLE",),
+    "checkout": ("ORDER_CONFIRMATION_EXAMPLE",),
+}
+
+# Which UI templates go into the prompt.
+# - "all": every template, for every request.
+# - "per-action": only the templates in ACTION_TEMPLATES for the client action.
+PROMPT_EXAMPLES_MODES = ("all", "per-action")
+
+
+def load_action_templates(
+    overrides: str | None = None, templates: dict[str, UITemplate] = UI_TEMPLATES
+) -> dict[str, tuple[str, ...]]:
     """
+    Returns ACTION_TEMPLATES with the given overrides applied.
+
+    Args:
+        overrides: A JSON object of action name -> list of template names, e.g.
+            the value of A2UI_ACTION_TEMPLATES.
+        templates: The template index the names must be in.
+
+    Raises:
+        ValueError: If the overrides are malformed or name an unknown template.
+    """
+    mapping = dict(ACTION_TEMPLATES)
+    if overrides:
+        try:
+            parsed = json.loads(overrides)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid action templates JSON: {e}") from e
+        if not isinstance(parsed, dict):
+            raise ValueError("Action templates must be a JSON object.")
+        mapping.update({action: tuple(names) for action, names in parsed.items()})
+
+    for action, names in mapping.items():
+        unknown = set(names) - set(templates)
+        if unknown:
+            raise ValueError(
+                f"Unknown UI templates {sorted(unknown)} for action '{action}'. "
+                f"Expected any of {list(templates)}."
+            )
+    return mapping
+
+
+def get_action_templates(
+    action: str | None,
+    mapping: dict[str, tuple[str, ...]] = ACTION_TEMPLATES,
+    templates: dict[str, UITemplate] = UI_TEMPLATES,
+) -> tuple[str, ...]:
+    """Returns the UI templates for a client action, or every template."""
+    return mapping.get(action) or tuple(templates)
+
+
+# Hooks that return extra LiteLLM completion arguments for a system prompt, for
+# example an explicit context-cache handle for `prompt.cache_key`. Each hook is
+# called with the rendered prompt and the model name.
+ContextCacheHook = Callable[[RenderedPrompt, str], dict[str, Any]]
+_CONTEXT_CACHE_HOOKS: list[ContextCacheHook] = []
+
+
+def register_context_cache_hook(hook: ContextCacheHook) -> ContextCacheHook:
+    """Registers a context cache hook. Can be used as a decorator."""
+    _CONTEXT_CACHE_HOOKS.append(hook)
+    return hook
+
+
+def get_context_cache_kwargs(prompt: RenderedPrompt, model: str) -> dict[str, Any]:
+    """Returns the LiteLLM completion arguments of every context cache hook."""
+    kwargs = {}
+    for hook in _CONTEXT_CACHE_HOOKS:
+        kwargs.update(hook(prompt, model))
+    return kwargs
+
+
+@register_context_cache_hook
+def _cache_control_hook(prompt: RenderedPrompt, model: str) -> dict[str, Any]:
+    # LiteLLM marks the system message with `cache_control` for providers that
+    # support explicit prompt caching, e.g. Anthropic and Gemini.
+    if os.getenv("A2UI_PROMPT_CACHE_CONTROL", "false").lower() != "true":
+        return {}
+    return {"cache_control_injection_points": [{"location": "message", "index": 0}]}
 
 
 def get_text_prompt() -> str:
@@ -89,6 +555,41 @@ def get_text_prompt() -> str:
     """
 
 
+def get_repair_prompt(failures: list[tuple[str, str, Any]], schema: str) -> str:
+    """
+    Constructs the prompt asking the LLM to correct invalid A2UI messages.
+
+    Only the invalid messages are sent back, so the corrected response is as long
+    as the messages to fix rather than the whole screen.
+
+    Args:
+        failures: For each invalid message, in order: the JSON path of the error
+            in the response, the error message, and the message itself.
+        schema: The rendered A2UI schema (see `get_prompt_schema`).
+    """
+    messages = "".join(
+        f"""
+    ---INVALID MESSAGE {number}---
+    Error at {path}: {error}
+    {json.dumps(message)}
+    """
+        for number, (path, error, message) in enumerate(failures, 1)
+    )
+    return f"""
+    The following A2UI messages you generated do not validate against the A2UI JSON SCHEMA.
+    Correct only the reported errors and keep everything else unchanged.
+    Your response MUST be a JSON list of the {len(failures)} corrected messages, in the same order, and nothing else.
+    {messages}
+    ---BEGIN A2UI JSON SCHEMA---
+    {schema}
+    ---END A2UI JSON SCHEMA---
+    """
+
+
+# The process-wide prompt registry.
+PROMPT_REGISTRY = PromptRegistry()
+
+
 if __name__ == "__main__":
     # Example of how to use the prompt builder
     # In your actual application, you would call this from your main agent logic.
@@ -105,3 +606,37 @@ if __name__ == "__main__":
     with open("generated_prompt.txt", "w") as f:
         f.write(restaurant_prompt)
     print("\nGenerated prompt saved to generated_prompt.txt")
+
+    # Compare the size of the prompt for each schema rendering mode.
+    for mode in PROMPT_SCHEMA_MODES:
+        print(f"\nPrompt size with schema mode '{mode}':")
+        sections = get_ui_prompt_sections(
+            my_base_url, LANDSCAPE_UI_EXAMPLES, get_prompt_schema(mode)
+        )
+        for row in get_prompt_report(sections):
+            print(f"  {row['section']:<12} {row['bytes']:>8} bytes {row['tokens']:>8} tokens")
+
+    # Compare again with only the components used by the example templates.
+    components = get_catalog_components("auto")
+    for mode in PROMPT_SCHEMA_MODES:
+        print(f"\nPrompt size with schema mode '{mode}' and catalog {sorted(components)}:")
+        sections = get_ui_prompt_sections(
+            my_base_url, LANDSCAPE_UI_EXAMPLES, get_prompt_schema(mode, components)
+        )
+        for row in get_prompt_report(sections):
+            print(f"  {row['section']:<12} {row['bytes']:>8} bytes {row['tokens']:>8} tokens")
+
+    # The prompt registry renders each prompt once and keeps it for inspection.
+    PROMPT_REGISTRY.get_ui_prompt(my_base_url)
+    PROMPT_REGISTRY.get_ui_prompt(my_base_url, "compact", components)
+    # With the "cache-friendly" layout, prompts for different hosts share a cache key.
+    for host in (my_base_url, "http://10.0.2.2:10002"):
+        PROMPT_REGISTRY.get_ui_prompt(host, layout="cache-friendly")
+    PROMPT_REGISTRY.get_text_prompt()
+    print("\nPrompt registry:")
+    for prompt in PROMPT_REGISTRY.entries():
+        print(
+            f"  {prompt.sha256[:12]} cache key {prompt.cache_key[:12]} "
+            f"{len(prompt.static_text):>8} static bytes "
+            f"{len(prompt.text):>8} bytes {prompt.key}"
+        )
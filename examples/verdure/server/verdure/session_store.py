@@ -0,0 +1,249 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file bounds the memory used by the ADK sessions of a long-running server.
+# The in-memory session service keeps every conversation, including uploaded image
+# bytes and full UI JSON responses, until the process exits. The bounded service
+# evicts sessions, least recently used first, when:
+# - a session has been idle for longer than the TTL
+# - there are more sessions than the maximum count
+# - the approximate size of all session events exceeds the byte budget
+# An evicted conversation starts over with an empty history on its next turn.
+# Sessions with a request in progress, and scratch sessions, are never evicted.
+
+import collections
+import contextlib
+import dataclasses
+import logging
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+
+logger = logging.getLogger(__name__)
+
+# Marks the ids of the short-lived scratch copies of a session that retries and
+# hedges run in. Persistent stores keep them in memory.
+SCRATCH_SESSION_MARKER = ":scratch:"
+
+
+def estimate_event_bytes(event: Event) -> int:
+    """Returns the approximate memory used by the content of an event."""
+    if not event.content or not event.content.parts:
+        return 0
+    size = 0
+    for part in event.content.parts:
+        if part.inline_data and part.inline_data.data:
+            size += len(part.inline_data.data)
+        elif part.text:
+            size += len(part.text.encode())
+        else:
+            # Function calls and responses.
+            size += len(part.model_dump_json(exclude_none=True))
+    return size
+
+
+@dataclasses.dataclass
+class _Entry:
+    last_access: float
+    size: int = 0
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """An InMemorySessionService with LRU and TTL eviction."""
+
+    def __init__(
+        self,
+        max_sessions: int | None = None,
+        idle_ttl: float | None = None,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_sessions: The most sessions to keep, or None for no limit.
+            idle_ttl: Seconds after their last access to evict sessions at, or
+                None for no limit.
+            max_bytes: The approximate byte budget of all session events, or
+                None for no limit.
+            clock: Returns the current time in seconds.
+        """
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        # (app name, user id, session id) -> entry, least recently used first.
+        self._entries: collections.OrderedDict[tuple[str, str, str], _Entry] = (
+            collections.OrderedDict()
+        )
+        self._total_bytes = 0
+        # The number of requests in progress on each session, which is never
+        # evicted meanwhile.
+        self._holds: collections.Counter[tuple[str, str, str]] = (
+            collections.Counter()
+        )
+        self.evictions = collections.Counter()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Returns the session count, approximate size and evictions by reason."""
+        return {
+            "sessions": len(self._entries),
+            "bytes": self._total_bytes,
+            "evictions": dict(self.evictions),
+        }
+
+    @contextlib.contextmanager
+    def hold(self, *, app_name: str, user_id: str, session_id: str) -> Iterator[None]:
+        """Keeps a session from being evicted while a request is using it."""
+        key = (app_name, user_id, session_id)
+        self._holds[key] += 1
+        try:
+            yield
+        finally:
+            self._holds[key] -= 1
+            if not self._holds[key]:
+                del self._holds[key]
+
+    def _touch(self, key: tuple[str, str, str], size: int = 0) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry(last_access=self._clock())
+        entry.last_access = self._clock()
+        entry.size += size
+        self._total_bytes += size
+        self._entries.move_to_end(key)
+
+    def _evict(self, keep: tuple[str, str, str] | None = None) -> None:
+        """Evicts sessions until the limits are met, except `keep` and held ones."""
+        expired_before = (
+            self._clock() - self.idle_ttl if self.idle_ttl is not None else None
+        )
+        excess_count = (
+            len(self._entries) - self.max_sessions
+            if self.max_sessions is not None
+            else 0
+        )
+        excess_bytes = (
+            self._total_bytes - self.max_bytes if self.max_bytes is not None else 0
+        )
+        # The entries are in last access order, so the expired ones come first
+        # and the walk stops at the first one that can stay.
+        evicted = []
+        for key, entry in self._entries.items():
+            expired = expired_before is not None and entry.last_access < expired_before
+            if not expired and excess_count <= 0 and excess_bytes <= 0:
+                break
+            if key == keep or self._holds[key]:
+                continue
+            if expired:
+                reason = "ttl"
+            elif excess_count > 0:
+                reason = "count"
+            else:
+                reason = "bytes"
+            evicted.append((key, reason))
+            excess_count -= 1
+            excess_bytes -= entry.size
+        for key, reason in evicted:
+            self._evict_session(key, reason)
+
+    def _evict_session(self, key: tuple[str, str, str], reason: str) -> None:
+        app_name, user_id, session_id = key
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+        self.sessions.get(app_name, {}).get(user_id, {}).pop(session_id, None)
+        self.evictions[reason] += 1
+        logger.info(
+            f"--- SessionStore: Evicted session {session_id} ({reason}, "
+            f"{entry.size} bytes). {len(self._entries)} sessions, "
+            f"{self._total_bytes} bytes left. ---"
+        )
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> Session:
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        if SCRATCH_SESSION_MARKER in session.id:
+            # Deleted by the request that created it, and never evicted.
+            return session
+        key = (app_name, user_id, session.id)
+        self._touch(key)
+        self._evict(keep=key)
+        return session
+
+    async def get_session(
+        self, *, app_name: str, user_id: str, session_id: str, config=None
+    ) -> Session | None:
+        key = (app_name, user_id, session_id)
+        # Expired sessions are not returned, even if not evicted yet.
+        self._evict()
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None and key in self._entries:
+            self._touch(key)
+        return session
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        entry = self._entries.pop((app_name, user_id, session_id), None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    async def delete_invocations(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        invocation_ids: set[str],
+    ) -> None:
+        """
+        Deletes the events of some invocations of a session, e.g. those of a
+        discarded response. The state changes they made are kept.
+        """
+        session = self.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+        if session is None:
+            return
+        removed = [e for e in session.events if e.invocation_id in invocation_ids]
+        session.events = [
+            e for e in session.events if e.invocation_id not in invocation_ids
+        ]
+        entry = self._entries.get((app_name, user_id, session_id))
+        if entry is not None:
+            size = sum(estimate_event_bytes(event) for event in removed)
+            entry.size -= size
+            self._total_bytes -= size
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        key = (session.app_name, session.user_id, session.id)
+        if not event.partial and key in self._entries:
+            self._touch(key, estimate_event_bytes(event))
+            self._evict(keep=key)
+        return event
@@ -0,0 +1,518 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file stores the ADK sessions and the A2A tasks in a local SQLite database,
+# so that several server processes on one machine can share conversations and
+# conversations survive restarts.
+# - The database is in WAL mode, so readers do not block the writer, and every
+#   process can open it.
+# - Reads run on a small pool of connections, in worker threads.
+# - Writes go through a single writer per process. The writes queued while a
+#   transaction commits are committed together in the next one.
+# - Sessions, events and tasks are looked up by their primary keys.
+# Scratch sessions (see `session_store.SCRATCH_SESSION_MARKER`) are short-lived
+# and stay in memory.
+
+import asyncio
+import functools
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import TaskStore
+from a2a.types import Task
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+from google.adk.sessions.state import State
+from session_store import SCRATCH_SESSION_MARKER
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# The most queued writes committed in one transaction.
+_MAX_BATCH_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    create_time REAL NOT NULL,
+    update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id, session_id, seq)
+);
+CREATE TABLE IF NOT EXISTS app_states (
+    app_name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_states (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    context_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    update_time REAL NOT NULL
+);
+"""
+
+
+class SqliteDatabase:
+    """A SQLite database in WAL mode, shared by the stores of a process."""
+
+    def __init__(self, path: str, pool_size: int = 4):
+        """
+        Args:
+            path: The database file. It is created if needed.
+            pool_size: The number of connections for reads.
+        """
+        self.path = path
+        self._readers = [self._connect() for _ in range(pool_size)]
+        self._writer = self._connect()
+        self._writer.executescript(_SCHEMA)
+        self._pool: asyncio.Queue[sqlite3.Connection] | None = None
+        self._writes: asyncio.Queue | None = None
+        self._writer_task: asyncio.Task | None = None
+        logger.info(f"--- SqliteDatabase: Opened {path} ---")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Transactions are managed explicitly, in autocommit mode.
+        connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Durable at checkpoints, which is enough for WAL mode.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _start(self) -> None:
+        # The queues and the writer task belong to the running event loop.
+        loop = asyncio.get_running_loop()
+        if self._writer_task is not None and self._writer_task.get_loop() is loop:
+            return
+        self._pool = asyncio.Queue()
+        for connection in self._readers:
+            self._pool.put_nowait(connection)
+        self._writes = asyncio.Queue()
+        self._writer_task = loop.create_task(self._write_batches())
+
+    async def read(self, query: Callable[[sqlite3.Connection], T]) -> T:
+        """Runs `query` with a pooled connection, in a worker thread."""
+        self._start()
+        connection = await self._pool.get()
+        try:
+            return await asyncio.to_thread(query, connection)
+        finally:
+            self._pool.put_nowait(connection)
+
+    async def write(self, statements: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Runs `statements` in a write transaction, batched with the other writes
+        queued meanwhile, and waits for the commit.
+        """
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        self._writes.put_nowait((statements, future))
+        return await future
+
+    async def _write_batches(self) -> None:
+        while True:
+            batch = [await self._writes.get()]
+            while len(batch) < _MAX_BATCH_SIZE and not self._writes.empty():
+                batch.append(self._writes.get_nowait())
+            try:
+                results = await asyncio.to_thread(self._commit, batch)
+            except Exception as e:
+                logger.error(f"--- SqliteDatabase: Write batch failed: {e} ---")
+                results = [e] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _commit(self, batch: list) -> list[Any]:
+        results = []
+        self._writer.execute("BEGIN IMMEDIATE")
+        try:
+            for statements, _ in batch:
+                # A failing write is rolled back alone.
+                self._writer.execute("SAVEPOINT write")
+                try:
+                    results.append(statements(self._writer))
+                    self._writer.execute("RELEASE write")
+                except Exception as e:
+                    self._writer.execute("ROLLBACK TO write")
+                    self._writer.execute("RELEASE write")
+                    results.append(e)
+            self._writer.execute("COMMIT")
+        except BaseException:
+            self._writer.execute("ROLLBACK")
+            raise
+        return results
+
+
+@functools.cache
+def open_database(path: str) -> SqliteDatabase:
+    """Opens a database once per process, to share it between the stores."""
+    return SqliteDatabase(path)
+
+
+def _split_state(state: dict[str, Any]) -> tuple[dict, dict, dict]:
+    """Splits a state (delta) into its app, user and session parts."""
+    app, user, session = {}, {}, {}
+    for key, value in state.items():
+        if key.startswith(State.APP_PREFIX):
+            app[key.removeprefix(State.APP_PREFIX)] = value
+        elif key.startswith(State.USER_PREFIX):
+            user[key.removeprefix(State.USER_PREFIX)] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session[key] = value
+    return app, user, session
+
+
+def _merge_state(stored: str | None, delta: dict[str, Any]) -> str:
+    """
+    Returns a stored state with the keys of `delta` set. As in the ADK session
+    services, a key is replaced as a whole, even if both values are objects, and
+    a None value is kept.
+    """
+    state = json.loads(stored) if stored else {}
+    state.update(delta)
+    return json.dumps(state)
+
+
+def _update_shared_state(
+    connection: sqlite3.Connection,
+    app_name: str,
+    user_id: str,
+    app_delta: dict[str, Any],
+    user_delta: dict[str, Any],
+) -> None:
+    # Runs in the write transaction, so no other process updates the state
+    # between the read and the write.
+    if app_delta:
+        row = connection.execute(
+            "SELECT state FROM app_states WHERE app_name = ?", (app_name,)
+        ).fetchone()
+        connection.execute(
+            "INSERT OR REPLACE INTO app_states VALUES (?, ?)",
+            (app_name, _merge_state(row and row[0], app_delta)),
+        )
+    if user_delta:
+        row = connection.execute(
+            "SELECT state FROM user_states WHERE app_name = ? AND user_id = ?",
+            (app_name, user_id),
+        ).fetchone()
+        connection.execute(
+            "INSERT OR REPLACE INTO user_states VALUES (?, ?, ?)",
+            (app_name, user_id, _merge_state(row and row[0], user_delta)),
+        )
+
+
+class SqliteSessionService(BaseSessionService):
+    """An ADK session service backed by a SqliteDatabase."""
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+        self._scratch = InMemorySessionService()
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> Session:
+        if session_id and SCRATCH_SESSION_MARKER in session_id:
+            return await self._scratch.create_session(
+                app_name=app_name, user_id=user_id, state=state, session_id=session_id
+            )
+        session_id = (session_id or "").strip() or str(uuid.uuid4())
+        app_delta, user_delta, session_state = _split_state(state or {})
+        now = time.time()
+
+        def insert(connection: sqlite3.Connection) -> None:
+            try:
+                connection.execute(
+                    "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                    (app_name, user_id, session_id, json.dumps(session_state), now, now),
+                )
+            except sqlite3.IntegrityError as e:
+                raise AlreadyExistsError(
+                    f"Session with id {session_id} already exists."
+                ) from e
+            _update_shared_state(connection, app_name, user_id, app_delta, user_delta)
+
+        await self._db.write(insert)
+        session = await self.get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: GetSessionConfig | None = None,
+    ) -> Session | None:
+        if SCRATCH_SESSION_MARKER in session_id:
+            return await self._scratch.get_session(
+                app_name=app_name, user_id=user_id, session_id=session_id, config=config
+            )
+
+        def select(connection: sqlite3.Connection):
+            row = connection.execute(
+                "SELECT state, update_time FROM sessions "
+                "WHERE app_name = ? AND user_id = ? AND id = ?",
+                (app_name, user_id, session_id),
+            ).fetchone()
+            if row is None:
+                return None
+            query = (
+                "SELECT data FROM events "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ?"
+            )
+            params = [app_name, user_id, session_id]
+            if config and config.after_timestamp:
+                query += " AND timestamp >= ?"
+                params.append(config.after_timestamp)
+            query += " ORDER BY seq DESC"
+            if config and config.num_recent_events:
+                query += " LIMIT ?"
+                params.append(config.num_recent_events)
+            events = connection.execute(query, params).fetchall()
+            return row, events[::-1], self._select_shared_state(
+                connection, app_name, user_id
+            )
+
+        result = await self._db.read(select)
+        if result is None:
+            return None
+        (state, update_time), events, shared_state = result
+        return Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state={**json.loads(state), **shared_state},
+            events=[Event.model_validate_json(data) for (data,) in events],
+            last_update_time=update_time,
+        )
+
+    @staticmethod
+    def _select_shared_state(
+        connection: sqlite3.Connection, app_name: str, user_id: str
+    ) -> dict[str, Any]:
+        state = {}
+        row = connection.execute(
+            "SELECT state FROM app_states WHERE app_name = ?", (app_name,)
+        ).fetchone()
+        if row:
+            state.update(
+                {State.APP_PREFIX + k: v for k, v in json.loads(row[0]).items()}
+            )
+        row = connection.execute(
+            "SELECT state FROM user_states WHERE app_name = ? AND user_id = ?",
+            (app_name, user_id),
+        ).fetchone()
+        if row:
+            state.update(
+                {State.USER_PREFIX + k: v for k, v in json.loads(row[0]).items()}
+            )
+        return state
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: str | None = None
+    ) -> ListSessionsResponse:
+        def select(connection: sqlite3.Connection):
+            query = "SELECT user_id, id, state, update_time FROM sessions WHERE app_name = ?"
+            params = [app_name]
+            if user_id is not None:
+                query += " AND user_id = ?"
+                params.append(user_id)
+            return [
+                (row, self._select_shared_state(connection, app_name, row[0]))
+                for row in connection.execute(query, params).fetchall()
+            ]
+
+        rows = await self._db.read(select)
+        return ListSessionsResponse(
+            sessions=[
+                Session(
+                    app_name=app_name,
+                    user_id=row_user_id,
+                    id=session_id,
+                    state={**json.loads(state), **shared_state},
+                    last_update_time=update_time,
+                )
+                for (row_user_id, session_id, state, update_time), shared_state in rows
+            ]
+        )
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        if SCRATCH_SESSION_MARKER in session_id:
+            await self._scratch.delete_session(
+                app_name=app_name, user_id=user_id, session_id=session_id
+            )
+            return
+
+        def delete(connection: sqlite3.Connection) -> None:
+            key = (app_name, user_id, session_id)
+            connection.execute(
+                "DELETE FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                key,
+            )
+            connection.execute(
+                "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?", key
+            )
+
+        await self._db.write(delete)
+
+    async def delete_invocations(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        invocation_ids: set[str],
+    ) -> None:
+        """
+        Deletes the events of some invocations of a session, e.g. those of a
+        discarded response. The state changes they made are kept.
+        """
+        if SCRATCH_SESSION_MARKER in session_id:
+            raise ValueError("Events cannot be deleted from scratch sessions.")
+        if not invocation_ids:
+            return
+
+        def delete(connection: sqlite3.Connection) -> None:
+            connection.executemany(
+                "DELETE FROM events WHERE app_name = ? AND user_id = ? "
+                "AND session_id = ? AND json_extract(data, '$.invocation_id') = ?",
+                [
+                    (app_name, user_id, session_id, invocation_id)
+                    for invocation_id in invocation_ids
+                ],
+            )
+
+        await self._db.write(delete)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if SCRATCH_SESSION_MARKER in session.id:
+            return await self._scratch.append_event(session, event)
+        if event.partial:
+            return event
+        event = await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+        state_delta = event.actions.state_delta if event.actions else {}
+        app_delta, user_delta, session_delta = _split_state(state_delta or {})
+        data = event.model_dump_json(exclude_none=True)
+        key = (session.app_name, session.user_id, session.id)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            row = connection.execute(
+                "SELECT state FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                logger.warning(
+                    f"--- SqliteSessionService: Session {session.id} not found. ---"
+                )
+                return
+            connection.execute(
+                "UPDATE sessions SET state = ?, update_time = ? "
+                "WHERE app_name = ? AND user_id = ? AND id = ?",
+                (_merge_state(row[0], session_delta), event.timestamp, *key),
+            )
+            connection.execute(
+                "INSERT INTO events SELECT ?, ?, ?, COALESCE(MAX(seq) + 1, 0), ?, ? "
+                "FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                (*key, event.timestamp, data, *key),
+            )
+            _update_shared_state(
+                connection, session.app_name, session.user_id, app_delta, user_delta
+            )
+
+        await self._db.write(insert)
+        return event
+
+
+class SqliteTaskStore(TaskStore):
+    """An A2A task store backed by a SqliteDatabase."""
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        data = task.model_dump_json(exclude_none=True)
+
+        def upsert(connection: sqlite3.Connection) -> None:
+            connection.execute(
+                "INSERT INTO tasks VALUES (?, ?, ?, ?) ON CONFLICT (id) DO UPDATE "
+                "SET context_id = excluded.context_id, data = excluded.data, "
+                "update_time = excluded.update_time",
+                (task.id, task.context_id, data, time.time()),
+            )
+
+        await self._db.write(upsert)
+
+    async def get(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> Task | None:
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                "SELECT data FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        )
+        return Task.model_validate_json(row[0]) if row else None
+
+    async def delete(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> None:
+        await self._db.write(
+            lambda connection: connection.execute(
+                "DELETE FROM tasks WHERE id = ?", (task_id,)
+            )
+        )
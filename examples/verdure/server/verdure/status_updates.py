@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file coalesces the intermediate updates of a turn before they are sent to
+# the client as `working` status updates. Without it every streamed token and every
+# intermediate ADK event becomes its own SSE event and client re-render.
+# - A status (e.g. "calling tool") is sent right away, after the text streamed
+#   before it, unless it is equal to the last one sent.
+# - Text is sent at most once per minimum interval. Deltas that arrive sooner are
+#   concatenated, and go out with the next delta after the interval, or with the
+#   next status, A2UI message or final response, whichever comes first.
+# Text deltas are marked with TEXT_DELTA_METADATA, so that the client appends them
+# as they are, spaces and line breaks included. The final response leaves out the
+# text already streamed, which the client would otherwise show twice.
+
+import time
+from collections.abc import Callable
+
+from a2a.types import TextPart
+
+# The metadata of a TextPart that continues the text streamed before it.
+TEXT_DELTA_METADATA = {"a2uiTextDelta": True}
+
+
+class StatusUpdateCoalescer:
+    """Coalesces the status and text updates of one turn."""
+
+    def __init__(
+        self,
+        min_interval: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._min_interval = min_interval
+        self._clock = clock
+        self._last_sent_at: float | None = None
+        self._last_status: str | None = None
+        self._pending_text = ""
+
+    def add_status(self, status: str) -> list[TextPart]:
+        """
+        Adds a status, such as "Looking up landscape options...".
+
+        Returns:
+            The parts to send now, in order, or an empty list.
+        """
+        if status == self._last_status:
+            return []
+        self._last_status = status
+        return self._send([TextPart(text=status)])
+
+    def add_text(self, delta: str) -> list[TextPart]:
+        """
+        Adds a delta of the streamed conversational text.
+
+        Returns:
+            The parts to send now, in order, or an empty list.
+        """
+        self._pending_text += delta
+        if (
+            self._last_sent_at is not None
+            and self._clock() - self._last_sent_at < self._min_interval
+        ):
+            return []
+        return self._send([])
+
+    def flush(self) -> list[TextPart]:
+        """Returns the pending text, e.g. before an A2UI message is sent."""
+        if not self._pending_text:
+            return []
+        return self._send([])
+
+    def _send(self, parts: list[TextPart]) -> list[TextPart]:
+        # The text streamed so far goes before the status that follows it.
+        if self._pending_text:
+            parts.insert(
+                0,
+                TextPart(text=self._pending_text, metadata=dict(TEXT_DELTA_METADATA)),
+            )
+            self._pending_text = ""
+        self._last_sent_at = self._clock()
+        return parts
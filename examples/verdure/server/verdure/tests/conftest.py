@@ -0,0 +1,62 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# The server modules import each other as top-level modules, as they do when the
+# server runs from this directory, so the tests import them the same way.
+# The agent tests replace the LLM with fakes.FakeLlm, which answers from a script.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Keeps LiteLLM from downloading its model list when counting tokens.
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+from fakes import BASE_URL, FakeLlm
+
+
+@pytest.fixture
+def make_agent(monkeypatch):
+    """Returns a function that builds a LandscapeAgent on a FakeLlm."""
+    monkeypatch.setenv("A2UI_TARGETED_REPAIR", "false")
+    monkeypatch.delenv("A2UI_SQLITE_PATH", raising=False)
+
+    def make(**env: str):
+        from agent import LandscapeAgent
+
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        agent = LandscapeAgent(base_url=BASE_URL)
+        agent._agent.model = FakeLlm(model="fake", script={}, requests=[])
+        return agent
+
+    return make
+
+
+@pytest.fixture
+def make_executor(make_agent, monkeypatch):
+    """Returns a function that builds a LandscapeAgentExecutor on a FakeLlm."""
+
+    def make(**env: str):
+        from agent_executor import LandscapeAgentExecutor
+
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        executor = LandscapeAgentExecutor(base_url=BASE_URL)
+        executor.agent = make_agent()
+        return executor
+
+    return make
@@ -0,0 +1,87 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Fakes of the LLM and its responses, for the agent and executor tests.
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from ui_examples import UI_TEMPLATES
+
+BASE_URL = "http://localhost:10002"
+
+
+def ui_response(
+    text: str,
+    template_name: str = "SHOPPING_CART_EXAMPLE",
+    mutate: Callable[[list[Any]], None] | None = None,
+) -> str:
+    """Returns a UI response in the LLM's format, with a template's messages."""
+    messages = UI_TEMPLATES[template_name].render(BASE_URL)
+    if mutate:
+        mutate(messages)
+    return f"{text}\n---a2ui_JSON---\n```json\n{json.dumps(messages, indent=1)}\n```"
+
+
+def invalid_ui_response(text: str) -> str:
+    """Returns a UI response whose first message fails validation."""
+
+    def mutate(messages: list[Any]) -> None:
+        messages[0]["createSurface"]["surfaceId"] = 5
+
+    return ui_response(text, mutate=mutate)
+
+
+class FakeLlm(BaseLlm):
+    """Answers each model call with the next scripted response for its query."""
+
+    # For each query, the (response, seconds) of its next calls. A call is
+    # matched by the first query its last user message contains, so retry
+    # prompts, which quote the query, get the same script.
+    script: dict[str, list[tuple[str, float]]] = {}
+    # The requests received.
+    requests: list[Any] = []
+    # The characters of a streamed chunk.
+    chunk_size: int = 200
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        self.requests.append(llm_request)
+        message = next(
+            "".join(part.text or "" for part in content.parts or [])
+            for content in reversed(llm_request.contents)
+            if content.role == "user"
+        )
+        query = next(query for query in self.script if query in message)
+        text, seconds = self.script[query].pop(0)
+        if stream:
+            chunks = [
+                text[start : start + self.chunk_size]
+                for start in range(0, len(text), self.chunk_size)
+            ]
+            for chunk in chunks:
+                await asyncio.sleep(seconds / len(chunks))
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=chunk)]),
+                    partial=True,
+                )
+        else:
+            await asyncio.sleep(seconds)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)])
+        )
@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+from a2ui_repair import repair_a2ui_json, repair_a2ui_response
+from a2ui_stream import A2UI_DELIMITER
+
+MESSAGES = [
+    {"version": "v0.9", "createSurface": {"surfaceId": "s", "catalogId": "c"}},
+    {"version": "v0.9", "updateDataModel": {"surfaceId": "s", "value": {"t": "{{x}}"}}},
+]
+JSON = json.dumps(MESSAGES)
+
+
+def test_well_formed_response_needs_no_repair():
+    response = repair_a2ui_response(f"Hello.\n{A2UI_DELIMITER}\n```json\n{JSON}\n```")
+
+    assert response.text == "Hello.\n"
+    assert response.messages == MESSAGES
+    assert response.repairs == []
+
+
+@pytest.mark.parametrize(
+    "content, repair",
+    [
+        (f"Hello.\n```json\n{JSON}\n```", "added the missing delimiter"),
+        (f"Hello.\n{A2UI_DELIMITER}\n```json\n```json\n{JSON}\n```\n```", "duplicated"),
+        (f"Hello.\n{A2UI_DELIMITER}\n{JSON}\n```", "stray closing code fence"),
+        (f"Hello.\n{A2UI_DELIMITER}\n```json\n{JSON}", "unclosed code fence"),
+        (f"Hello.\n{A2UI_DELIMITER}\n{JSON}\nEnjoy!", "removed text after the JSON"),
+        (f"Hello.\n{A2UI_DELIMITER}\n{JSON[:-1]},]", "trailing comma"),
+        (f"Hello.\n{A2UI_DELIMITER}\n{JSON[:-1]}, {{\"version\": ", "truncated list"),
+        (f"Hello.\n{A2UI_DELIMITER}\n{JSON}{A2UI_DELIMITER}", "repeated delimiter"),
+    ],
+)
+def test_formatting_mistakes_are_repaired(content, repair):
+    response = repair_a2ui_response(content)
+
+    assert response.messages == MESSAGES
+    assert any(repair in applied for applied in response.repairs)
+    assert repair_a2ui_response(response.content).repairs == []
+
+
+def test_doubled_braces_are_undoubled_outside_strings():
+    doubled = JSON.replace("{", "{{").replace("}", "}}").replace('"{{{{x}}}}"', '"{{x}}"')
+
+    messages = repair_a2ui_json(doubled)
+
+    assert messages == MESSAGES
+
+
+def test_single_message_is_wrapped_in_a_list():
+    repairs = []
+
+    assert repair_a2ui_json(json.dumps(MESSAGES[0]), repairs) == MESSAGES[:1]
+    assert repairs == ["wrapped a single message in a list"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "Just text, no UI.",
+        f"Hello.\n{A2UI_DELIMITER}\n",
+        f"Hello.\n{A2UI_DELIMITER}\nSorry, no UI.",
+        f"Hello.\n{A2UI_DELIMITER}\n[{{\"version\": ",
+    ],
+)
+def test_unrepairable_responses_are_rejected(content):
+    with pytest.raises(ValueError):
+        repair_a2ui_response(content)
@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+from a2ui_stream import A2UI_DELIMITER, A2uiStreamParser, get_response_text
+
+MESSAGES = [
+    {"version": "v0.9", "createSurface": {"surfaceId": "s", "catalogId": "c"}},
+    {"version": "v0.9", "deleteSurface": {"surfaceId": "s {\\\"]"}},
+]
+RESPONSE = f"Here it is.\n{A2UI_DELIMITER}\n```json\n{json.dumps(MESSAGES)}\n```"
+
+
+def _feed(parser: A2uiStreamParser, response: str, chunk_size: int) -> list:
+    messages = []
+    for start in range(0, len(response), chunk_size):
+        messages += parser.feed(response[start : start + chunk_size])
+    return messages
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(RESPONSE)])
+def test_messages_are_returned_whole(chunk_size):
+    parser = A2uiStreamParser()
+
+    assert _feed(parser, RESPONSE, chunk_size) == MESSAGES
+    assert parser.json_started
+    assert parser.stopped
+    assert parser.text == "Here it is.\n"
+
+
+def test_message_is_returned_when_its_brace_arrives():
+    parser = A2uiStreamParser()
+    first = json.dumps(MESSAGES[0])
+
+    assert parser.feed(f"Hi\n{A2UI_DELIMITER}\n[{first[:-1]}") == []
+    assert parser.feed("}, {") == [MESSAGES[0]]
+
+
+@pytest.mark.parametrize("end", ["-", "---a2", "`", "``"])
+def test_text_holds_back_a_possible_delimiter_or_fence(end):
+    parser = A2uiStreamParser()
+    parser.feed(f"Pick one {end}")
+
+    assert parser.text == "Pick one "
+
+
+def test_text_stops_at_a_fence_without_delimiter():
+    parser = A2uiStreamParser()
+    parser.feed('Here:\n```json\n[{"a": 1}]')
+
+    assert parser.text == "Here:\n"
+
+
+def test_text_before_the_delimiter_keeps_its_fences():
+    parser = A2uiStreamParser()
+    parser.feed(f"Run ```ls``` first.\n{A2UI_DELIMITER}\n[")
+
+    assert parser.text == "Run ```ls``` first.\n"
+
+
+def test_text_mode_streams_all_the_text():
+    parser = A2uiStreamParser(ui=False)
+    text = f"Zen -- see ```code``` and {A2UI_DELIMITER[:5]}"
+
+    assert _feed(parser, text, 3) == []
+    assert parser.text == text
+    assert not parser.json_started
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        RESPONSE,
+        "Garden ideas -- `soon`",
+        'Here:\n```json\n[{"a": 1}]\n```',
+        f"Run ```ls``` first.\n{A2UI_DELIMITER}\n[]",
+    ],
+)
+def test_streamed_text_is_a_prefix_of_the_response_text(response):
+    parser = A2uiStreamParser()
+    for char in response:
+        parser.feed(char)
+        assert get_response_text(response).startswith(parser.text)
+
+
+def test_get_response_text():
+    assert get_response_text(RESPONSE) == "Here it is.\n"
+    assert get_response_text("Hi\n```json\n[]\n```") == "Hi\n"
+    assert get_response_text("Hi -- there") == "Hi -- there"
+
+
+def test_invalid_element_stops_the_stream():
+    parser = A2uiStreamParser()
+    messages = parser.feed(
+        f"{A2UI_DELIMITER}\n[{json.dumps(MESSAGES[0])}, {{'bad': 1}}, "
+        f"{json.dumps(MESSAGES[1])}]"
+    )
+
+    assert messages == [MESSAGES[0]]
+    assert parser.stopped
+    assert parser.feed("more") == []
+
+
+def test_text_before_the_list_stops_the_stream():
+    parser = A2uiStreamParser()
+
+    assert parser.feed(f"{A2UI_DELIMITER}\nSorry, no UI.") == []
+    assert parser.stopped
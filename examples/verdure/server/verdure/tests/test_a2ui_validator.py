@@ -0,0 +1,109 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+import a2ui_validator_compiled
+import jsonschema
+import pytest
+from a2ui_schema import A2UI_SCHEMA_SHA256
+from a2ui_validator import VALIDATION_MODES, find_invalid_messages, get_a2ui_validator
+from a2ui_validator_codegen import OUTPUT_PATH, check_parity, generate_module
+from ui_examples import UI_TEMPLATES
+
+BASE_URL = "http://localhost:10002"
+
+
+def _cart_messages() -> list:
+    return UI_TEMPLATES["SHOPPING_CART_EXAMPLE"].render(BASE_URL)
+
+
+def _invalid_variants():
+    """Yields (description, response) pairs that every mode must reject."""
+    messages = _cart_messages()
+
+    unknown_message = copy.deepcopy(messages)
+    unknown_message[0] = {"version": "v0.9", "renameSurface": {"surfaceId": "cart"}}
+    yield "unknown message type", unknown_message
+
+    wrong_type = copy.deepcopy(messages)
+    wrong_type[0]["createSurface"]["surfaceId"] = 5
+    yield "surfaceId is not a string", wrong_type
+
+    unknown_component = copy.deepcopy(messages)
+    unknown_component[1]["updateComponents"]["components"][0]["component"] = "Marquee"
+    yield "unknown component", unknown_component
+
+    missing_property = copy.deepcopy(messages)
+    del missing_property[1]["updateComponents"]["components"][2]["text"]
+    yield "Text without text", missing_property
+
+    yield "not a list", messages[0]
+
+
+def test_compiled_module_is_up_to_date():
+    with open(OUTPUT_PATH) as f:
+        assert f.read() == generate_module()
+    assert a2ui_validator_compiled.SCHEMA_SHA256 == A2UI_SCHEMA_SHA256
+
+
+@pytest.mark.parametrize("template_name", list(UI_TEMPLATES))
+def test_compiled_matches_jsonschema(template_name):
+    assert check_parity([template_name]) == []
+
+
+@pytest.mark.parametrize("mode", list(VALIDATION_MODES))
+@pytest.mark.parametrize("template_name", list(UI_TEMPLATES))
+def test_templates_are_valid(mode, template_name):
+    get_a2ui_validator(mode)(UI_TEMPLATES[template_name].render(BASE_URL))
+
+
+@pytest.mark.parametrize("mode", list(VALIDATION_MODES))
+@pytest.mark.parametrize(
+    "response",
+    [response for _, response in _invalid_variants()],
+    ids=[description for description, _ in _invalid_variants()],
+)
+def test_invalid_responses_are_rejected(mode, response):
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        get_a2ui_validator(mode)(response)
+
+
+@pytest.mark.parametrize("mode", list(VALIDATION_MODES))
+def test_subset_rejects_other_components(mode):
+    messages = _cart_messages()
+    used = {
+        component["component"]
+        for component in messages[1]["updateComponents"]["components"]
+    }
+    get_a2ui_validator(mode, frozenset(used))(messages)
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        get_a2ui_validator(mode, frozenset(used - {"Button"}))(messages)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="Unknown A2UI validation mode"):
+        get_a2ui_validator("fast")
+
+
+@pytest.mark.parametrize("mode", list(VALIDATION_MODES))
+def test_find_invalid_messages_points_at_the_message(mode):
+    messages = _cart_messages()
+    messages[1]["updateComponents"]["components"][0]["component"] = "Marquee"
+
+    failures = find_invalid_messages(get_a2ui_validator(mode), messages)
+
+    assert list(failures) == [1]
+    path, _ = failures[1]
+    assert path.startswith("$[1].updateComponents")
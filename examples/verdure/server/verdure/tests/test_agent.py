@@ -0,0 +1,195 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any
+
+from fakes import invalid_ui_response, ui_response
+
+
+async def _run_turn(agent, query: str, session_id: str, delay: float = 0.0) -> dict:
+    """Streams a UI turn and returns its final item."""
+    await asyncio.sleep(delay)
+    final = None
+    async for item in agent.stream(query, session_id, use_ui=True):
+        final = item
+    return final
+
+
+async def _get_history(agent, session_id: str) -> list[tuple[str, str]]:
+    """Returns the author and first line of each event of a session."""
+    session = await agent._runner.session_service.get_session(
+        app_name=agent._agent.name, user_id=agent._user_id, session_id=session_id
+    )
+    return [
+        (event.author, event.content.parts[0].text.splitlines()[0])
+        for event in session.events
+    ]
+
+
+def _get_session_ids(agent) -> list[str]:
+    sessions = agent._runner.session_service.sessions
+    return sorted(sessions.get(agent._agent.name, {}).get(agent._user_id, {}))
+
+
+def _set_script(agent, script: dict[str, list[tuple[str, float]]]) -> Any:
+    agent._agent.model.script = script
+    return agent._agent.model
+
+
+def test_retry_keeps_only_the_valid_exchange(make_agent):
+    agent = make_agent()
+    _set_script(
+        agent,
+        {"query A": [(invalid_ui_response("Bad."), 0.0), (ui_response("Good."), 0.0)]},
+    )
+
+    final = asyncio.run(_run_turn(agent, "query A", "s"))
+
+    assert final["content"].startswith("Good.")
+    assert asyncio.run(_get_history(agent, "s")) == [
+        ("user", "query A"),
+        ("landscape_agent", "Good."),
+    ]
+
+
+def test_failed_turn_is_rolled_back(make_agent):
+    agent = make_agent()
+    _set_script(
+        agent,
+        {
+            "query A": [(ui_response("Good."), 0.0)],
+            "query B": [(invalid_ui_response("Bad."), 0.0)] * 2,
+        },
+    )
+
+    async def run():
+        await _run_turn(agent, "query A", "s")
+        final = await _run_turn(agent, "query B", "s")
+        return final, await _get_history(agent, "s")
+
+    final, history = asyncio.run(run())
+
+    assert "a2ui_response" not in final
+    assert history == [("user", "query A"), ("landscape_agent", "Good.")]
+
+
+def test_concurrent_turns_keep_each_others_events(make_agent):
+    agent = make_agent()
+    _set_script(
+        agent,
+        {
+            # Slow and invalid, so it is rolled back after B is committed.
+            "query A": [(invalid_ui_response("Bad A."), 0.4)] * 2,
+            "query B": [(ui_response("Good B."), 0.05)],
+            # Retried while A and B are running.
+            "query C": [(invalid_ui_response("Bad C."), 0.1), (ui_response("Good C."), 0.3)],
+        },
+    )
+
+    async def run():
+        await asyncio.gather(
+            _run_turn(agent, "query A", "s"),
+            _run_turn(agent, "query B", "s", delay=0.05),
+            _run_turn(agent, "query C", "s", delay=0.05),
+        )
+        return await _get_history(agent, "s")
+
+    history = asyncio.run(run())
+
+    assert sorted(history) == sorted(
+        [
+            ("user", "query B"),
+            ("landscape_agent", "Good B."),
+            ("user", "query C"),
+            ("landscape_agent", "Good C."),
+        ]
+    )
+    # Each exchange stays in order.
+    assert history.index(("user", "query C")) + 1 == history.index(
+        ("landscape_agent", "Good C.")
+    )
+
+
+def test_winning_hedge_replaces_the_first_generation(make_agent):
+    agent = make_agent(A2UI_HEDGE_DELAY="0.1")
+    _set_script(
+        agent,
+        {"query A": [(invalid_ui_response("Slow."), 1.0), (ui_response("Hedge."), 0.1)]},
+    )
+
+    final = asyncio.run(_run_turn(agent, "query A", "s"))
+
+    assert final["content"].startswith("Hedge.")
+    assert asyncio.run(_get_history(agent, "s")) == [
+        ("user", "query A"),
+        ("landscape_agent", "Hedge."),
+    ]
+    # The scratch session of the hedge is deleted.
+    assert _get_session_ids(agent) == ["s"]
+
+
+async def _get_streamed_text(agent, query: str, use_ui: bool) -> tuple[str, dict]:
+    """Streams a turn and returns the text deltas joined, and the final item."""
+    text = ""
+    final = None
+    async for item in agent.stream(query, "s", use_ui=use_ui):
+        if "updates" in item:
+            text += item["updates"]
+        final = item
+    return text, final
+
+
+def test_text_held_back_by_the_parser_is_sent_at_the_end(make_agent):
+    agent = make_agent()
+    reply = "Here is the plan for your garden, with a Zen --"
+    model = _set_script(agent, {"query A": [(reply, 0.0)]})
+    model.chunk_size = 8
+
+    text, final = asyncio.run(_get_streamed_text(agent, "query A", use_ui=False))
+
+    assert text == reply
+    assert final["text_streamed"]
+
+
+def test_ui_text_with_a_code_fence_is_streamed_whole(make_agent):
+    agent = make_agent()
+    intro = "Run ```ls``` first, then pick one -"
+    model = _set_script(agent, {"query A": [(ui_response(intro), 0.0)]})
+    model.chunk_size = 8
+
+    text, final = asyncio.run(_get_streamed_text(agent, "query A", use_ui=True))
+
+    assert text == intro + "\n"
+    assert final["a2ui_response"].text == text
+
+
+def test_streamed_messages_are_validated_once(make_agent):
+    agent = make_agent()
+    model = _set_script(agent, {"query A": [(ui_response("Good."), 0.0)]})
+    model.chunk_size = 50
+    validate = agent._validate_ui_response
+    validated = []
+
+    def count_and_validate(messages):
+        validated.extend(messages)
+        validate(messages)
+
+    agent._validate_ui_response = count_and_validate
+
+    final = asyncio.run(_run_turn(agent, "query A", "s"))
+
+    messages = final["a2ui_response"].messages
+    assert final["streamed_message_count"] == len(messages)
+    assert validated == messages
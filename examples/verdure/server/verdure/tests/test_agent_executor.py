@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import uuid
+
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import (
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from fakes import ui_response
+from status_updates import TEXT_DELTA_METADATA
+
+
+async def _execute(executor, text: str, use_ui: bool) -> list[TaskStatusUpdateEvent]:
+    """Runs a turn and returns its status updates."""
+    message = Message(
+        role=Role.user,
+        parts=[Part(root=TextPart(text=text))],
+        message_id=uuid.uuid4().hex,
+        context_id="s",
+    )
+    context = RequestContext(
+        request=MessageSendParams(message=message),
+        task_id=uuid.uuid4().hex,
+        context_id="s",
+    )
+    queue = EventQueue()
+    await executor.execute(context, queue, use_ui=use_ui)
+    events = []
+    while not queue.queue.empty():
+        events.append(await queue.dequeue_event())
+    return [event for event in events if isinstance(event, TaskStatusUpdateEvent)]
+
+
+def _get_texts(update: TaskStatusUpdateEvent) -> list[tuple[str, bool]]:
+    """Returns each text of an update, and whether it is a delta."""
+    return [
+        (part.root.text, part.root.metadata == TEXT_DELTA_METADATA)
+        for part in update.status.message.parts
+        if isinstance(part.root, TextPart)
+    ]
+
+
+def test_fallback_text_is_not_appended_to_the_ui_text(make_executor):
+    executor = make_executor(
+        A2UI_LATENCY_BUDGET="1.0",
+        A2UI_TEXT_FALLBACK_RESERVE="0.6",
+        A2UI_STATUS_MIN_INTERVAL="0",
+    )
+    model = executor.agent._agent.model
+    model.chunk_size = 8
+    model.script = {
+        "plan my garden": [
+            (ui_response("Let me build a screen for that."), 2.0),
+            ("Here is a plan in words.", 0.0),
+        ]
+    }
+
+    updates = asyncio.run(_execute(executor, "plan my garden", use_ui=True))
+
+    deltas = "".join(
+        text for update in updates for text, is_delta in _get_texts(update) if is_delta
+    )
+    assert deltas == "Here is a plan in words."
+
+
+def test_ui_text_is_sent_whole_while_the_turn_can_fall_back(make_executor):
+    executor = make_executor(A2UI_LATENCY_BUDGET="10", A2UI_TEXT_FALLBACK_RESERVE="5")
+    executor.agent._agent.model.script = {
+        "plan my garden": [(ui_response("Here is your cart."), 0.0)]
+    }
+
+    updates = asyncio.run(_execute(executor, "plan my garden", use_ui=True))
+
+    assert all(
+        not is_delta for update in updates for _, is_delta in _get_texts(update)
+    )
+    assert _get_texts(updates[-1]) == [("Here is your cart.", False)]
+
+
+def test_streamed_text_is_not_sent_again(make_executor):
+    executor = make_executor(A2UI_STATUS_MIN_INTERVAL="0")
+    executor.agent._agent.model.script = {
+        "plan my garden": [(ui_response("Here is your cart."), 0.0)]
+    }
+
+    updates = asyncio.run(_execute(executor, "plan my garden", use_ui=True))
+
+    texts = [text for update in updates for text in _get_texts(update)]
+    assert "".join(text for text, is_delta in texts if is_delta) == (
+        "Here is your cart.\n"
+    )
+    assert ("Here is your cart.", False) not in texts
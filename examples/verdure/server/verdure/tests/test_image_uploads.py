@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import hashlib
+import os
+
+import image_uploads
+import pytest
+from image_uploads import ImageUploadStore
+
+IMAGE = bytes(range(256)) * 1000
+
+
+def _save(store: ImageUploadStore, data: str, mime_type: str = "image/png") -> str:
+    return asyncio.run(store.save(data, mime_type))
+
+
+def _read(store: ImageUploadStore, filename: str) -> bytes:
+    with open(os.path.join(store.directory, filename), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Several chunks per upload, and chunks that end inside 4-character groups
+    # once the line breaks are dropped.
+    monkeypatch.setattr(image_uploads, "_DECODE_CHUNK_SIZE", 1001)
+
+
+def test_image_is_named_by_its_hash(tmp_path):
+    store = ImageUploadStore(str(tmp_path))
+
+    filename = _save(store, base64.b64encode(IMAGE).decode())
+
+    assert filename == f"{hashlib.sha256(IMAGE).hexdigest()}.png"
+    assert _read(store, filename) == IMAGE
+
+
+def test_mime_wrapped_base64_is_accepted(tmp_path):
+    store = ImageUploadStore(str(tmp_path))
+
+    filename = _save(store, base64.encodebytes(IMAGE).decode().replace("\n", "\r\n"))
+
+    assert _read(store, filename) == IMAGE
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        ("iVBO\nR$0K", "Only base64 data"),
+        (base64.b64encode(IMAGE).decode()[:-1], "truncated"),
+    ],
+)
+def test_invalid_base64_is_rejected(tmp_path, data, error):
+    store = ImageUploadStore(str(tmp_path))
+
+    with pytest.raises(ValueError, match=error):
+        _save(store, data)
+    assert os.listdir(tmp_path) == []
+
+
+def test_upload_over_the_size_limit_is_rejected(tmp_path):
+    store = ImageUploadStore(str(tmp_path), max_bytes=len(IMAGE) - 1)
+
+    with pytest.raises(ValueError, match="larger than the limit"):
+        _save(store, base64.b64encode(IMAGE).decode())
+    assert os.listdir(tmp_path) == []
+
+
+def test_same_image_is_stored_once(tmp_path):
+    store = ImageUploadStore(str(tmp_path))
+    data = base64.b64encode(IMAGE).decode()
+
+    assert _save(store, data) == _save(store, data)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+NOW = 1_000_000.0
+
+
+def _add(store: ImageUploadStore, name: str, size: int, last_access: float) -> str:
+    path = os.path.join(store.directory, name)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    os.utime(path, (last_access, last_access))
+    return name
+
+
+def test_collection_deletes_least_recently_used_images(tmp_path):
+    store = ImageUploadStore(
+        str(tmp_path), quota_bytes=250, min_age=60, clock=lambda: NOW
+    )
+    _add(store, "a.png", 100, NOW - 300)
+    _add(store, "b.png", 100, NOW - 100)
+    _add(store, "c.png", 100, NOW - 200)
+
+    assert store.collect_garbage() == 1
+    assert sorted(os.listdir(tmp_path)) == ["b.png", "c.png"]
+
+
+def test_collection_keeps_recently_used_images_over_quota(tmp_path):
+    store = ImageUploadStore(str(tmp_path), quota_bytes=50, min_age=60, clock=lambda: NOW)
+    _add(store, "a.png", 100, NOW - 300)
+    _add(store, "b.png", 100, NOW - 10)
+
+    assert store.collect_garbage() == 1
+    assert os.listdir(tmp_path) == ["b.png"]
+
+
+def test_collection_removes_stale_temporary_files(tmp_path):
+    store = ImageUploadStore(str(tmp_path), min_age=60, clock=lambda: NOW)
+    _add(store, ".stale.tmp", 10, NOW - 300)
+    _add(store, ".writing.tmp", 10, NOW - 10)
+
+    assert store.collect_garbage() == 0
+    assert os.listdir(tmp_path) == [".writing.tmp"]
+
+
+def test_stored_image_is_touched_when_uploaded_again(tmp_path):
+    store = ImageUploadStore(str(tmp_path))
+    data = base64.b64encode(IMAGE).decode()
+    path = os.path.join(tmp_path, _save(store, data))
+    os.utime(path, (NOW, NOW))
+
+    _save(store, data)
+
+    assert os.stat(path).st_mtime > NOW
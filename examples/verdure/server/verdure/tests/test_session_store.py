@@ -0,0 +1,162 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.events import Event
+from google.genai import types
+from session_store import BoundedInMemorySessionService, estimate_event_bytes
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _event(text_bytes: int, image_bytes: int = 0, invocation_id: str = "i") -> Event:
+    parts = [types.Part.from_text(text="x" * text_bytes)]
+    if image_bytes:
+        parts.append(
+            types.Part.from_bytes(data=b"\0" * image_bytes, mime_type="image/png")
+        )
+    return Event(
+        author="user",
+        invocation_id=invocation_id,
+        content=types.Content(role="user", parts=parts),
+    )
+
+
+async def _create(service, session_id: str, *events: Event):
+    session = await service.create_session(
+        app_name="app", user_id="user", session_id=session_id
+    )
+    for event in events:
+        await service.append_event(session, event)
+    return session
+
+
+async def _get(service, session_id: str):
+    return await service.get_session(
+        app_name="app", user_id="user", session_id=session_id
+    )
+
+
+def _session_ids(service) -> list[str]:
+    return sorted(service.sessions.get("app", {}).get("user", {}))
+
+
+def test_event_size_counts_text_and_image_bytes():
+    assert estimate_event_bytes(_event(10, 100)) == 110
+
+
+def test_least_recently_used_session_is_evicted_beyond_the_count():
+    clock = _Clock()
+    service = BoundedInMemorySessionService(max_sessions=2, clock=clock)
+
+    async def run():
+        await _create(service, "s1")
+        clock.now += 1
+        await _create(service, "s2")
+        clock.now += 1
+        await _get(service, "s1")
+        clock.now += 1
+        await _create(service, "s3")
+
+    asyncio.run(run())
+
+    assert _session_ids(service) == ["s1", "s3"]
+    assert service.get_stats()["evictions"] == {"count": 1}
+
+
+def test_sessions_are_evicted_beyond_the_byte_budget():
+    clock = _Clock()
+    service = BoundedInMemorySessionService(max_bytes=1000, clock=clock)
+
+    async def run():
+        await _create(service, "s1", _event(400))
+        clock.now += 1
+        await _create(service, "s2", _event(400))
+        clock.now += 1
+        await _create(service, "s3", _event(10, 500))
+
+    asyncio.run(run())
+
+    assert _session_ids(service) == ["s2", "s3"]
+    assert service.get_stats() == {
+        "sessions": 2,
+        "bytes": 910,
+        "evictions": {"bytes": 1},
+    }
+
+
+def test_idle_sessions_expire():
+    clock = _Clock()
+    service = BoundedInMemorySessionService(idle_ttl=100, clock=clock)
+
+    async def run():
+        await _create(service, "s1", _event(10))
+        clock.now += 101
+        return await _get(service, "s1")
+
+    assert asyncio.run(run()) is None
+    assert service.get_stats() == {
+        "sessions": 0,
+        "bytes": 0,
+        "evictions": {"ttl": 1},
+    }
+
+
+def test_held_and_scratch_sessions_are_not_evicted():
+    clock = _Clock()
+    service = BoundedInMemorySessionService(max_sessions=1, idle_ttl=100, clock=clock)
+
+    async def run():
+        with service.hold(app_name="app", user_id="user", session_id="held"):
+            await _create(service, "held")
+            await _create(service, "held:scratch:1")
+            clock.now += 1
+            await _create(service, "s1")
+            clock.now += 200
+            await _get(service, "s1")
+            held_ids = _session_ids(service)
+        await _get(service, "s1")
+        return held_ids
+
+    assert asyncio.run(run()) == ["held", "held:scratch:1"]
+    assert _session_ids(service) == ["held:scratch:1"]
+
+
+def test_delete_invocations_keeps_other_events_and_updates_the_size():
+    service = BoundedInMemorySessionService()
+
+    async def run():
+        await _create(
+            service,
+            "s1",
+            _event(10, invocation_id="a"),
+            _event(20, invocation_id="b"),
+            _event(30, invocation_id="a"),
+        )
+        await service.delete_invocations(
+            app_name="app", user_id="user", session_id="s1", invocation_ids={"a"}
+        )
+        return await _get(service, "s1")
+
+    session = asyncio.run(run())
+
+    assert [event.invocation_id for event in session.events] == ["b"]
+    assert service.get_stats()["bytes"] == 20
@@ -0,0 +1,185 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+from a2a.types import Task, TaskState, TaskStatus
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event, EventActions
+from google.genai import types
+from sqlite_store import SqliteDatabase, SqliteSessionService, SqliteTaskStore
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    return str(tmp_path / "verdure.db")
+
+
+def _event(text: str, invocation_id: str = "i", **state_delta) -> Event:
+    return Event(
+        author="user",
+        invocation_id=invocation_id,
+        content=types.Content(role="user", parts=[types.Part.from_text(text=text)]),
+        actions=EventActions(state_delta=state_delta),
+    )
+
+
+def _texts(session) -> list[str]:
+    return [event.content.parts[0].text for event in session.events]
+
+
+def test_session_round_trip(database_path):
+    service = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        session = await service.create_session(
+            app_name="app",
+            user_id="user",
+            session_id="s1",
+            state={"mode": "ui", "user:name": "Ada", "app:theme": "green"},
+        )
+        await service.append_event(session, _event("hello", mode="text"))
+        await service.append_event(session, _event("again"))
+        return await service.get_session(app_name="app", user_id="user", session_id="s1")
+
+    session = asyncio.run(run())
+
+    assert _texts(session) == ["hello", "again"]
+    assert session.state == {"mode": "text", "user:name": "Ada", "app:theme": "green"}
+
+
+def test_state_keys_are_replaced_whole(database_path):
+    service = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        session = await service.create_session(
+            app_name="app", user_id="user", session_id="s1", state={"obj": {"a": 1}}
+        )
+        await service.append_event(session, _event("x", obj={"b": 2}, n=None))
+        return await service.get_session(app_name="app", user_id="user", session_id="s1")
+
+    assert asyncio.run(run()).state == {"obj": {"b": 2}, "n": None}
+
+
+def test_processes_share_sessions(database_path):
+    # Each server process opens its own SqliteDatabase on the same file.
+    first = SqliteSessionService(SqliteDatabase(database_path))
+    second = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        session = await first.create_session(
+            app_name="app", user_id="user", session_id="s1"
+        )
+        await first.append_event(session, _event("from the first"))
+        session = await second.get_session(
+            app_name="app", user_id="user", session_id="s1"
+        )
+        await second.append_event(session, _event("from the second"))
+        with pytest.raises(AlreadyExistsError):
+            await second.create_session(app_name="app", user_id="user", session_id="s1")
+        return await first.get_session(app_name="app", user_id="user", session_id="s1")
+
+    assert _texts(asyncio.run(run())) == ["from the first", "from the second"]
+
+
+def test_scratch_sessions_stay_in_memory(database_path):
+    service = SqliteSessionService(SqliteDatabase(database_path))
+    other = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        session = await service.create_session(
+            app_name="app", user_id="user", session_id="s1:scratch:1"
+        )
+        await service.append_event(session, _event("draft"))
+        return (
+            await service.get_session(
+                app_name="app", user_id="user", session_id="s1:scratch:1"
+            ),
+            await other.get_session(
+                app_name="app", user_id="user", session_id="s1:scratch:1"
+            ),
+        )
+
+    session, other_session = asyncio.run(run())
+
+    assert _texts(session) == ["draft"]
+    assert other_session is None
+
+
+def test_delete_invocations_keeps_other_events(database_path):
+    service = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        session = await service.create_session(
+            app_name="app", user_id="user", session_id="s1"
+        )
+        for text, invocation_id in [("a1", "a"), ("b1", "b"), ("a2", "a")]:
+            await service.append_event(session, _event(text, invocation_id))
+        await service.delete_invocations(
+            app_name="app", user_id="user", session_id="s1", invocation_ids={"a"}
+        )
+        await service.append_event(session, _event("c1", "c"))
+        return await service.get_session(app_name="app", user_id="user", session_id="s1")
+
+    assert _texts(asyncio.run(run())) == ["b1", "c1"]
+
+
+def test_list_and_delete_sessions(database_path):
+    service = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        for session_id in ["s1", "s2"]:
+            await service.create_session(
+                app_name="app", user_id="user", session_id=session_id
+            )
+        await service.delete_session(app_name="app", user_id="user", session_id="s1")
+        response = await service.list_sessions(app_name="app", user_id="user")
+        return [session.id for session in response.sessions]
+
+    assert asyncio.run(run()) == ["s2"]
+
+
+def test_task_store_round_trip(database_path):
+    store = SqliteTaskStore(SqliteDatabase(database_path))
+    task = Task(id="t1", context_id="s1", status=TaskStatus(state=TaskState.working))
+
+    async def run():
+        await store.save(task)
+        await store.save(
+            task.model_copy(update={"status": TaskStatus(state=TaskState.completed)})
+        )
+        saved = await store.get("t1")
+        await store.delete("t1")
+        return saved, await store.get("t1")
+
+    saved, deleted = asyncio.run(run())
+
+    assert saved.status.state == TaskState.completed
+    assert deleted is None
+
+
+def test_concurrent_writes_are_committed(database_path):
+    service = SqliteSessionService(SqliteDatabase(database_path))
+
+    async def run():
+        session = await service.create_session(
+            app_name="app", user_id="user", session_id="s1"
+        )
+        await asyncio.gather(
+            *[service.append_event(session, _event(str(i))) for i in range(50)]
+        )
+        return await service.get_session(app_name="app", user_id="user", session_id="s1")
+
+    assert sorted(_texts(asyncio.run(run())), key=int) == [str(i) for i in range(50)]
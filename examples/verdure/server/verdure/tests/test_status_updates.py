@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from status_updates import TEXT_DELTA_METADATA, StatusUpdateCoalescer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _texts(parts) -> list[tuple[str, bool]]:
+    return [(p.text, p.metadata == TEXT_DELTA_METADATA) for p in parts]
+
+
+def test_status_is_sent_right_away_unless_repeated():
+    coalescer = StatusUpdateCoalescer(clock=FakeClock())
+
+    assert _texts(coalescer.add_status("Thinking...")) == [("Thinking...", False)]
+    assert coalescer.add_status("Thinking...") == []
+    assert _texts(coalescer.add_status("Searching...")) == [("Searching...", False)]
+
+
+def test_text_is_sent_at_most_once_per_interval():
+    clock = FakeClock()
+    coalescer = StatusUpdateCoalescer(min_interval=0.25, clock=clock)
+
+    assert _texts(coalescer.add_text("Hello")) == [("Hello", True)]
+    clock.now = 0.1
+    assert coalescer.add_text(", ") == []
+    clock.now = 0.2
+    assert coalescer.add_text("wide\n") == []
+    clock.now = 0.3
+    assert _texts(coalescer.add_text("world")) == [(", wide\nworld", True)]
+
+
+def test_pending_text_goes_before_the_next_status():
+    clock = FakeClock()
+    coalescer = StatusUpdateCoalescer(clock=clock)
+    coalescer.add_text("Let me look.")
+    coalescer.add_text(" One moment.")
+
+    assert _texts(coalescer.add_status("Searching...")) == [
+        (" One moment.", True),
+        ("Searching...", False),
+    ]
+    # The status restarts the interval.
+    assert coalescer.add_text("Found it.") == []
+
+
+def test_flush_returns_the_pending_text():
+    coalescer = StatusUpdateCoalescer(clock=FakeClock())
+    coalescer.add_text("Here")
+    coalescer.add_text(" it is.")
+
+    assert _texts(coalescer.flush()) == [(" it is.", True)]
+    assert coalescer.flush() == []
+
+
+def test_delta_metadata_is_not_shared():
+    coalescer = StatusUpdateCoalescer(clock=FakeClock())
+
+    coalescer.add_text("Hi")[0].metadata["extra"] = True
+
+    assert TEXT_DELTA_METADATA == {"a2uiTextDelta": True}
@@ -14,6 +14,18 @@
 
 # This file serves as the single source of truth for all A2UI example templates.
 # It is imported by agent.py to be passed to the prompt builder.
+#
+# LANDSCAPE_UI_EXAMPLES is parsed once at import into UI_TEMPLATES, an index of
+# template name -> UITemplate, so individual templates can be picked, rendered or
+# serialized without re-scanning and re-formatting the whole string.
+
+import copy
+import dataclasses
+import functools
+import json
+import re
+from collections.abc import Callable
+from typing import Any
 
 LANDSCAPE_UI_EXAMPLES = """
 ---BEGIN WELCOME_SCREEN_EXAMPLE---
@@ -285,3 +297,146 @@ LANDSCAPE_UI_EXAMPLES = """
 ---END ORDER_CONFIRMATION_EXAMPLE---
 """
 
+
+# Marks where the base URL goes in a template.
+BASE_URL_SLOT = "{base_url}"
+
+_TEMPLATE_PATTERN = re.compile(r"---BEGIN (\w+)---\n(.*?)\n---END \1---", re.S)
+
+
+@dataclasses.dataclass(frozen=True)
+class UITemplate:
+    """A parsed A2UI example template."""
+
+    name: str
+    # The template as written in LANDSCAPE_UI_EXAMPLES, with BASE_URL_SLOT slots.
+    source: str
+    # The parsed A2UI messages, with BASE_URL_SLOT slots.
+    messages: list[dict[str, Any]]
+    # Paths to the strings in `messages` that contain a BASE_URL_SLOT slot.
+    slots: tuple[tuple[str | int, ...], ...]
+    # The catalog components the template uses.
+    components: frozenset[str]
+
+    def render(
+        self, base_url: str, data: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Returns a copy of the template's A2UI messages for a base URL.
+
+        Args:
+            base_url: The base URL for resolving static assets like logos.
+            data: Values that replace the keys of the same name in the value of
+                the template's `updateDataModel` messages.
+        """
+        messages = copy.deepcopy(self.messages)
+        for path in self.slots:
+            parent = messages
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = parent[path[-1]].replace(BASE_URL_SLOT, base_url)
+        if data:
+            for message in messages:
+                if "updateDataModel" in message:
+                    message["updateDataModel"]["value"].update(data)
+        return messages
+
+    def render_source(self, base_url: str) -> str:
+        """Renders the template as it appears in the prompt, between its markers."""
+        return (
+            f"---BEGIN {self.name}---\n"
+            f"{self.source.replace(BASE_URL_SLOT, base_url)}\n"
+            f"---END {self.name}---"
+        )
+
+
+def _find_slots(value: Any, path: tuple = ()):
+    if isinstance(value, str):
+        if BASE_URL_SLOT in value:
+            yield path
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _find_slots(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _find_slots(item, path + (index,))
+
+
+def parse_ui_examples(examples: str) -> dict[str, UITemplate]:
+    """
+    Parses a brace-escaped examples string into a template index.
+
+    Args:
+        examples: Templates between `---BEGIN X---` and `---END X---` markers, as in
+            LANDSCAPE_UI_EXAMPLES.
+
+    Returns:
+        Template name -> UITemplate, in the order of `examples`.
+
+    Raises:
+        ValueError: If a template is not valid JSON.
+    """
+    templates = {}
+    unescaped = examples.format(base_url=BASE_URL_SLOT)
+    for name, source in _TEMPLATE_PATTERN.findall(unescaped):
+        try:
+            messages = json.loads(source)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"UI template {name} is not valid JSON: {e}") from e
+        templates[name] = UITemplate(
+            name=name,
+            source=source,
+            messages=messages,
+            slots=tuple(_find_slots(messages)),
+            components=frozenset(
+                component["component"]
+                for message in messages
+                for component in message.get("updateComponents", {}).get(
+                    "components", []
+                )
+            ),
+        )
+    return templates
+
+
+def render_ui_examples(
+    base_url: str,
+    names: list[str] | None = None,
+    templates: dict[str, UITemplate] | None = None,
+) -> str:
+    """
+    Renders templates for the prompt.
+
+    With every template, the result is the same as
+    `LANDSCAPE_UI_EXAMPLES.format(base_url=base_url)`.
+
+    Args:
+        base_url: The base URL for resolving static assets like logos.
+        names: The templates to render, or None for all of them.
+        templates: The template index. Defaults to UI_TEMPLATES.
+    """
+    templates = UI_TEMPLATES if templates is None else templates
+    names = list(templates) if names is None else names
+    rendered = "\n\n".join(templates[name].render_source(base_url) for name in names)
+    return f"\n{rendered}\n"
+
+
+@functools.cache
+def validate_ui_templates(validate: Callable[[Any], None]) -> None:
+    """
+    Validates every template in UI_TEMPLATES, once per validation function.
+
+    Args:
+        validate: An A2UI validation function, see `a2ui_validator.get_a2ui_validator`.
+
+    Raises:
+        ValueError: If a template does not validate.
+    """
+    for template in UI_TEMPLATES.values():
+        try:
+            validate(template.render("http://localhost"))
+        except Exception as e:
+            raise ValueError(f"UI template {template.name} is invalid: {e}") from e
+
+
+UI_TEMPLATES = parse_ui_examples(LANDSCAPE_UI_EXAMPLES)
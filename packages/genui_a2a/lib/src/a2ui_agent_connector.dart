@@ -19,6 +19,12 @@ final Uri a2uiExtensionUri = Uri.parse(
   'https://a2ui.org/a2a-extension/a2ui/v0.9',
 );
 
+/// The metadata key that marks a [TextPart] as a delta of the streamed text.
+///
+/// An agent that streams its text in deltas marks each of them with this key,
+/// set to true, and leaves the text already streamed out of its final response.
+const String a2uiTextDeltaKey = 'a2uiTextDelta';
+
 final Logger _log = genui.genUiLogger;
 
 /// Connects to an A2UI Agent endpoint and streams the A2UI protocol lines.
@@ -170,6 +176,8 @@ class A2uiAgentConnector {
     final Stream<Event> events = client.messageStream(messageToSend);
 
     String? responseText;
+    // The text streamed as deltas, which the final response may leave out.
+    final streamedText = StringBuffer();
     try {
       Message? finalResponse;
       await for (final event in events) {
@@ -206,10 +214,7 @@ class A2uiAgentConnector {
               if (part is DataPart) {
                 _processA2uiMessages(part.data);
               } else if (part is TextPart) {
-                final String trimmedText = part.text.trim();
-                if (trimmedText.isNotEmpty && !_textController.isClosed) {
-                  _textController.add(trimmedText);
-                }
+                _processTextPart(part, streamedText);
               }
             }
           }
@@ -242,10 +247,7 @@ class A2uiAgentConnector {
               if (part is DataPart) {
                 _processA2uiMessages(part.data);
               } else if (part is TextPart) {
-                final String trimmedText = part.text.trim();
-                if (trimmedText.isNotEmpty && !_textController.isClosed) {
-                  _textController.add(trimmedText);
-                }
+                _processTextPart(part, streamedText);
               }
             }
           }
@@ -253,11 +255,14 @@ class A2uiAgentConnector {
       }
       if (finalResponse != null) {
         for (final Part part in finalResponse.parts) {
-          if (part is TextPart) {
+          if (part is TextPart && !_isTextDelta(part)) {
             responseText = part.text;
           }
         }
       }
+      if (responseText == null && streamedText.isNotEmpty) {
+        responseText = streamedText.toString().trim();
+      }
     } on FormatException catch (exception, stackTrace) {
       _log.severe(
         'Error parsing A2A response: $exception',
@@ -315,6 +320,26 @@ class A2uiAgentConnector {
     }
   }
 
+  /// Whether [part] continues the text streamed before it, rather than being a
+  /// complete text such as a status.
+  bool _isTextDelta(TextPart part) => part.metadata?[a2uiTextDeltaKey] == true;
+
+  void _processTextPart(TextPart part, StringBuffer streamedText) {
+    if (_isTextDelta(part)) {
+      // Deltas are appended as they are, since their spaces and line breaks
+      // separate them from the text before and after.
+      streamedText.write(part.text);
+      if (part.text.isNotEmpty && !_textController.isClosed) {
+        _textController.add(part.text);
+      }
+      return;
+    }
+    final String trimmedText = part.text.trim();
+    if (trimmedText.isNotEmpty && !_textController.isClosed) {
+      _textController.add(trimmedText);
+    }
+  }
+
   void _processA2uiMessages(Map<String, Object?> data) {
     var prettyJson = '(Error sanitizing log data)';
     try {
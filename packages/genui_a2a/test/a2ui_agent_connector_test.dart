@@ -127,6 +127,60 @@ void main() {
       expect(messages.first, isA<genui.UpdateComponents>());
     });
 
+    test('connectAndSend appends streamed text deltas as they are', () async {
+      a2a.Event textEvent(
+        String text, {
+        bool delta = false,
+        a2a.TaskState state = a2a.TaskState.working,
+      }) => a2a.Event.taskStatusUpdate(
+        taskId: 'task1',
+        contextId: 'context1',
+        status: a2a.TaskStatus(
+          state: state,
+          message: a2a.Message(
+            messageId: 'msg-$text',
+            role: a2a.Role.agent,
+            parts: [
+              a2a.Part.text(
+                text: text,
+                metadata: delta ? {a2uiTextDeltaKey: true} : null,
+              ),
+            ],
+          ),
+        ),
+        final_: false,
+      );
+      final responses = <a2a.Event>[
+        textEvent('Here are ', delta: true),
+        textEvent('some ideas.\n', delta: true),
+        textEvent('  Checking the screen...  '),
+        const a2a.Event.taskStatusUpdate(
+          taskId: 'task1',
+          contextId: 'context1',
+          status: a2a.TaskStatus(
+            state: a2a.TaskState.inputRequired,
+            message: a2a.Message(
+              messageId: 'msg-final',
+              role: a2a.Role.agent,
+              parts: [],
+            ),
+          ),
+          final_: false,
+        ),
+      ];
+      fakeClient.messageStreamHandler = (_) => Stream.fromIterable(responses);
+
+      final texts = <String>[];
+      connector.textStream.listen(texts.add);
+
+      final String? responseText = await connector.connectAndSend(
+        genui.ChatMessage.user('Hi'),
+      );
+
+      expect(texts, ['Here are ', 'some ideas.\n', 'Checking the screen...']);
+      expect(responseText, 'Here are some ideas.');
+    });
+
     test('connectAndSend sends multiple text parts', () async {
       final responses = <a2a.Event>[
         const a2a.Event.taskStatusUpdate(